@@ -0,0 +1,182 @@
+"""
+Benchmark headless de modelos salvos
+
+Cada modelo joga o mesmo conjunto fixo de percursos (semente por percurso,
+que também fixa a posição inicial do porquinho), então os resultados são
+comparáveis entre modelos e entre execuções. Cada modelo joga com a
+configuração gravada nele (física e percurso do treino). Os modelos são
+avaliados em paralelo, um por processo.
+"""
+import os
+import csv
+import json
+import time
+import pickle
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from game.config import *
+from game.engine import GameEngine
+from game.settings import GameConfig
+from ai.neural_network import load_brain
+from ai.population import Population, Agent
+from ai.simulation import run_generation
+
+
+# Semente do primeiro percurso do conjunto padrão
+BENCHMARK_SEED = 1000
+
+LEADERBOARD_COLUMNS = ('rank', 'model', 'mean', 'p10', 'max', 'ticks_per_second',
+                       'training_fitness', 'courses')
+
+
+def benchmark_seeds(courses, base_seed=BENCHMARK_SEED):
+    """Sementes do conjunto de percursos (sempre as mesmas para o mesmo tamanho)"""
+    return [base_seed + i for i in range(courses)]
+
+
+def is_model_data(data):
+    """Arquivo é um modelo jogável (e não um checkpoint de população)?"""
+    return isinstance(data, dict) and ('weights' in data or 'topology' in data)
+
+
+def find_models(directories):
+    """
+    Arquivos .pkl de modelos nas pastas (não recursivo)
+    retorna: caminhos em ordem alfabética
+    """
+    paths = []
+    for directory in directories:
+        if not os.path.isdir(directory):
+            continue
+        for name in sorted(os.listdir(directory)):
+            if name.endswith('.pkl'):
+                paths.append(os.path.join(directory, name))
+    return paths
+
+
+def play_course(brain, seed, max_ticks, config=None):
+    """
+    Uma partida do benchmark
+    config: GameConfig com que o modelo foi treinado (padrão: jogo original)
+    retorna: score (ticks sobrevividos)
+    """
+    population = Population(0, brain.input_size, brain.hidden_size, brain.output_size,
+                            dtype=brain.dtype, feature_set=brain.feature_set,
+                            config=config)
+    population.agents.append(Agent(brain, config))
+
+    # A posição x inicial também sai da semente do percurso
+    return run_generation(population, max_ticks, GameEngine(seed, config=config),
+                          rng=np.random.RandomState(seed))
+
+
+def benchmark_model(path, seeds, max_ticks):
+    """
+    Avalia um modelo em todos os percursos (executa no pool)
+    retorna: dicionário com os scores, ou com o erro se o modelo não pôde jogar
+    """
+    result = {'model': path, 'scores': [], 'training_fitness': None,
+              'elapsed': 0.0, 'error': None}
+    try:
+        with open(path, 'rb') as f:
+            model_data = pickle.load(f)
+        if not is_model_data(model_data):
+            raise ValueError("não é um modelo (checkpoint de população?)")
+
+        result['training_fitness'] = model_data.get('fitness')
+        brain = load_brain(model_data)
+        config = GameConfig.from_dict(model_data.get('config'))
+
+        start = time.perf_counter()
+        result['scores'] = [play_course(brain, seed, max_ticks, config) for seed in seeds]
+        result['elapsed'] = time.perf_counter() - start
+    except (ValueError, KeyError, pickle.UnpicklingError, EOFError) as e:
+        result['error'] = str(e)
+    return result
+
+
+def summarize(result):
+    """Estatísticas de uma linha do leaderboard"""
+    scores = np.asarray(result['scores'], dtype=float)
+    return {
+        'model': result['model'],
+        'mean': float(scores.mean()),
+        'p10': float(np.percentile(scores, 10)),
+        'max': float(scores.max()),
+        'ticks_per_second': float(scores.sum() / max(result['elapsed'], 1e-9)),
+        'training_fitness': result['training_fitness'],
+        'courses': len(scores),
+    }
+
+
+def build_leaderboard(results):
+    """Ordena por score médio (desempate pelo p10: o pior caso importa)"""
+    rows = [summarize(result) for result in results if not result['error']]
+    rows.sort(key=lambda row: (row['mean'], row['p10']), reverse=True)
+    for rank, row in enumerate(rows, 1):
+        row['rank'] = rank
+    return rows
+
+
+def run_benchmark(paths, courses=20, max_ticks=HEADLESS_MAX_TICKS,
+                  base_seed=BENCHMARK_SEED, workers=None):
+    """
+    Avalia vários modelos no mesmo conjunto de percursos
+    workers: processos em paralelo (padrão: um por núcleo)
+    retorna: (leaderboard, modelos ignorados [(caminho, erro)])
+    """
+    seeds = benchmark_seeds(courses, base_seed)
+    workers = min(workers or os.cpu_count() or 1, max(1, len(paths)))
+
+    print(f"\n📊 Benchmark: {len(paths)} modelos x {courses} percursos "
+          f"(sementes {seeds[0]}..{seeds[-1]}, até {max_ticks} ticks)")
+
+    results = []
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(benchmark_model, path, seeds, max_ticks)
+                       for path in paths]
+            for future in as_completed(futures):
+                results.append(future.result())
+                _print_progress(results[-1], len(results), len(paths))
+    else:
+        for path in paths:
+            results.append(benchmark_model(path, seeds, max_ticks))
+            _print_progress(results[-1], len(results), len(paths))
+
+    skipped = [(result['model'], result['error']) for result in results if result['error']]
+    return build_leaderboard(results), skipped
+
+
+def _print_progress(result, done, total):
+    if result['error']:
+        print(f"   [{done}/{total}] ⚠ {result['model']}: {result['error']}")
+    else:
+        print(f"   [{done}/{total}] {result['model']}: "
+              f"média {np.mean(result['scores']):.0f}")
+
+
+def print_leaderboard(rows):
+    """Tabela no terminal"""
+    print(f"\n🏆 Leaderboard")
+    print(f"{'#':>3}  {'modelo':<45} {'média':>8} {'p10':>8} {'máx':>8} "
+          f"{'ticks/s':>9} {'treino':>8}")
+    for row in rows:
+        training = row['training_fitness']
+        training = f"{training:.0f}" if training is not None else "-"
+        print(f"{row['rank']:>3}  {row['model']:<45} {row['mean']:>8.0f} "
+              f"{row['p10']:>8.0f} {row['max']:>8.0f} "
+              f"{row['ticks_per_second']:>9.0f} {training:>8}")
+
+
+def save_leaderboard(rows, path):
+    """Salva o leaderboard em CSV ou JSON (pela extensão)"""
+    if path.endswith('.json'):
+        with open(path, 'w') as f:
+            json.dump(rows, f, indent=2)
+        return
+
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=LEADERBOARD_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
@@ -0,0 +1,82 @@
+"""
+Currículo de dificuldade: o percurso de cada geração depende da anterior
+
+No começo do treino os porquinhos morrem no primeiro obstáculo; no fim, os
+campeões jogam dezenas de milhares de ticks e cada geração custa muito mais.
+O escalonador facilita o percurso enquanto a população não passa dos
+primeiros obstáculos e endurece quando uma geração dura mais que o alvo,
+mantendo o custo das gerações equilibrado.
+"""
+from dataclasses import replace
+from game.config import *
+from game.course import DEFAULT_COURSE
+
+
+# Nível do jogo original (o currículo começa nele)
+ORIGINAL_LEVEL = 1
+
+# Nível mais difícil (aceleração 2^(nível-1) vezes a original)
+MAX_LEVEL = 5
+
+# Duração-alvo de uma geração em ticks: acima disso o percurso endurece
+CURRICULUM_TARGET_TICKS = 5000
+
+# Gerações mais curtas que esta fração do alvo deixam o percurso mais fácil
+CURRICULUM_EASE_RATIO = 0.1
+
+
+def course_for_level(level, base=DEFAULT_COURSE):
+    """
+    Percurso de um nível do currículo, a partir do percurso base
+    0: cactos fixos (CACTUS_TYPES), obstáculos mais espaçados e metade da aceleração
+    1: o próprio percurso base (padrão: jogo original)
+    2+: obstáculos mais próximos (OBSTACLE_MIN_GAP..OBSTACLE_MAX_GAP) e a
+        aceleração dobrando a cada nível
+    """
+    if level <= 0:
+        return replace(base, speed_increment=base.speed_increment / 2,
+                       min_gap=OBSTACLE_MAX_GAP, max_gap=OBSTACLE_MAX_GAP + 200,
+                       cactus_types=CACTUS_TYPES)
+    if level == ORIGINAL_LEVEL:
+        return base
+    return replace(base, speed_increment=base.speed_increment * 2 ** (level - 1),
+                   min_gap=OBSTACLE_MIN_GAP, max_gap=OBSTACLE_MAX_GAP)
+
+
+class CurriculumScheduler:
+    """Escolhe o nível do percurso a cada geração pela duração da anterior"""
+
+    def __init__(self, target_ticks=CURRICULUM_TARGET_TICKS, level=ORIGINAL_LEVEL,
+                 min_level=0, max_level=MAX_LEVEL, config=None):
+        """
+        target_ticks: duração desejada de uma geração (custo por geração)
+        level: nível da primeira geração
+        min_level/max_level: faixa de níveis permitida
+        config: GameConfig cujo percurso é o nível original (padrão: jogo original)
+        """
+        self.base_course = DEFAULT_COURSE if config is None else config.course
+        self.target_ticks = target_ticks
+        self.min_level = min_level
+        self.max_level = max_level
+        self.level = max(min_level, min(level, max_level))
+        # (nível, ticks) de cada geração registrada
+        self.history = []
+
+    @property
+    def course(self):
+        """Percurso da próxima geração"""
+        return course_for_level(self.level, self.base_course)
+
+    def update(self, ticks):
+        """
+        Registra uma geração e escolhe o nível da próxima
+        ticks: duração da geração (até o último porquinho morrer)
+        retorna: nível da próxima geração
+        """
+        self.history.append((self.level, ticks))
+
+        if ticks >= self.target_ticks:
+            self.level = min(self.level + 1, self.max_level)
+        elif ticks < self.target_ticks * CURRICULUM_EASE_RATIO:
+            self.level = max(self.level - 1, self.min_level)
+        return self.level
@@ -0,0 +1,90 @@
+"""Métricas de diversidade da população (genética e comportamental)"""
+import numpy as np
+
+
+# Variância média por gene que consideramos diversidade máxima (1.0)
+MAX_GENE_VARIANCE = 0.5
+
+# Agentes por bloco na passada da diversidade genética
+DIVERSITY_CHUNK_SIZE = 4096
+
+
+def genetic_diversity(genomes, chunk_size=DIVERSITY_CHUNK_SIZE):
+    """
+    Diversidade genética de uma matriz de genomas (agentes, genes)
+    Percorre a matriz em blocos de linhas (ver streaming_genetic_diversity)
+    retorna: valor normalizado em [0, 1]
+    """
+    return streaming_genetic_diversity(genomes[start:start + chunk_size]
+                                       for start in range(0, len(genomes), chunk_size))
+
+
+def streaming_genetic_diversity(chunks):
+    """
+    Diversidade genética sobre a população INTEIRA
+    Variância média dos genes, calculada em uma única passada por blocos
+    de agentes (combinação de Chan/Welford): só um bloco fica na memória
+    chunks: blocos (agentes, genes), ex: Population.genome_chunks
+    retorna: valor normalizado em [0, 1]
+    """
+    count = 0
+    mean = None
+    m2 = None
+
+    for chunk in chunks:
+        chunk = np.asarray(chunk, dtype=np.float64)
+        n = len(chunk)
+        if n == 0:
+            continue
+        chunk_mean = chunk.mean(axis=0)
+        chunk_m2 = ((chunk - chunk_mean) ** 2).sum(axis=0)
+
+        if mean is None:
+            count, mean, m2 = n, chunk_mean, chunk_m2
+            continue
+
+        # Combina as estatísticas do bloco com as acumuladas
+        total = count + n
+        delta = chunk_mean - mean
+        mean = mean + delta * (n / total)
+        m2 = m2 + chunk_m2 + delta ** 2 * (count * n / total)
+        count = total
+
+    if count < 2:
+        return 1.0
+
+    variance = (m2 / count).mean()
+    return min(1.0, variance / MAX_GENE_VARIANCE)
+
+
+def behavioral_diversity(action_traces, num_actions=3):
+    """
+    Diversidade comportamental a partir das ações de cada agente
+    Para cada tick, mede a entropia da distribuição de ações entre os
+    agentes ainda vivos; a média (ponderada pelos vivos) é normalizada
+    action_traces: lista de sequências de ações (0 = em pé, 1 = pular, 2 = abaixar)
+    retorna: valor em [0, 1] (0 = todos agem igual)
+    """
+    traces = [np.asarray(trace, dtype=np.int64) for trace in action_traces if len(trace)]
+    if len(traces) < 2:
+        return 1.0
+
+    # Um único bincount sobre (tick, ação) de todos os agentes
+    codes = np.concatenate([np.arange(len(trace)) * num_actions + trace
+                            for trace in traces])
+    longest = max(len(trace) for trace in traces)
+    counts = np.bincount(codes, minlength=longest * num_actions)
+    counts = counts.reshape(longest, num_actions).astype(np.float64)
+
+    alive = counts.sum(axis=1)
+    probabilities = counts / alive[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        entropy = -np.where(probabilities > 0,
+                            probabilities * np.log(probabilities), 0.0).sum(axis=1)
+
+    # Ticks com um único agente vivo não dizem nada sobre diversidade
+    weights = np.where(alive > 1, alive, 0.0)
+    if weights.sum() == 0:
+        return 0.0
+
+    return float((entropy * weights).sum() / weights.sum() / np.log(num_actions))
@@ -0,0 +1,228 @@
+"""
+Estratégias evolutivas (OpenAI-ES)
+
+Um único genoma médio é perturbado por ruído gaussiano antitético
+(+ε e -ε), todas as perturbações são avaliadas em paralelo e a média
+anda na direção estimada do gradiente do fitness, com pesos por ranking.
+Usa o mesmo layout de genoma da NeuralNetwork.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from game.config import *
+from game.engine import GameEngine
+from ai.neural_network import (NeuralNetwork, TRAINING_DTYPE, describe_spec,
+                               make_spec, normalize_layers)
+from ai.population import Population
+from ai.simulation import run_generation
+
+
+def centered_ranks(fitnesses):
+    """
+    Fitness → ranking centrado em [-0.5, 0.5]
+    Insensível à escala do fitness e a partidas excepcionais
+    Empates recebem o ranking médio (não empurram a média para lado nenhum)
+    """
+    fitnesses = np.asarray(fitnesses)
+    ranks = np.empty(len(fitnesses))
+    ranks[np.argsort(fitnesses, kind='stable')] = np.arange(len(fitnesses))
+
+    _, groups = np.unique(fitnesses, return_inverse=True)
+    ranks = (np.bincount(groups, weights=ranks) / np.bincount(groups))[groups]
+    return ranks / max(1, len(fitnesses) - 1) - 0.5
+
+
+def _evaluate_chunk(genomes, spec, dtype, max_ticks, course_seed, config=None):
+    """
+    Avalia um bloco de genomas na mesma partida (executa no pool)
+    course_seed: semente do percurso, igual para todos os blocos da geração
+    config: GameConfig da partida (padrão: jogo original)
+    """
+    population = Population(0, spec['input_size'], spec['hidden_size'],
+                            spec['output_size'], dtype, layers=spec['layers'],
+                            recurrent=spec['recurrent'], feature_set=spec['feature_set'],
+                            config=config)
+    population.set_genome_matrix(genomes)
+
+    # Mesmos obstáculos e posições para todas as perturbações da geração, com
+    # geradores próprios (sem pool, o ruído continua no gerador global)
+    run_generation(population, max_ticks, GameEngine(course_seed, config=config),
+                   rng=np.random.RandomState(course_seed))
+
+    return np.array([agent.get_fitness() for agent in population.agents])
+
+
+class Adam:
+    """Otimizador Adam (passo de subida do gradiente)"""
+
+    def __init__(self, size, learning_rate, beta1=0.9, beta2=0.999, epsilon=1e-8):
+        self.learning_rate = learning_rate
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.epsilon = epsilon
+        self.m = np.zeros(size)
+        self.v = np.zeros(size)
+        self.t = 0
+
+    def step(self, gradient):
+        """Retorna o deslocamento para um gradiente"""
+        self.t += 1
+        self.m = self.beta1 * self.m + (1 - self.beta1) * gradient
+        self.v = self.beta2 * self.v + (1 - self.beta2) * gradient ** 2
+        correction = np.sqrt(1 - self.beta2 ** self.t) / (1 - self.beta1 ** self.t)
+        return self.learning_rate * correction * self.m / (np.sqrt(self.v) + self.epsilon)
+
+
+class EvolutionStrategy:
+    """OpenAI-ES com amostragem antitética e ranking centrado"""
+
+    def __init__(self, population_size=POPULATION_SIZE, input_size=6, hidden_size=10,
+                 output_size=2, layers=None, recurrent=False, sigma=0.1,
+                 learning_rate=0.03, weight_decay=0.005, workers=None,
+                 max_ticks=HEADLESS_MAX_TICKS, dtype=TRAINING_DTYPE,
+                 initial_weights=None, feature_set=None, config=None):
+        """
+        population_size: perturbações por geração (arredondado para par)
+        layers/recurrent: arquitetura das redes (ver NeuralNetwork)
+        sigma: desvio padrão do ruído das perturbações
+        learning_rate: passo do Adam sobre o genoma médio
+        weight_decay: penalidade L2 que puxa os pesos para zero
+        workers: processos avaliando em paralelo (padrão: um por núcleo)
+        initial_weights: genoma médio inicial (ex: um modelo salvo); sem ele,
+                         a média parte do melhor de uma população aleatória
+        feature_set: conjunto de entradas dos sensores (game/sensors.py)
+        config: GameConfig das partidas (game/settings.py; padrão: original)
+        """
+        self.population_size = max(2, population_size - population_size % 2)
+        self.spec = make_spec(input_size, output_size,
+                              normalize_layers(hidden_size, layers), recurrent,
+                              feature_set)
+        self.sigma = sigma
+        self.weight_decay = weight_decay
+        self.workers = workers or os.cpu_count() or 1
+        self.max_ticks = max_ticks
+        self.dtype = dtype
+        self.config = config
+
+        # Quase toda rede aleatória morre no primeiro obstáculo: partindo de
+        # um único ponto o fitness é plano e o gradiente estimado é só ruído
+        self.warm_start = initial_weights is None
+        if initial_weights is None:
+            initial_weights = NeuralNetwork.from_spec(self.spec).get_weights()
+        self.mean = np.asarray(initial_weights, dtype=np.float64).copy()
+        self.optimizer = Adam(len(self.mean), learning_rate)
+
+        self.generation = 1
+        self.best_fitness = 0
+        self.best_weights = self.mean.copy()
+        self.best_fitness_history = []
+        self.avg_fitness_history = []
+
+        print(f"\n🧬 Estratégia Evolutiva (OpenAI-ES) Inicializada:")
+        print(f"   Perturbações: {self.population_size} (antitéticas)")
+        print(f"   Sigma: {sigma} | Taxa de aprendizado: {learning_rate}")
+        print(f"   Processos: {self.workers}")
+        print(f"   Arquitetura: {describe_spec(self.spec)} ({len(self.mean)} pesos)\n")
+
+    def sample(self):
+        """
+        Ruído antitético como uma única matriz: metade ε, metade -ε
+        retorna: (ruído, genomas candidatos), ambos (população, genes)
+        """
+        half = np.random.randn(self.population_size // 2, len(self.mean))
+        noise = np.concatenate([half, -half])
+        return noise, self.mean + self.sigma * noise
+
+    def update(self, noise, fitnesses):
+        """Move a média na direção estimada do gradiente (ranking centrado)"""
+        shaped = centered_ranks(fitnesses)
+        gradient = shaped @ noise / (len(shaped) * self.sigma)
+        self.mean += self.optimizer.step(gradient - self.weight_decay * self.mean)
+
+    def evaluate(self, candidates, pool=None):
+        """Avalia os candidatos em blocos (um por processo), no mesmo percurso"""
+        course_seed = np.random.randint(2 ** 31)
+        chunks = np.array_split(candidates, min(self.workers, len(candidates)))
+        args = [(chunk, self.spec, self.dtype, self.max_ticks, course_seed, self.config)
+                for chunk in chunks]
+
+        if pool is None:
+            results = [_evaluate_chunk(*arg) for arg in args]
+        else:
+            results = list(pool.map(_evaluate_chunk, *zip(*args)))
+        return np.concatenate(results)
+
+    def initialize_mean(self, pool=None):
+        """Avalia uma população aleatória e move a média para o melhor genoma"""
+        candidates = np.stack([NeuralNetwork.from_spec(self.spec).get_weights()
+                               for _ in range(self.population_size)])
+        fitnesses = self.evaluate(candidates, pool)
+
+        best = int(np.argmax(fitnesses))
+        self.mean = candidates[best].astype(np.float64)
+        self.best_fitness = float(fitnesses[best])
+        self.best_weights = self.mean.copy()
+        self.warm_start = False
+        print(f"   Média inicial: melhor de {len(candidates)} redes aleatórias "
+              f"(fitness {self.best_fitness:.0f})")
+
+    def get_best_brain(self):
+        """Rede do melhor candidato já avaliado"""
+        brain = NeuralNetwork.from_spec(self.spec)
+        brain.set_weights(self.best_weights)
+        return brain
+
+    def get_mean_brain(self):
+        """Rede do genoma médio atual"""
+        brain = NeuralNetwork.from_spec(self.spec)
+        brain.set_weights(self.mean)
+        return brain
+
+    def step(self, pool=None):
+        """Uma geração: amostra, avalia, atualiza a média"""
+        noise, candidates = self.sample()
+        fitnesses = self.evaluate(candidates, pool)
+
+        best = int(np.argmax(fitnesses))
+        if fitnesses[best] > self.best_fitness:
+            self.best_fitness = float(fitnesses[best])
+            self.best_weights = candidates[best].copy()
+            print(f"   🏆 NOVO RECORDE! Fitness: {self.best_fitness:.0f}")
+
+        self.best_fitness_history.append(float(fitnesses.max()))
+        self.avg_fitness_history.append(float(fitnesses.mean()))
+
+        self.update(noise, fitnesses)
+
+        print(f"Gen {self.generation:3d} | "
+              f"Melhor: {fitnesses.max():7.0f} | "
+              f"Média: {fitnesses.mean():7.0f} | "
+              f"|média|: {np.linalg.norm(self.mean):6.2f}")
+        self.generation += 1
+
+    def run(self, generations, session_manager=None):
+        """
+        Executa gerações; com mais de um processo, avalia em um pool
+        session_manager: se informado, registra o melhor modelo na sessão atual
+        retorna: rede do melhor candidato encontrado
+        """
+        pool = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            if self.warm_start:
+                self.initialize_mean(pool)
+
+            for _ in range(generations):
+                generation = self.generation
+                self.step(pool)
+
+                if session_manager is not None:
+                    session_manager.update_session(generation, self.best_fitness,
+                                                   self.avg_fitness_history[-1],
+                                                   self.get_best_brain())
+        except KeyboardInterrupt:
+            print("\n⚠ Interrompido")
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        return self.get_best_brain()
@@ -1,48 +1,115 @@
 """Algoritmo Evolutivo REAL para treinar as redes neurais"""
 import numpy as np
 from ai.population import Population, Agent
-from ai.neural_network import NeuralNetwork
+from ai.neural_network import TRAINING_DTYPE, describe_spec
+from ai.diversity import (DIVERSITY_CHUNK_SIZE, genetic_diversity,
+                          streaming_genetic_diversity, behavioral_diversity)
+from ai.operators import (MUTATION_TIERS, gaussian_mutation, tiered_mutation, get_operator,
+                          validate_tiers)
+
+
+# Operadores usados quando um tipo não é informado em `operators`
+DEFAULT_OPERATORS = {
+    'selection': 'tournament',
+    'crossover': 'uniform',
+    'mutation': 'gaussian',
+    'replacement': 'elitist',
+}
+
+# Hiperparâmetros do modo treino (ponto de partida das varreduras, ai/sweep.py)
+TRAINING_HYPERPARAMETERS = {
+    'hidden_size': 10,
+    'mutation_rate': 0.15,
+    'mutation_strength': 0.25,
+    'elite_ratio': 0.02,
+    'mutation_tiers': MUTATION_TIERS,
+}
 
 
 class EvolutionaryAlgorithm:
     def __init__(self, population_size, input_size, hidden_size, output_size,
                  mutation_rate=0.2, mutation_strength=0.5, elite_ratio=0.1,
-                 start_generation=1):
+                 start_generation=1, verbose=True, operators=None,
+                 operator_params=None, track_behavior=False,
+                 dtype=TRAINING_DTYPE, layers=None, recurrent=False,
+                 feature_set=None, config=None, mutation_tiers=MUTATION_TIERS):
         """
         population_size: tamanho da população
         mutation_rate: probabilidade inicial de mutação
         mutation_strength: força inicial da mutação
         elite_ratio: proporção de elite preservada (top performers)
         start_generation: geração inicial (para continuar treinamento)
+        verbose: imprime progresso no console (desligado nas ilhas)
+        operators: dict tipo → nome dos operadores vetorizados (ai/operators.py),
+                   ex: {'selection': 'tournament', 'crossover': 'uniform'}.
+                   None mantém a estratégia conservadora
+        operator_params: dict tipo → parâmetros extras do operador,
+                         ex: {'selection': {'tournament_size': 3}}
+        track_behavior: grava as ações dos agentes e usa também a
+                        diversidade comportamental na mutação adaptativa
+        dtype: tipo de ponto flutuante das redes (float32 por padrão no treino)
+        layers: camadas ocultas [(neurônios, ativação), ...]; substitui hidden_size
+        recurrent: redes com memória recorrente na primeira camada oculta
+        feature_set: conjunto de entradas dos sensores (game/sensors.py)
+        config: GameConfig dos jogos da população (game/settings.py; padrão: original)
+        mutation_tiers: faixas da estratégia conservadora
+                        ((proporção, genes mutados, força), ...; ver MUTATION_TIERS)
         """
         self.population_size = population_size
-        self.input_size = input_size
-        self.hidden_size = hidden_size
-        self.output_size = output_size
+        self.dtype = dtype
         
         self.initial_mutation_rate = mutation_rate
         self.mutation_rate = mutation_rate
         self.initial_mutation_strength = mutation_strength
         self.mutation_strength = mutation_strength
         self.elite_count = max(2, int(population_size * elite_ratio))
+        self.mutation_tiers = validate_tiers(mutation_tiers)
         
         self.population = Population(population_size, input_size, 
-                                     hidden_size, output_size)
+                                     hidden_size, output_size, dtype,
+                                     layers=layers, recurrent=recurrent,
+                                     feature_set=feature_set, config=config)
+        self.config = config
+        self.input_size = input_size
+        self.hidden_size = self.population.hidden_size
+        self.output_size = output_size
         self.generation = start_generation
         self.best_fitness_history = []
         self.avg_fitness_history = []
         self.species_diversity = []
-        
-        print(f"\n🧬 Algoritmo Evolutivo Inicializado:")
-        print(f"   População: {population_size}")
-        print(f"   Elite: {self.elite_count} ({elite_ratio*100:.0f}%)")
-        print(f"   Taxa de Mutação: {mutation_rate}")
-        print(f"   Arquitetura: {input_size}-{hidden_size}-{output_size}")
-        print(f"   Geração inicial: {start_generation}\n")
+        self.behavioral_diversity = []
+        self.verbose = verbose
+        
+        self.track_behavior = track_behavior
+        if track_behavior:
+            self.population.enable_action_traces()
+        
+        self.operators = None
+        self.operator_params = dict(operator_params or {})
+        if operators is not None:
+            self.operators = {kind: get_operator(kind, operators.get(kind, default))
+                              for kind, default in DEFAULT_OPERATORS.items()}
+            # A mutação por faixas usa as faixas deste algoritmo (salvo se informadas)
+            if self.operators['mutation'] is tiered_mutation:
+                self.operator_params['mutation'] = {
+                    'tiers': self.mutation_tiers, **self.operator_params.get('mutation', {})}
+        
+        if verbose:
+            print(f"\n🧬 Algoritmo Evolutivo Inicializado:")
+            print(f"   População: {population_size}")
+            print(f"   Elite: {self.elite_count} ({elite_ratio*100:.0f}%)")
+            print(f"   Taxa de Mutação: {mutation_rate}")
+            print(f"   Arquitetura: {describe_spec(self.population.get_spec())}")
+            if operators is not None:
+                names = {**DEFAULT_OPERATORS, **operators}
+                print("   Operadores: " + ", ".join(f"{kind}={names[kind]}"
+                                                      for kind in DEFAULT_OPERATORS))
+            print(f"   Geração inicial: {start_generation}\n")
         
     def evolve(self):
         """
         Evolução CONSERVADORA: Preserva o que funciona, explora gradualmente
+        (ou, se configurados, usa os operadores vetorizados)
         """
         # Ordena população por fitness (melhor → pior)
         self.population.agents.sort(key=lambda x: x.get_fitness(), reverse=True)
@@ -55,72 +122,36 @@ class EvolutionaryAlgorithm:
         self.best_fitness_history.append(best_fitness)
         self.avg_fitness_history.append(avg_fitness)
         
-        # Calcula diversidade genética
-        diversity = self._calculate_genetic_diversity()
+        # Calcula diversidade genética (os operadores vetorizados precisam da
+        # matriz inteira de qualquer forma: montada uma vez e reaproveitada)
+        genomes = None
+        if self.operators is not None:
+            genomes = self.population.get_genome_matrix()
+        diversity = self._calculate_genetic_diversity(genomes)
         self.species_diversity.append(diversity)
         
-        print(f"Gen {self.generation:3d} | "
-              f"Melhor: {best_fitness:7.0f} | "
-              f"Média: {avg_fitness:7.0f} | "
-              f"Diversidade: {diversity:.3f} | "
-              f"Mut: {self.mutation_rate:.3f}")
-        
-        # ===== ESTRATÉGIA CONSERVADORA =====
-        best_parent_brain = self.population.agents[0].brain
-        
-        new_population = []
-        
-        # 1. UMA cópia EXATA do melhor (0% mutação)
-        new_population.append(Agent(best_parent_brain.copy()))
-        
-        # 2. 60% da população: Mutação MUITO LEVE (apenas refinamento)
-        # Esses são os filhos que vão MANTER o comportamento do pai
-        num_conservative = int(self.population_size * 0.6)
-        for _ in range(num_conservative):
-            if len(new_population) >= self.population_size:
-                break
-            child_brain = best_parent_brain.copy()
-            weights = child_brain.get_weights()
-            
-            # Apenas 10% dos genes mutam, com força 0.15
-            mutation_mask = np.random.rand(len(weights)) < 0.1
-            mutations = np.random.randn(len(weights)) * 0.15
-            weights += mutation_mask * mutations
-            
-            child_brain.set_weights(weights)
-            new_population.append(Agent(child_brain))
-        
-        # 3. 25% da população: Mutação MODERADA (exploração local)
-        num_moderate = int(self.population_size * 0.25)
-        for _ in range(num_moderate):
-            if len(new_population) >= self.population_size:
-                break
-            child_brain = best_parent_brain.copy()
-            weights = child_brain.get_weights()
-            
-            # 25% dos genes mutam, força 0.3
-            mutation_mask = np.random.rand(len(weights)) < 0.25
-            mutations = np.random.randn(len(weights)) * 0.3
-            weights += mutation_mask * mutations
-            
-            child_brain.set_weights(weights)
-            new_population.append(Agent(child_brain))
-        
-        # 4. 15% restante: Mutação FORTE (exploração)
-        while len(new_population) < self.population_size:
-            child_brain = best_parent_brain.copy()
-            weights = child_brain.get_weights()
-            
-            # 40% dos genes mutam, força 0.5
-            mutation_mask = np.random.rand(len(weights)) < 0.4
-            mutations = np.random.randn(len(weights)) * 0.5
-            weights += mutation_mask * mutations
-            
-            child_brain.set_weights(weights)
-            new_population.append(Agent(child_brain))
-        
-        # ===== ATUALIZAÇÃO =====
-        self.population.agents = new_population
+        # Diversidade comportamental: convergiu se os genes OU as ações convergiram
+        behavior_text = ""
+        if self.track_behavior:
+            behavior = behavioral_diversity(self.population.get_action_traces())
+            self.behavioral_diversity.append(behavior)
+            behavior_text = f" | Comportamento: {behavior:.3f}"
+            diversity = min(diversity, behavior)
+        
+        if self.verbose:
+            print(f"Gen {self.generation:3d} | "
+                  f"Melhor: {best_fitness:7.0f} | "
+                  f"Média: {avg_fitness:7.0f} | "
+                  f"Diversidade: {self.species_diversity[-1]:.3f}{behavior_text} | "
+                  f"Mut: {self.mutation_rate:.3f}")
+        
+        if self.operators is not None:
+            self._evolve_with_operators(np.asarray(fitnesses, dtype=float), genomes)
+        else:
+            self._evolve_conservative()
+        
+        if self.track_behavior:
+            self.population.enable_action_traces()
         
         # Mutação adaptativa (agora mais conservadora)
         self._adaptive_mutation(best_fitness, avg_fitness, diversity)
@@ -128,103 +159,69 @@ class EvolutionaryAlgorithm:
         # Incrementa geração
         self.generation += 1
         
-    def _fitness_proportionate_selection(self, fitnesses):
+    def _evolve_conservative(self):
         """
-        Seleção proporcional ao fitness (Roulette Wheel Selection)
-        Indivíduos com maior fitness têm maior chance de serem selecionados
+        Estratégia CONSERVADORA: filhos do melhor com faixas de mutação
+        (população já ordenada do melhor para o pior)
         """
-        # Evita fitness negativo e adiciona offset
-        min_fitness = min(fitnesses)
-        adjusted_fitnesses = [f - min_fitness + 1 for f in fitnesses]
-        
-        total_fitness = sum(adjusted_fitnesses)
+        self.population.agents = self.offspring_of(self.population.agents[0].brain)
         
-        if total_fitness == 0:
-            # Se todos têm fitness 0, seleção uniforme
-            return np.random.randint(0, len(fitnesses))
-        
-        # Probabilidades proporcionais ao fitness
-        probabilities = [f / total_fitness for f in adjusted_fitnesses]
-        
-        # Seleciona índice baseado nas probabilidades
-        selected_idx = np.random.choice(len(fitnesses), p=probabilities)
-        
-        return selected_idx
-    
-    def _tournament_selection(self, fitnesses, tournament_size=5):
+    def offspring_of(self, parent_brain):
         """
-        Seleção por torneio (alternativa mais agressiva)
+        Nova população de filhos de uma rede, pelas faixas de mutação
+        (evolução conservadora e continuação de um modelo salvo)
+        retorna: lista de population_size agentes
         """
-        # Seleciona indivíduos aleatórios para o torneio
-        tournament_indices = np.random.choice(
-            len(fitnesses), 
-            size=min(tournament_size, len(fitnesses)), 
-            replace=False
-        )
-        
-        # Retorna o melhor do torneio
-        tournament_fitnesses = [fitnesses[i] for i in tournament_indices]
-        winner_idx = tournament_indices[np.argmax(tournament_fitnesses)]
-        
-        return winner_idx
+        new_population = []
         
-    def _crossover(self, brain1, brain2):
+        # 1. UMA cópia EXATA do pai (0% mutação)
+        new_population.append(Agent(parent_brain.copy(), self.config))
+        
+        # 2. Faixas de mutação (padrão MUTATION_TIERS):
+        #    60% MUITO LEVE (mantém o comportamento do pai),
+        #    25% MODERADA (exploração local) e o restante FORTE (exploração)
+        for i, (proportion, rate, strength) in enumerate(self.mutation_tiers):
+            is_last_tier = i == len(self.mutation_tiers) - 1
+            count = (self.population_size if is_last_tier
+                     else int(self.population_size * proportion))
+            for _ in range(count):
+                if len(new_population) >= self.population_size:
+                    break
+                child_brain = parent_brain.copy()
+                child_brain.set_weights(
+                    gaussian_mutation(child_brain.get_weights(), rate, strength))
+                new_population.append(Agent(child_brain, self.config))
+        
+        return new_population
+        
+    def _evolve_with_operators(self, fitnesses, genomes):
         """
-        Cruzamento genético REAL (múltiplos métodos)
+        Evolução pelos operadores vetorizados escolhidos:
+        seleção → cruzamento → mutação → substituição, cada um em uma
+        única chamada sobre a matriz de genomas da população inteira
+        genomes: matriz de genomas da população (mesma ordem dos agentes)
         """
-        child_brain = NeuralNetwork(self.input_size, self.hidden_size, 
-                                     self.output_size)
-        
-        weights1 = brain1.get_weights()
-        weights2 = brain2.get_weights()
-        child_weights = np.zeros_like(weights1)
+        count = self.population_size
         
-        # Método de crossover variado
-        crossover_method = np.random.choice(['uniform', 'single_point', 'two_point', 'average'])
-        
-        if crossover_method == 'uniform':
-            # Crossover uniforme: cada gene vem aleatoriamente de um dos pais
-            mask = np.random.rand(len(weights1)) < 0.5
-            child_weights = np.where(mask, weights1, weights2)
-            
-        elif crossover_method == 'single_point':
-            # Crossover de ponto único
-            point = np.random.randint(1, len(weights1))
-            child_weights[:point] = weights1[:point]
-            child_weights[point:] = weights2[point:]
-            
-        elif crossover_method == 'two_point':
-            # Crossover de dois pontos
-            point1 = np.random.randint(0, len(weights1) // 2)
-            point2 = np.random.randint(len(weights1) // 2, len(weights1))
-            
-            child_weights[:point1] = weights1[:point1]
-            child_weights[point1:point2] = weights2[point1:point2]
-            child_weights[point2:] = weights1[point2:]
-            
-        elif crossover_method == 'average':
-            # Média ponderada (blend crossover)
-            alpha = np.random.uniform(0.3, 0.7)
-            child_weights = alpha * weights1 + (1 - alpha) * weights2
+        select = self.operators['selection']
+        selection_params = self.operator_params.get('selection', {})
+        parents_a = select(fitnesses, count, **selection_params)
+        parents_b = select(fitnesses, count, **selection_params)
         
-        child_brain.set_weights(child_weights)
-        return child_brain
+        children = self.operators['crossover'](
+            genomes[parents_a], genomes[parents_b],
+            **self.operator_params.get('crossover', {}))
         
-    def _mutate(self, brain):
-        """
-        Mutação genética
-        """
-        weights = brain.get_weights()
+        children = self.operators['mutation'](
+            children, self.mutation_rate, self.mutation_strength,
+            **self.operator_params.get('mutation', {}))
         
-        # Máscara de mutação
-        mutation_mask = np.random.rand(len(weights)) < self.mutation_rate
+        new_genomes = self.operators['replacement'](
+            genomes, fitnesses, children, self.elite_count,
+            **self.operator_params.get('replacement', {}))
         
-        # Mutação gaussiana
-        mutations = np.random.randn(len(weights)) * self.mutation_strength
-        weights += mutation_mask * mutations
+        self.population.set_genome_matrix(new_genomes)
         
-        brain.set_weights(weights)
-    
     def _adaptive_mutation(self, best_fitness, avg_fitness, diversity):
         """
         Mutação adaptativa CONSERVADORA
@@ -246,27 +243,21 @@ class EvolutionaryAlgorithm:
                 self.mutation_rate = max(0.05, self.mutation_rate * 0.98)
                 self.mutation_strength = max(0.1, self.mutation_strength * 0.98)
     
-    def _calculate_genetic_diversity(self):
+    def _calculate_genetic_diversity(self, genomes=None):
         """
         Calcula diversidade genética da população
         Útil para detectar convergência prematura
+        Usa a população inteira (amostras pequenas deixavam a métrica ruidosa
+        e faziam a mutação adaptativa oscilar), bloco a bloco
+        genomes: matriz de genomas já montada (None = lê os agentes em blocos)
         """
         if len(self.population.agents) < 2:
             return 1.0
         
-        # Pega pesos de alguns indivíduos
-        sample_size = min(10, len(self.population.agents))
-        samples = np.random.choice(self.population.agents, sample_size, replace=False)
-        
-        weights_matrix = [agent.brain.get_weights() for agent in samples]
-        
-        # Calcula variância média dos pesos
-        variance = np.var(weights_matrix, axis=0).mean()
-        
-        # Normaliza para [0, 1]
-        diversity = min(1.0, variance / 0.5)
-        
-        return diversity
+        if genomes is not None:
+            return genetic_diversity(genomes)
+        return streaming_genetic_diversity(
+            self.population.genome_chunks(DIVERSITY_CHUNK_SIZE))
         
     def get_current_population(self):
         """Retorna população atual"""
@@ -292,9 +283,9 @@ class EvolutionaryAlgorithm:
         self.population.agents = []
         
         for weights in checkpoint_data['population_weights']:
-            nn = NeuralNetwork(self.input_size, self.hidden_size, self.output_size)
+            nn = self.population.new_brain()
             nn.set_weights(weights)
-            agent = Agent(nn)
+            agent = Agent(nn, self.config)
             self.population.agents.append(agent)
         
         # Restaura fitness
@@ -0,0 +1,269 @@
+"""Modelo de ilhas: sub-populações evoluindo em processos separados com migração"""
+import os
+import queue
+import random
+import multiprocessing as mp
+import numpy as np
+from game.config import *
+from ai.evolutionary_algorithm import EvolutionaryAlgorithm
+from ai.neural_network import (NeuralNetwork, TRAINING_DTYPE, describe_spec,
+                               make_spec, normalize_layers)
+from ai.population import Agent
+from ai.curriculum import CurriculumScheduler
+from ai.replay import ReplayRecorder
+from ai.simulation import run_generation
+
+
+def _receive_migrants(ea, inbox):
+    """
+    Integra imigrantes que chegaram da ilha vizinha
+    Substituem os piores agentes e mantêm o fitness de origem, assim
+    competem pela posição de pai na próxima evolução
+    """
+    migrants = []
+    while True:
+        try:
+            migrants.extend(inbox.get_nowait())
+        except queue.Empty:
+            break
+
+    if not migrants:
+        return 0
+
+    agents = ea.population.agents
+    agents.sort(key=lambda x: x.get_fitness(), reverse=True)
+    migrants = migrants[:len(agents) - 1]
+
+    for i, (weights, fitness) in enumerate(migrants):
+        brain = ea.population.new_brain()
+        brain.set_weights(weights)
+        agent = Agent(brain, ea.config)
+        agent.dino.fitness = fitness
+        agents[len(agents) - 1 - i] = agent
+
+    return len(migrants)
+
+
+def _island_worker(island_id, settings, inbox, outbox, reports, stop_event):
+    """Loop de evolução de uma ilha (executa em processo próprio)"""
+    # Cada processo precisa de sua própria semente (fork copia o estado do RNG)
+    seed = settings['seed']
+    seed = None if seed is None else seed + island_id
+    np.random.seed(seed)
+    random.seed(seed)
+
+    # Não trava a saída do processo esperando a ilha vizinha ler a fila
+    outbox.cancel_join_thread()
+
+    ea = EvolutionaryAlgorithm(
+        population_size=settings['island_size'],
+        input_size=settings['input_size'],
+        hidden_size=settings['hidden_size'],
+        output_size=settings['output_size'],
+        mutation_rate=settings['mutation_rate'],
+        mutation_strength=settings['mutation_strength'],
+        elite_ratio=settings['elite_ratio'],
+        verbose=False,
+        operators=settings['operators'],
+        operator_params=settings['operator_params'],
+        track_behavior=settings['track_behavior'],
+        dtype=settings['dtype'],
+        layers=settings['layers'],
+        recurrent=settings['recurrent'],
+        feature_set=settings['feature_set'],
+        config=settings['config']
+    )
+
+    recorder = None
+    if settings['replay_dir']:
+        recorder = ReplayRecorder(settings['replay_dir'], ea.generation,
+                                  settings['replay_every'], prefix=f"ilha{island_id}_")
+
+    curriculum = None
+    if settings['curriculum']:
+        curriculum = CurriculumScheduler(settings['curriculum'],
+                                         config=settings['config'])
+
+    for step in range(1, settings['generations'] + 1):
+        if stop_event.is_set():
+            break
+
+        level = curriculum.level if curriculum is not None else None
+        ticks = run_generation(ea.population, settings['max_ticks'], recorder=recorder,
+                               course=curriculum.course if curriculum is not None else None)
+        if curriculum is not None:
+            curriculum.update(ticks)
+
+        ranked = sorted(ea.population.agents, key=lambda x: x.get_fitness(), reverse=True)
+        fitnesses = [agent.get_fitness() for agent in ranked]
+
+        # Emigração: envia os melhores genomas para a próxima ilha do anel
+        if step % settings['migration_interval'] == 0:
+            outbox.put([(agent.brain.get_weights(), agent.get_fitness())
+                        for agent in ranked[:settings['migrants']]])
+
+        # Imigrantes entram depois das estatísticas (o fitness veio de outra ilha)
+        immigrants = _receive_migrants(ea, inbox)
+
+        reports.put({
+            'island': island_id,
+            'generation': ea.generation,
+            'best_fitness': fitnesses[0],
+            'avg_fitness': float(np.mean(fitnesses)),
+            'best_weights': ranked[0].brain.get_weights(),
+            'immigrants': immigrants,
+            'ticks': ticks,
+            'level': level
+        })
+
+        ea.evolve()
+
+    reports.put({'island': island_id, 'done': True})
+
+
+class IslandModel:
+    """Evolução em ilhas conectadas em anel, uma por processo"""
+
+    def __init__(self, num_islands=None, island_size=POPULATION_SIZE,
+                 migration_interval=10, migrants=2,
+                 input_size=6, hidden_size=10, output_size=2,
+                 mutation_rate=0.15, mutation_strength=0.25, elite_ratio=0.02,
+                 max_ticks=HEADLESS_MAX_TICKS, seed=None,
+                 operators=None, operator_params=None, track_behavior=False,
+                 dtype=TRAINING_DTYPE, layers=None, recurrent=False,
+                 feature_set=None, replay_dir=None, replay_every=1, curriculum=None,
+                 config=None):
+        """
+        num_islands: número de ilhas (padrão: um processo por núcleo)
+        island_size: tamanho da população de cada ilha
+        migration_interval: a cada quantas gerações os melhores migram
+        migrants: quantos genomas migram por vez
+        max_ticks: limite de ticks por geração
+        seed: semente base (cada ilha usa seed + índice)
+        operators/operator_params: operadores vetorizados de cada ilha
+                                   (ver EvolutionaryAlgorithm)
+        track_behavior: usa também a diversidade comportamental nas ilhas
+        dtype: tipo de ponto flutuante das redes nas ilhas
+        layers/recurrent: arquitetura das redes (ver NeuralNetwork)
+        feature_set: conjunto de entradas dos sensores (game/sensors.py)
+        replay_dir: se informado, cada ilha grava replays das gerações ali
+        replay_every: grava uma geração a cada quantas
+        curriculum: duração-alvo das gerações (ticks) para o currículo de
+                    dificuldade de cada ilha (ai/curriculum.py); None = percurso fixo
+        config: GameConfig dos jogos das ilhas (game/settings.py; padrão: original)
+        """
+        self.num_islands = num_islands or os.cpu_count() or 1
+        self.spec = make_spec(input_size, output_size,
+                              normalize_layers(hidden_size, layers), recurrent,
+                              feature_set)
+
+        self.settings = {
+            'island_size': island_size,
+            'migration_interval': max(1, migration_interval),
+            'migrants': migrants,
+            'input_size': input_size,
+            'hidden_size': hidden_size,
+            'output_size': output_size,
+            'mutation_rate': mutation_rate,
+            'mutation_strength': mutation_strength,
+            'elite_ratio': elite_ratio,
+            'max_ticks': max_ticks,
+            'seed': seed,
+            'operators': operators,
+            'operator_params': operator_params,
+            'track_behavior': track_behavior,
+            'dtype': dtype,
+            'layers': layers,
+            'recurrent': recurrent,
+            'feature_set': feature_set,
+            'replay_dir': replay_dir,
+            'replay_every': replay_every,
+            'curriculum': curriculum,
+            'config': config,
+            'generations': 0
+        }
+
+        self.best_fitness = 0
+        self.best_brain = None
+        self.best_island = None
+        self.generation = 0
+
+        print(f"\n🏝  Modelo de Ilhas Inicializado:")
+        print(f"   Ilhas: {self.num_islands} x {island_size} agentes")
+        print(f"   Migração: {migrants} genomas a cada {migration_interval} gerações")
+        print(f"   Arquitetura: {describe_spec(self.spec)}\n")
+
+    def run(self, generations, session_manager=None):
+        """
+        Executa as ilhas em paralelo por um número de gerações
+        session_manager: se informado, registra o melhor modelo na sessão atual
+        retorna: rede do melhor agente encontrado em todas as ilhas
+        """
+        settings = dict(self.settings, generations=generations)
+
+        ctx = mp.get_context()
+        reports = ctx.Queue()
+        stop_event = ctx.Event()
+        # Anel: a ilha i envia para a fila i e recebe da fila i - 1
+        rings = [ctx.Queue() for _ in range(self.num_islands)]
+
+        workers = []
+        for i in range(self.num_islands):
+            worker = ctx.Process(
+                target=_island_worker,
+                args=(i, settings, rings[i - 1], rings[i], reports, stop_event),
+                daemon=True
+            )
+            worker.start()
+            workers.append(worker)
+
+        finished = 0
+        try:
+            while finished < self.num_islands:
+                try:
+                    report = reports.get(timeout=1.0)
+                except queue.Empty:
+                    # Ilha morreu sem avisar (erro no processo)
+                    if not any(worker.is_alive() for worker in workers):
+                        break
+                    continue
+
+                if report.get('done'):
+                    finished += 1
+                    continue
+
+                self._handle_report(report, session_manager)
+        except KeyboardInterrupt:
+            print("\n⚠ Interrompido, encerrando ilhas...")
+            stop_event.set()
+        finally:
+            stop_event.set()
+            for worker in workers:
+                worker.join(timeout=5)
+                if worker.is_alive():
+                    worker.terminate()
+
+        return self.best_brain
+
+    def _handle_report(self, report, session_manager):
+        """Processa o relatório de geração de uma ilha"""
+        self.generation = max(self.generation, report['generation'])
+
+        if report['best_fitness'] > self.best_fitness or self.best_brain is None:
+            self.best_fitness = report['best_fitness']
+            self.best_island = report['island']
+            self.best_brain = NeuralNetwork.from_spec(self.spec)
+            self.best_brain.set_weights(report['best_weights'])
+            print(f"   🏆 NOVO RECORDE! Fitness: {self.best_fitness:.0f} "
+                  f"(ilha {self.best_island})")
+
+        level = "" if report['level'] is None else f" | Nível: {report['level']}"
+        print(f"Ilha {report['island']:2d} | "
+              f"Gen {report['generation']:3d} | "
+              f"Melhor: {report['best_fitness']:7.0f} | "
+              f"Média: {report['avg_fitness']:7.0f} | "
+              f"Imigrantes: {report['immigrants']}{level}")
+
+        if session_manager is not None:
+            session_manager.update_session(self.generation, self.best_fitness,
+                                           report['avg_fitness'], self.best_brain)
@@ -0,0 +1,160 @@
+"""
+Cache em memória dos modelos salvos
+
+Os arquivos .pkl das sessões são lidos uma vez e guardados (LRU); o menu
+pede o pré-carregamento das primeiras sessões da lista em threads, então
+ASSISTIR/INICIAR não esperam o disco. Arrays de pesos idênticos (ex: uma
+sessão continuada que não superou a anterior) ficam em uma única cópia.
+"""
+import os
+import copy
+import pickle
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+import numpy as np
+
+
+# Modelos guardados em memória
+MODEL_CACHE_SIZE = 16
+
+# Threads de pré-carregamento
+PREFETCH_WORKERS = 2
+
+
+def _file_stamp(path):
+    """
+    Identifica a versão do arquivo (muda se ele for regravado)
+    O inode muda quando o arquivo é trocado por write_model_file, mesmo
+    com data e tamanho iguais
+    """
+    stat = os.stat(path)
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def write_model_file(path, model_data, cache=None):
+    """
+    Regrava um modelo trocando o arquivo de uma vez (os.replace): quem lê,
+    inclusive o pré-carregamento de outro processo, nunca vê um arquivo pela
+    metade, e os caches percebem a troca pelo inode
+    cache: ModelCache deste processo, cuja entrada é descartada
+    """
+    temporary = f"{path}.tmp"
+    with open(temporary, 'wb') as f:
+        pickle.dump(model_data, f)
+    os.replace(temporary, path)
+    if cache is not None:
+        cache.discard(path)
+
+
+class ModelCache:
+    """Modelos carregados por caminho, com pré-carregamento em segundo plano"""
+
+    def __init__(self, capacity=MODEL_CACHE_SIZE, workers=PREFETCH_WORKERS):
+        self.capacity = capacity
+        self.workers = workers
+        # caminho → (versão do arquivo, modelo)
+        self.entries = OrderedDict()
+        # caminho → Future do carregamento em andamento
+        self.pending = {}
+        # conteúdo → array compartilhado entre modelos
+        self.arrays = weakref.WeakValueDictionary()
+        self.lock = threading.Lock()
+        self.executor = None
+        self.hits = 0
+        self.misses = 0
+        self.shared_bytes = 0
+
+    def get(self, path):
+        """
+        Modelo de um arquivo (do cache, do pré-carregamento ou do disco)
+        retorna: cópia do modelo (o chamador pode alterá-la à vontade)
+        """
+        stamp = _file_stamp(path)
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is not None and entry[0] == stamp:
+                self.entries.move_to_end(path)
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+            future = self.pending.get(path)
+
+        if future is not None:
+            loaded_stamp, model_data = future.result()
+            if loaded_stamp == stamp:
+                self.hits += 1
+                return copy.deepcopy(model_data)
+
+        self.misses += 1
+        _, model_data = self._load(path)
+        return copy.deepcopy(model_data)
+
+    def prefetch(self, paths):
+        """Carrega os arquivos em threads (os que já estão no cache são ignorados)"""
+        with self.lock:
+            if self.executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self.executor = ThreadPoolExecutor(self.workers,
+                                                   thread_name_prefix="model-prefetch")
+            for path in paths:
+                entry = self.entries.get(path)
+                if path in self.pending or (entry is not None and
+                                            os.path.exists(path) and
+                                            entry[0] == _file_stamp(path)):
+                    continue
+                self.pending[path] = self.executor.submit(self._prefetch, path)
+
+    def discard(self, path):
+        """Esquece um arquivo (apagado ou regravado)"""
+        with self.lock:
+            self.entries.pop(path, None)
+
+    def close(self):
+        """Cancela os pré-carregamentos que ainda não começaram"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def _prefetch(self, path):
+        try:
+            return self._load(path)
+        finally:
+            with self.lock:
+                self.pending.pop(path, None)
+
+    def _load(self, path):
+        """Lê o arquivo, compartilha os arrays repetidos e guarda no cache"""
+        stamp = _file_stamp(path)
+        with open(path, 'rb') as f:
+            model_data = pickle.load(f)
+
+        with self.lock:
+            model_data = self._share(model_data)
+            self.entries[path] = (stamp, model_data)
+            self.entries.move_to_end(path)
+            while len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+        return stamp, model_data
+
+    def _share(self, value):
+        """Troca cada array por uma cópia única por conteúdo (só leitura)"""
+        if isinstance(value, dict):
+            return {key: self._share(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._share(item) for item in value]
+        if isinstance(value, tuple):
+            return tuple(self._share(item) for item in value)
+        if not isinstance(value, np.ndarray) or value.dtype == object:
+            return value
+
+        data = np.ascontiguousarray(value)
+        key = (data.dtype.str, data.shape, hashlib.sha1(data.view(np.uint8)).hexdigest())
+        shared = self.arrays.get(key)
+        if shared is not None:
+            self.shared_bytes += data.nbytes
+            return shared
+
+        data.setflags(write=False)
+        self.arrays[key] = data
+        return data
@@ -0,0 +1,686 @@
+"""
+Neuroevolução de topologias (estilo NEAT)
+
+A topologia das redes evolui junto com os pesos: começam mínimas (entradas
+ligadas direto às saídas) e ganham neurônios e conexões por mutação.
+- genomas guardados em arrays (uma posição por conexão, ordenados por inovação)
+- números de inovação globais para alinhar genes no cruzamento
+- especiação por distância de compatibilidade, com fitness compartilhado
+- fenótipos compilados em matrizes densas e avaliados em lote
+"""
+import numpy as np
+from game.config import *
+from game.sensors import resolve_feature_set
+from ai.neural_network import ACTIVATIONS, TRAINING_DTYPE, REPLAY_DTYPE
+from ai.population import Population, Agent
+from ai.simulation import run_generation
+
+
+class InnovationTracker:
+    """Numera conexões e neurônios novos de forma consistente entre genomas"""
+
+    def __init__(self, input_size, output_size):
+        self.connections = {}
+        self.splits = {}
+        self.next_innovation = 0
+        # Ids 0..entradas-1 são entradas, os seguintes são saídas
+        self.next_node = input_size + output_size
+
+    def connection(self, source, target):
+        """Inovação da conexão source → target (a mesma para todos os genomas)"""
+        key = (source, target)
+        if key not in self.connections:
+            self.connections[key] = self.next_innovation
+            self.next_innovation += 1
+        return self.connections[key]
+
+    def split(self, innovation):
+        """Id do neurônio criado ao dividir a conexão informada"""
+        if innovation not in self.splits:
+            self.splits[innovation] = self.next_node
+            self.next_node += 1
+        return self.splits[innovation]
+
+
+class NeatGenome:
+    """
+    Genoma em arrays paralelos
+    Neurônios (saídas + ocultos): node_ids, biases
+    Conexões (ordenadas por inovação): innovations, sources, targets, weights, enabled
+    """
+
+    def __init__(self, input_size, output_size, node_ids, biases,
+                 innovations, sources, targets, weights, enabled):
+        self.input_size = input_size
+        self.output_size = output_size
+        self.node_ids = np.asarray(node_ids, dtype=np.int64)
+        self.biases = np.asarray(biases, dtype=np.float64)
+        self.innovations = np.asarray(innovations, dtype=np.int64)
+        self.sources = np.asarray(sources, dtype=np.int64)
+        self.targets = np.asarray(targets, dtype=np.int64)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.enabled = np.asarray(enabled, dtype=bool)
+        self.fitness = 0.0
+
+    @classmethod
+    def minimal(cls, input_size, output_size, tracker):
+        """Genoma inicial: todas as entradas ligadas a todas as saídas"""
+        outputs = np.arange(input_size, input_size + output_size)
+        sources = np.repeat(np.arange(input_size), output_size)
+        targets = np.tile(outputs, input_size)
+        innovations = [tracker.connection(s, t) for s, t in zip(sources, targets)]
+        order = np.argsort(innovations)
+        return cls(input_size, output_size,
+                   node_ids=outputs,
+                   biases=np.random.randn(output_size) * 0.5,
+                   innovations=np.asarray(innovations)[order],
+                   sources=sources[order],
+                   targets=targets[order],
+                   weights=np.random.randn(len(sources)) * 0.5,
+                   enabled=np.ones(len(sources), dtype=bool))
+
+    def copy(self):
+        """Cópia independente do genoma"""
+        genome = NeatGenome(self.input_size, self.output_size,
+                            self.node_ids.copy(), self.biases.copy(),
+                            self.innovations.copy(), self.sources.copy(),
+                            self.targets.copy(), self.weights.copy(),
+                            self.enabled.copy())
+        genome.fitness = self.fitness
+        return genome
+
+    @property
+    def hidden_count(self):
+        """Número de neurônios ocultos"""
+        return len(self.node_ids) - self.output_size
+
+    def to_dict(self):
+        """Topologia serializável (os pesos das conexões ficam à parte)"""
+        return {
+            "node_ids": self.node_ids,
+            "biases": self.biases,
+            "innovations": self.innovations,
+            "sources": self.sources,
+            "targets": self.targets,
+            "enabled": self.enabled,
+        }
+
+    @classmethod
+    def from_dict(cls, input_size, output_size, topology, weights):
+        """Recria o genoma a partir de to_dict e dos pesos das conexões"""
+        return cls(input_size, output_size, topology["node_ids"], topology["biases"],
+                   topology["innovations"], topology["sources"], topology["targets"],
+                   weights, topology["enabled"])
+
+    def distance(self, other, excess_coefficient=1.0, weight_coefficient=0.4):
+        """
+        Distância de compatibilidade entre dois genomas
+        genes não pareados (disjuntos + excesso) + diferença média dos pesos pareados
+        """
+        _, mine, theirs = np.intersect1d(self.innovations, other.innovations,
+                                         assume_unique=True, return_indices=True)
+        matching = len(mine)
+        unmatched = len(self.innovations) + len(other.innovations) - 2 * matching
+        longest = max(len(self.innovations), len(other.innovations))
+        normalizer = longest if longest > 20 else 1
+
+        weight_difference = 0.0
+        if matching:
+            weight_difference = np.abs(self.weights[mine] - other.weights[theirs]).mean()
+
+        return excess_coefficient * unmatched / normalizer + weight_coefficient * weight_difference
+
+    def _add_connection_gene(self, innovation, source, target, weight):
+        """Insere uma conexão mantendo a ordem por inovação"""
+        position = np.searchsorted(self.innovations, innovation)
+        self.innovations = np.insert(self.innovations, position, innovation)
+        self.sources = np.insert(self.sources, position, source)
+        self.targets = np.insert(self.targets, position, target)
+        self.weights = np.insert(self.weights, position, weight)
+        self.enabled = np.insert(self.enabled, position, True)
+
+    def _reaches(self, start, goal):
+        """Verifica se existe caminho start → goal (evita ciclos)"""
+        stack = [start]
+        seen = set()
+        while stack:
+            node = stack.pop()
+            if node == goal:
+                return True
+            if node in seen:
+                continue
+            seen.add(node)
+            stack.extend(self.targets[self.sources == node].tolist())
+        return False
+
+    def mutate_add_connection(self, tracker, attempts=20):
+        """Liga dois neurônios ainda não conectados (apenas para frente)"""
+        hidden = self.node_ids[self.output_size:]
+        candidates_from = np.concatenate([np.arange(self.input_size), hidden])
+        candidates_to = self.node_ids
+
+        for _ in range(attempts):
+            source = int(candidates_from[np.random.randint(len(candidates_from))])
+            target = int(candidates_to[np.random.randint(len(candidates_to))])
+            if source == target:
+                continue
+
+            existing = np.flatnonzero((self.sources == source) & (self.targets == target))
+            if len(existing):
+                if not self.enabled[existing[0]]:
+                    self.enabled[existing[0]] = True
+                    return True
+                continue
+
+            if self._reaches(target, source):
+                continue
+
+            self._add_connection_gene(tracker.connection(source, target),
+                                      source, target, np.random.randn() * 0.5)
+            return True
+        return False
+
+    def mutate_add_node(self, tracker):
+        """Divide uma conexão ativa com um neurônio novo no meio"""
+        active = np.flatnonzero(self.enabled)
+        if not len(active):
+            return False
+
+        gene = active[np.random.randint(len(active))]
+        node = tracker.split(int(self.innovations[gene]))
+        if node in self.node_ids:
+            return False
+
+        source = int(self.sources[gene])
+        target = int(self.targets[gene])
+        weight = self.weights[gene]
+        self.enabled[gene] = False
+
+        self.node_ids = np.append(self.node_ids, node)
+        self.biases = np.append(self.biases, 0.0)
+        # Entrada com peso 1 e saída com o peso antigo: comportamento quase igual
+        self._add_connection_gene(tracker.connection(source, node), source, node, 1.0)
+        self._add_connection_gene(tracker.connection(node, target), node, target, weight)
+        return True
+
+    def mutate_weights(self, rate, strength, replace_rate=0.1):
+        """Perturba pesos e biases; uma fração pequena é sorteada de novo"""
+        for values in (self.weights, self.biases):
+            mutated = np.random.rand(len(values)) < rate
+            replaced = mutated & (np.random.rand(len(values)) < replace_rate)
+            values += np.where(mutated & ~replaced,
+                               np.random.randn(len(values)) * strength, 0.0)
+            values[replaced] = np.random.randn(int(replaced.sum())) * 0.5
+
+
+def crossover(fitter, other):
+    """
+    Cruzamento alinhado por inovação
+    Genes pareados vêm de qualquer um dos pais; os demais, do mais apto
+    """
+    child = fitter.copy()
+    child.fitness = 0.0
+
+    _, mine, theirs = np.intersect1d(fitter.innovations, other.innovations,
+                                     assume_unique=True, return_indices=True)
+    take_other = np.random.rand(len(mine)) < 0.5
+    child.weights[mine[take_other]] = other.weights[theirs[take_other]]
+
+    # Gene desativado em algum dos pais tem 75% de chance de continuar desativado
+    disabled = ~fitter.enabled[mine] | ~other.enabled[theirs]
+    child.enabled[mine] = ~(disabled & (np.random.rand(len(mine)) < 0.75))
+
+    _, mine, theirs = np.intersect1d(fitter.node_ids, other.node_ids,
+                                     assume_unique=True, return_indices=True)
+    take_other = np.random.rand(len(mine)) < 0.5
+    child.biases[mine[take_other]] = other.biases[theirs[take_other]]
+    return child
+
+
+def compile_genome(genome):
+    """
+    Compila o genoma em uma rede densa com neurônios ordenados por profundidade
+    Ocultos que não alcançam nenhuma saída são descartados
+    retorna: (pesos (N, N), biases (N), nível de cada neurônio, níveis ocultos)
+             índices: entradas, saídas, ocultos; nível 0 = entrada, -1 = saída
+    """
+    inputs, outputs = genome.input_size, genome.output_size
+    active = genome.enabled
+    sources = genome.sources[active].tolist()
+    targets = genome.targets[active].tolist()
+    weights = genome.weights[active]
+
+    # Neurônios úteis: os que chegam a alguma saída (busca reversa)
+    useful = set(range(inputs, inputs + outputs))
+    changed = True
+    while changed:
+        changed = False
+        for source, target in zip(sources, targets):
+            if target in useful and source not in useful:
+                useful.add(source)
+                changed = True
+
+    hidden = [int(node) for node in genome.node_ids[outputs:] if int(node) in useful]
+    index = {node: node for node in range(inputs + outputs)}
+    for i, node in enumerate(hidden):
+        index[node] = inputs + outputs + i
+    size = inputs + outputs + len(hidden)
+
+    bias_by_node = dict(zip(genome.node_ids.tolist(), genome.biases.tolist()))
+    matrix = np.zeros((size, size))
+    biases = np.zeros(size)
+    for node, position in index.items():
+        if node >= inputs:
+            biases[position] = bias_by_node[node]
+
+    incoming = {node: [] for node in hidden}
+    for source, target, weight in zip(sources, targets, weights):
+        if source in index and target in index:
+            matrix[index[source], index[target]] += weight
+            if target in incoming:
+                incoming[target].append(source)
+
+    # Nível = 1 + maior nível entre as entradas do neurônio (grafo acíclico)
+    levels = np.zeros(size, dtype=np.int64)
+    levels[inputs:inputs + outputs] = -1
+    depth = {node: 0 for node in range(inputs)}
+    pending = list(hidden)
+    while pending:
+        remaining = []
+        for node in pending:
+            parents = incoming[node]
+            if all(parent in depth for parent in parents):
+                depth[node] = 1 + max((depth[parent] for parent in parents), default=0)
+                levels[index[node]] = depth[node]
+            else:
+                remaining.append(node)
+        pending = remaining
+
+    return matrix, biases, levels, int(levels.max(initial=0))
+
+
+class NeatBatch:
+    """
+    Fenótipos de vários genomas avaliados em lote
+    As matrizes ficam preenchidas com zeros até o maior genoma da população;
+    cada nível de profundidade é uma multiplicação em lote
+    """
+
+    def __init__(self, phenotypes, input_size, output_size, activation='tanh',
+                 dtype=TRAINING_DTYPE):
+        """phenotypes: saídas de compile_genome, uma por agente"""
+        self.input_size = input_size
+        self.output_size = output_size
+        self.activation = ACTIVATIONS[activation]
+        self.dtype = np.dtype(dtype)
+
+        count = len(phenotypes)
+        size = max(matrix.shape[0] for matrix, _, _, _ in phenotypes)
+        self.depth = max(depth for _, _, _, depth in phenotypes)
+        self.weights = np.zeros((count, size, size), dtype=self.dtype)
+        self.biases = np.zeros((count, size), dtype=self.dtype)
+        # Preenchimento fica no nível 0 (nunca recalculado, sempre zero)
+        self.levels = np.zeros((count, size), dtype=np.int64)
+
+        for i, (matrix, biases, levels, _) in enumerate(phenotypes):
+            n = len(biases)
+            self.weights[i, :n, :n] = matrix
+            self.biases[i, :n] = biases
+            self.levels[i, :n] = levels
+
+    def logits(self, states, rows=None):
+        """Pré-ativação das saídas para vários agentes de uma vez"""
+        states = np.asarray(states, dtype=self.dtype)
+        if rows is None:
+            rows = slice(None)
+        weights = self.weights[rows]
+        biases = self.biases[rows]
+        levels = self.levels[rows]
+
+        values = np.zeros(biases.shape, dtype=self.dtype)
+        values[:, :self.input_size] = states
+        for level in range(1, self.depth + 1):
+            z = np.matmul(values[:, None, :], weights)[:, 0, :] + biases
+            values = np.where(levels == level, self.activation(z), values)
+
+        outputs = slice(self.input_size, self.input_size + self.output_size)
+        return np.matmul(values[:, None, :], weights[:, :, outputs])[:, 0, :] + biases[:, outputs]
+
+    def decide(self, states, rows=None):
+        """Saídas limiarizadas (sinal da pré-ativação) para vários agentes"""
+        return self.logits(states, rows) > 0
+
+
+class NeatNetwork:
+    """Fenótipo de um genoma NEAT com a mesma interface de NeuralNetwork"""
+
+    recurrent = False
+
+    def __init__(self, genome, activation='tanh', dtype=REPLAY_DTYPE, feature_set=None):
+        self.genome = genome
+        self.activation = activation
+        self.dtype = np.dtype(dtype)
+        self.input_size = genome.input_size
+        self.output_size = genome.output_size
+        self.feature_set = resolve_feature_set(feature_set, genome.input_size)
+        self._compile()
+
+    def _compile(self):
+        """(Re)compila o fenótipo depois de mudar o genoma"""
+        self.phenotype = compile_genome(self.genome)
+        self.hidden_size = len(self.phenotype[1]) - self.input_size - self.output_size
+        self._batch = NeatBatch([self.phenotype], self.input_size, self.output_size,
+                                self.activation, self.dtype)
+
+    @classmethod
+    def batch(cls, brains):
+        """Empilha fenótipos (topologias diferentes) para a inferência em lote"""
+        return NeatBatch([brain.phenotype for brain in brains],
+                         brains[0].input_size, brains[0].output_size,
+                         brains[0].activation, brains[0].dtype)
+
+    @classmethod
+    def from_model_data(cls, model_data, dtype=REPLAY_DTYPE):
+        """Recria a rede de um modelo salvo pelo NEAT"""
+        genome = NeatGenome.from_dict(model_data['input_size'], model_data['output_size'],
+                                      model_data['topology'], model_data['weights'])
+        return cls(genome, model_data.get('activation', 'tanh'), dtype,
+                   model_data.get('feature_set'))
+
+    def get_spec(self):
+        """Especificação gravada com o modelo (inclui a topologia)"""
+        return {
+            "input_size": self.input_size,
+            "feature_set": self.feature_set,
+            "hidden_size": self.hidden_size,
+            "output_size": self.output_size,
+            "activation": self.activation,
+            "topology": self.genome.to_dict(),
+        }
+
+    def reset_state(self):
+        """Fenótipos NEAT são só feedforward: não há memória para zerar"""
+
+    def count_connections(self):
+        """Conexões efetivamente usadas na inferência"""
+        return int(np.count_nonzero(self.phenotype[0]))
+
+    def logits(self, inputs):
+        """Pré-ativação das saídas (aceita um estado ou uma matriz de estados)"""
+        states = np.asarray(inputs, dtype=self.dtype)
+        single = states.ndim == 1
+        states = np.atleast_2d(states)
+        logits = self._batch.logits(states, np.zeros(len(states), dtype=np.int64))
+        return logits[0] if single else logits
+
+    def forward(self, inputs):
+        """Propagação forward (sigmoid nas saídas)"""
+        return 1 / (1 + np.exp(-np.clip(self.logits(inputs), -500, 500)))
+
+    def decide(self, inputs):
+        """Saídas limiarizadas: equivalente a forward(inputs) > 0.5"""
+        return self.logits(inputs) > 0
+
+    def get_weights(self):
+        """Pesos das conexões (na ordem das inovações)"""
+        return self.genome.weights.copy()
+
+    def set_weights(self, weights):
+        """Define os pesos das conexões"""
+        self.genome.weights = np.asarray(weights, dtype=np.float64).copy()
+        self._compile()
+
+    def copy(self):
+        """Cria uma cópia da rede"""
+        return NeatNetwork(self.genome.copy(), self.activation, self.dtype,
+                           self.feature_set)
+
+
+class Species:
+    """Grupo de genomas compatíveis entre si"""
+
+    def __init__(self, species_id, representative, generation):
+        self.id = species_id
+        self.representative = representative
+        self.members = []
+        self.best_fitness = -np.inf
+        self.last_improved = generation
+
+    def mean_fitness(self):
+        return float(np.mean([genome.fitness for genome in self.members]))
+
+
+class NeatEvolution:
+    """
+    Evolução de topologias com a mesma interface de EvolutionaryAlgorithm
+    (get_current_population, evolve, get_best_agent), mais run() headless
+    """
+
+    def __init__(self, population_size=POPULATION_SIZE, input_size=6, output_size=2,
+                 activation='tanh', compatibility_threshold=3.0, target_species=8,
+                 weight_rate=0.8, weight_strength=0.3, add_connection_rate=0.08,
+                 add_node_rate=0.03, crossover_rate=0.75, survival_ratio=0.2,
+                 stagnation=15, max_ticks=HEADLESS_MAX_TICKS,
+                 dtype=TRAINING_DTYPE, verbose=True, feature_set=None, config=None):
+        """
+        compatibility_threshold: distância máxima dentro de uma espécie
+                                 (ajustada para manter ~target_species espécies)
+        weight_rate/weight_strength: fração e força da mutação de pesos
+        add_connection_rate/add_node_rate: probabilidade das mutações estruturais
+        crossover_rate: chance de um filho ter dois pais
+        survival_ratio: fração de cada espécie que pode reproduzir
+        stagnation: gerações sem melhora até uma espécie ser extinta
+        max_ticks: limite de ticks por geração em run()
+        feature_set: conjunto de entradas dos sensores (game/sensors.py)
+        config: GameConfig dos jogos da população (game/settings.py; padrão: original)
+        """
+        if activation not in ACTIVATIONS:
+            raise ValueError(f"Ativação desconhecida: {activation}")
+
+        self.population_size = population_size
+        self.input_size = input_size
+        self.output_size = output_size
+        self.feature_set = resolve_feature_set(feature_set, input_size)
+        self.activation = activation
+        self.compatibility_threshold = compatibility_threshold
+        self.target_species = target_species
+        self.weight_rate = weight_rate
+        self.weight_strength = weight_strength
+        self.add_connection_rate = add_connection_rate
+        self.add_node_rate = add_node_rate
+        self.crossover_rate = crossover_rate
+        self.survival_ratio = survival_ratio
+        self.stagnation = stagnation
+        self.max_ticks = max_ticks
+        self.dtype = dtype
+        self.verbose = verbose
+        self.config = config
+
+        self.tracker = InnovationTracker(input_size, output_size)
+        self.genomes = [NeatGenome.minimal(input_size, output_size, self.tracker)
+                        for _ in range(population_size)]
+        self.species = []
+        self.next_species_id = 1
+        self.generation = 1
+        self.best_fitness_history = []
+        self.avg_fitness_history = []
+        self.species_history = []
+        self.best_genome = None
+
+        self._speciate()
+        self.population = self._build_population()
+
+        if verbose:
+            print(f"\n🧬 NEAT Inicializado:")
+            print(f"   População: {population_size}")
+            print(f"   Entradas/Saídas: {input_size}/{output_size} (ocultos: {activation})")
+            print(f"   Limiar de compatibilidade: {compatibility_threshold}\n")
+
+    def _build_population(self):
+        """População de agentes com os fenótipos dos genomas atuais"""
+        population = Population(0, self.input_size, 1, self.output_size, self.dtype,
+                                feature_set=self.feature_set, config=self.config)
+        population.agents = [Agent(NeatNetwork(genome, self.activation, self.dtype,
+                                               self.feature_set), self.config)
+                             for genome in self.genomes]
+        return population
+
+    def get_current_population(self):
+        """Retorna a população atual"""
+        return self.population
+
+    def get_best_agent(self):
+        """Retorna o melhor agente da geração atual"""
+        return max(self.population.agents, key=lambda x: x.get_fitness())
+
+    def _speciate(self):
+        """Distribui os genomas entre as espécies (representantes da geração anterior)"""
+        for species in self.species:
+            species.members = []
+
+        for genome in self.genomes:
+            for species in self.species:
+                if genome.distance(species.representative) < self.compatibility_threshold:
+                    species.members.append(genome)
+                    break
+            else:
+                species = Species(self.next_species_id, genome, self.generation)
+                species.members.append(genome)
+                self.species.append(species)
+                self.next_species_id += 1
+
+        self.species = [species for species in self.species if species.members]
+
+        # Ajusta o limiar (em passos proporcionais) para manter o número
+        # de espécies perto do alvo
+        if len(self.species) < self.target_species:
+            self.compatibility_threshold = max(0.1, self.compatibility_threshold * 0.95)
+        elif len(self.species) > self.target_species:
+            self.compatibility_threshold *= 1.05
+
+    def _offspring_counts(self, species_list):
+        """Filhos por espécie proporcionais ao fitness compartilhado (média)"""
+        shared = np.array([species.mean_fitness() for species in species_list])
+        shared = shared - shared.min() + 1e-6
+        quotas = shared / shared.sum() * self.population_size
+        counts = np.floor(quotas).astype(int)
+        # Maiores restos recebem o que faltar
+        for i in np.argsort(-(quotas - counts))[:self.population_size - counts.sum()]:
+            counts[i] += 1
+        return counts
+
+    def _reproduce(self, species, count):
+        """Gera count genomas a partir de uma espécie"""
+        members = sorted(species.members, key=lambda genome: genome.fitness, reverse=True)
+        children = []
+
+        # Campeão de espécies maiores passa intacto
+        if len(members) >= 5 and count > 0:
+            children.append(members[0].copy())
+
+        pool = members[:max(1, int(np.ceil(len(members) * self.survival_ratio)))]
+        while len(children) < count:
+            parent = pool[np.random.randint(len(pool))]
+            if len(pool) > 1 and np.random.rand() < self.crossover_rate:
+                mate = pool[np.random.randint(len(pool))]
+                fitter, other = ((parent, mate) if parent.fitness >= mate.fitness
+                                 else (mate, parent))
+                child = crossover(fitter, other)
+            else:
+                child = parent.copy()
+
+            child.mutate_weights(self.weight_rate, self.weight_strength)
+            if np.random.rand() < self.add_connection_rate:
+                child.mutate_add_connection(self.tracker)
+            if np.random.rand() < self.add_node_rate:
+                child.mutate_add_node(self.tracker)
+            children.append(child)
+
+        return children
+
+    def evolve(self):
+        """Cria a próxima geração a partir do fitness dos agentes atuais"""
+        for agent in self.population.agents:
+            agent.brain.genome.fitness = agent.get_fitness()
+
+        fitnesses = np.array([genome.fitness for genome in self.genomes])
+        best = self.genomes[int(np.argmax(fitnesses))]
+        if self.best_genome is None or best.fitness > self.best_genome.fitness:
+            self.best_genome = best.copy()
+
+        self.best_fitness_history.append(float(fitnesses.max()))
+        self.avg_fitness_history.append(float(fitnesses.mean()))
+        self.species_history.append(len(self.species))
+
+        # Estagnação: espécies sem melhora são extintas (a melhor sempre fica)
+        for species in self.species:
+            species_best = max(genome.fitness for genome in species.members)
+            if species_best > species.best_fitness:
+                species.best_fitness = species_best
+                species.last_improved = self.generation
+        ranked = sorted(self.species, key=lambda species: species.best_fitness, reverse=True)
+        survivors = [species for i, species in enumerate(ranked)
+                     if i == 0 or self.generation - species.last_improved <= self.stagnation]
+
+        if self.verbose:
+            hidden = [genome.hidden_count for genome in self.genomes]
+            print(f"Gen {self.generation:3d} | "
+                  f"Melhor: {fitnesses.max():7.0f} | "
+                  f"Média: {fitnesses.mean():7.0f} | "
+                  f"Espécies: {len(self.species):2d} | "
+                  f"Ocultos: {np.mean(hidden):4.1f} (máx {max(hidden)})")
+
+        children = []
+        for species, count in zip(survivors, self._offspring_counts(survivors)):
+            children.extend(self._reproduce(species, count))
+
+        # Representante de cada espécie: um membro sorteado da geração que acabou
+        for species in survivors:
+            species.representative = species.members[np.random.randint(len(species.members))]
+
+        self.species = survivors
+        self.genomes = children
+        self.generation += 1
+        self._speciate()
+        self.population = self._build_population()
+
+    def get_best_brain(self):
+        """Rede do melhor genoma já avaliado"""
+        if self.best_genome is None:
+            return None
+        return NeatNetwork(self.best_genome.copy(), self.activation,
+                           feature_set=self.feature_set)
+
+    def run(self, generations, session_manager=None, recorder=None, curriculum=None):
+        """
+        Executa gerações headless
+        session_manager: se informado, registra o melhor modelo na sessão atual
+        recorder: ReplayRecorder (ai/replay.py) para gravar as gerações
+        curriculum: CurriculumScheduler (ai/curriculum.py) que escolhe o percurso
+        retorna: rede do melhor genoma encontrado
+        """
+        try:
+            for _ in range(generations):
+                course = curriculum.course if curriculum is not None else None
+                ticks = run_generation(self.population, self.max_ticks,
+                                       recorder=recorder, course=course)
+                if curriculum is not None:
+                    level = curriculum.level
+                    if curriculum.update(ticks) != level:
+                        print(f"   📈 Currículo: nível {level} → {curriculum.level} "
+                              f"({ticks} ticks)")
+                generation = self.generation
+                self.evolve()
+
+                if session_manager is not None:
+                    session_manager.update_session(generation, self.best_genome.fitness,
+                                                   self.avg_fitness_history[-1],
+                                                   self.get_best_brain())
+        except KeyboardInterrupt:
+            print("\n⚠ Interrompido")
+
+        best = self.get_best_brain()
+        if best is not None and self.verbose:
+            print(f"\n🧠 Melhor rede: {best.hidden_size} ocultos, "
+                  f"{best.count_connections()} conexões")
+        return best
@@ -1,81 +1,354 @@
-"""Rede Neural Feedforward"""
+"""Rede Neural Feedforward (opcionalmente recorrente) definida por camadas"""
 import numpy as np
+from game.sensors import resolve_feature_set
+
+
+# float32 no treino (metade da banda de memória na inferência)
+# float64 para reproduzir modelos salvos bit a bit
+TRAINING_DTYPE = np.float32
+REPLAY_DTYPE = np.float64
+
+
+def relu(x):
+    """Função de ativação ReLU"""
+    return np.maximum(0, x)
+
+
+def sigmoid(x):
+    """Função de ativação Sigmoid"""
+    return 1 / (1 + np.exp(-np.clip(x, -500, 500)))
+
+
+def leaky_relu(x):
+    """ReLU com inclinação pequena para valores negativos"""
+    return np.where(x > 0, x, 0.01 * x)
+
+
+def linear(x):
+    """Sem ativação"""
+    return x
+
+
+# Ativações disponíveis para as camadas ocultas
+ACTIVATIONS = {
+    'relu': relu,
+    'leaky_relu': leaky_relu,
+    'tanh': np.tanh,
+    'sigmoid': sigmoid,
+    'linear': linear,
+}
+
+
+def normalize_layers(hidden_size, layers):
+    """
+    Especificação das camadas ocultas como lista de (neurônios, ativação)
+    Sem `layers`, usa a arquitetura clássica: uma camada relu de hidden_size
+    """
+    if layers is None:
+        layers = [(hidden_size, 'relu')]
+
+    normalized = []
+    for layer in layers:
+        size, activation = (layer, 'relu') if isinstance(layer, int) else layer
+        if activation not in ACTIVATIONS:
+            available = ", ".join(sorted(ACTIVATIONS))
+            raise ValueError(f"Ativação desconhecida: {activation} (disponíveis: {available})")
+        normalized.append((int(size), activation))
+
+    if not normalized:
+        raise ValueError("A rede precisa de pelo menos uma camada oculta")
+    return normalized
+
+
+def genome_layout(input_size, output_size, layers, recurrent=False):
+    """
+    Layout do genoma calculado a partir da especificação
+    retorna: lista de (nome, forma) na ordem em que os genes são guardados
+    A ordem da rede clássica (W0, b0, W1, b1) é a mesma dos modelos antigos;
+    a matriz recorrente vai no final para não deslocar os demais genes
+    """
+    sizes = [input_size] + [size for size, _ in layers] + [output_size]
+    layout = []
+    for i in range(len(sizes) - 1):
+        layout.append((f"W{i}", (sizes[i], sizes[i + 1])))
+        layout.append((f"b{i}", (sizes[i + 1],)))
+    if recurrent:
+        layout.append(("R", (sizes[1], sizes[1])))
+    return layout
+
+
+def genome_size(input_size, output_size, layers, recurrent=False):
+    """Número total de genes para a especificação"""
+    return sum(int(np.prod(shape)) for _, shape in
+               genome_layout(input_size, output_size, layers, recurrent))
+
+
+def make_spec(input_size, output_size, layers, recurrent=False, feature_set=None):
+    """
+    Especificação serializável da arquitetura (gravada junto com os modelos)
+    feature_set: conjunto de entradas dos sensores (game/sensors.py)
+    """
+    return {
+        "input_size": input_size,
+        "feature_set": resolve_feature_set(feature_set, input_size),
+        "hidden_size": layers[0][0],
+        "output_size": output_size,
+        "layers": [list(layer) for layer in layers],
+        "recurrent": recurrent,
+    }
+
+
+def describe_spec(spec):
+    """Texto curto da arquitetura para os logs, ex: 6-16(tanh)-8-2 recorrente"""
+    layers = normalize_layers(spec.get('hidden_size'), spec.get('layers'))
+    hidden = [str(size) if activation == 'relu' else f"{size}({activation})"
+              for size, activation in layers]
+    text = "-".join([str(spec['input_size'])] + hidden + [str(spec['output_size'])])
+    return text + (" recorrente" if spec.get('recurrent') else "")
+
+
+def load_brain(model_data, dtype=REPLAY_DTYPE):
+    """Recria a rede de um modelo salvo: arquitetura fixa ou topologia NEAT"""
+    if 'topology' in model_data:
+        from ai.neat import NeatNetwork
+        return NeatNetwork.from_model_data(model_data, dtype)
+    return NeuralNetwork.from_model_data(model_data, dtype)
 
 
 class NeuralNetwork:
-    def __init__(self, input_size, hidden_size, output_size):
+    def __init__(self, input_size, hidden_size, output_size, dtype=REPLAY_DTYPE,
+                 layers=None, recurrent=False, feature_set=None):
         """
         Inicializa a rede neural
         input_size: número de entradas
-        hidden_size: número de neurônios na camada oculta
+        hidden_size: número de neurônios na camada oculta (rede clássica)
         output_size: número de saídas
+        dtype: tipo de ponto flutuante dos pesos e ativações
+               (float64, float32 ou float16)
+        layers: camadas ocultas [(neurônios, ativação), ...]; substitui hidden_size
+        recurrent: a primeira camada oculta recebe a própria ativação do
+                   tick anterior (memória de curto prazo)
+        feature_set: conjunto de entradas (padrão: o original com input_size entradas)
         """
+        self.layers = normalize_layers(hidden_size, layers)
         self.input_size = input_size
-        self.hidden_size = hidden_size
+        self.feature_set = resolve_feature_set(feature_set, input_size)
+        self.hidden_size = self.layers[0][0]
         self.output_size = output_size
-        
-        # Inicialização aleatória dos pesos
-        self.weights1 = np.random.randn(input_size, hidden_size) * 0.5
-        self.bias1 = np.random.randn(hidden_size) * 0.5
-        
-        self.weights2 = np.random.randn(hidden_size, output_size) * 0.5
-        self.bias2 = np.random.randn(output_size) * 0.5
-        
+        self.recurrent = recurrent
+        self.dtype = np.dtype(dtype)
+        self.layout = genome_layout(input_size, output_size, self.layers, recurrent)
+        self.activations = [ACTIVATIONS[activation] for _, activation in self.layers]
+
+        # Inicialização aleatória dos pesos (mesma ordem de sorteio da rede clássica)
+        self.weights = []
+        self.biases = []
+        self.recurrent_weights = None
+        for name, shape in self.layout:
+            values = (np.random.randn(*shape) * 0.5).astype(self.dtype)
+            self._store(name, values)
+
+        self.reset_state()
+
+    def _store(self, name, values):
+        """Guarda um bloco do genoma no lugar correspondente"""
+        if name == "R":
+            self.recurrent_weights = values
+            return
+        index = int(name[1:])
+        target = self.weights if name[0] == "W" else self.biases
+        if index < len(target):
+            target[index] = values
+        else:
+            target.append(values)
+
+    # Compatibilidade com a rede clássica de uma camada oculta
+    @property
+    def weights1(self):
+        return self.weights[0]
+
+    @property
+    def bias1(self):
+        return self.biases[0]
+
+    @property
+    def weights2(self):
+        return self.weights[-1]
+
+    @property
+    def bias2(self):
+        return self.biases[-1]
+
+    def get_spec(self):
+        """Especificação da arquitetura (gravada junto com os modelos)"""
+        return make_spec(self.input_size, self.output_size, self.layers,
+                         self.recurrent, self.feature_set)
+
+    @classmethod
+    def from_spec(cls, spec, dtype=REPLAY_DTYPE):
+        """Cria uma rede (pesos aleatórios) a partir de get_spec ou de um modelo salvo"""
+        return cls(spec['input_size'], spec.get('hidden_size'), spec['output_size'],
+                   dtype=dtype, layers=spec.get('layers'),
+                   recurrent=spec.get('recurrent', False),
+                   feature_set=spec.get('feature_set'))
+
+    @classmethod
+    def from_model_data(cls, model_data, dtype=REPLAY_DTYPE):
+        """Recria a rede de um modelo salvo (aceita modelos antigos sem 'layers')"""
+        brain = cls.from_spec(model_data, dtype)
+        brain.set_weights(model_data['weights'])
+        return brain
+
+    @classmethod
+    def batch(cls, brains):
+        """Empilha redes de mesma arquitetura para a inferência em lote"""
+        genomes = np.stack([brain.get_weights() for brain in brains])
+        return BatchedNetworks(genomes, brains[0].get_spec(), brains[0].dtype)
+
+    def reset_state(self):
+        """Zera a memória recorrente (início de cada partida)"""
+        self.state = np.zeros(self.hidden_size, dtype=self.dtype) if self.recurrent else None
+
     def relu(self, x):
         """Função de ativação ReLU"""
-        return np.maximum(0, x)
-        
+        return relu(x)
+
     def sigmoid(self, x):
         """Função de ativação Sigmoid"""
-        return 1 / (1 + np.exp(-np.clip(x, -500, 500)))
-        
+        return sigmoid(x)
+
+    def logits(self, inputs):
+        """
+        Saída da rede ANTES da sigmoid (pré-ativação da camada de saída)
+        inputs: array de entrada
+        """
+        x = np.asarray(inputs, dtype=self.dtype)
+
+        # Camadas ocultas
+        for i, activation in enumerate(self.activations):
+            z = np.dot(x, self.weights[i]) + self.biases[i]
+            if i == 0 and self.recurrent:
+                z = z + np.dot(self.state, self.recurrent_weights)
+                x = activation(z)
+                self.state = x
+            else:
+                x = activation(z)
+
+        # Camada de saída (sem ativação)
+        return np.dot(x, self.weights[-1]) + self.biases[-1]
+
     def forward(self, inputs):
         """
         Propagação forward
         inputs: array de entrada
         retorna: array de saída
         """
-        # Camada oculta
-        hidden = self.relu(np.dot(inputs, self.weights1) + self.bias1)
-        
-        # Camada de saída
-        output = self.sigmoid(np.dot(hidden, self.weights2) + self.bias2)
-        
-        return output
-        
+        return self.sigmoid(self.logits(inputs))
+
+    def decide(self, inputs):
+        """
+        Saídas limiarizadas: equivalente a forward(inputs) > 0.5
+        sigmoid(x) > 0.5 exatamente quando x > 0, então basta o sinal
+        da pré-ativação (sem clip nem exp no caminho quente)
+        retorna: array de booleanos
+        """
+        return self.logits(inputs) > 0
+
     def get_weights(self):
         """Retorna todos os pesos em um único array"""
-        return np.concatenate([
-            self.weights1.flatten(),
-            self.bias1.flatten(),
-            self.weights2.flatten(),
-            self.bias2.flatten()
-        ])
-        
+        blocks = []
+        for i in range(len(self.weights)):
+            blocks.append(self.weights[i].flatten())
+            blocks.append(self.biases[i].flatten())
+        if self.recurrent:
+            blocks.append(self.recurrent_weights.flatten())
+        return np.concatenate(blocks)
+
     def set_weights(self, weights):
-        """Define os pesos a partir de um array"""
+        """Define os pesos a partir de um array (layout de genome_layout)"""
+        weights = np.asarray(weights, dtype=self.dtype)
         idx = 0
-        
-        # Weights1
-        size = self.input_size * self.hidden_size
-        self.weights1 = weights[idx:idx+size].reshape(self.input_size, self.hidden_size)
-        idx += size
-        
-        # Bias1
-        size = self.hidden_size
-        self.bias1 = weights[idx:idx+size]
-        idx += size
-        
-        # Weights2
-        size = self.hidden_size * self.output_size
-        self.weights2 = weights[idx:idx+size].reshape(self.hidden_size, self.output_size)
-        idx += size
-        
-        # Bias2
-        self.bias2 = weights[idx:]
-        
+
+        for name, shape in self.layout:
+            size = int(np.prod(shape))
+            self._store(name, weights[idx:idx+size].reshape(shape))
+            idx += size
+
+        if idx != len(weights):
+            raise ValueError(f"Genoma com {len(weights)} genes, "
+                             f"a arquitetura espera {idx}")
+
     def copy(self):
         """Cria uma cópia da rede neural"""
-        new_nn = NeuralNetwork(self.input_size, self.hidden_size, self.output_size)
+        new_nn = NeuralNetwork(self.input_size, self.hidden_size, self.output_size,
+                               dtype=self.dtype, layers=self.layers,
+                               recurrent=self.recurrent, feature_set=self.feature_set)
         new_nn.set_weights(self.get_weights().copy())
         return new_nn
+
+
+class BatchedNetworks:
+    """
+    População inteira de redes com a mesma arquitetura avaliada em lote
+    Os pesos de cada camada ficam empilhados (agentes, entrada, saída) e
+    uma única multiplicação em lote decide por todos os agentes do tick
+    """
+
+    def __init__(self, genomes, spec, dtype=TRAINING_DTYPE):
+        """
+        genomes: matriz (agentes, genes) no layout de genome_layout
+        spec: especificação (NeuralNetwork.get_spec)
+        """
+        self.dtype = np.dtype(dtype)
+        self.layers = normalize_layers(spec.get('hidden_size'), spec.get('layers'))
+        self.recurrent = spec.get('recurrent', False)
+        self.activations = [ACTIVATIONS[activation] for _, activation in self.layers]
+        layout = genome_layout(spec['input_size'], spec['output_size'],
+                               self.layers, self.recurrent)
+
+        genomes = np.asarray(genomes, dtype=self.dtype)
+        count = len(genomes)
+        self.weights = []
+        self.biases = []
+        self.recurrent_weights = None
+
+        idx = 0
+        for name, shape in layout:
+            size = int(np.prod(shape))
+            block = genomes[:, idx:idx+size].reshape((count,) + shape)
+            idx += size
+            if name == "R":
+                self.recurrent_weights = block
+            elif name[0] == "W":
+                self.weights.append(block)
+            else:
+                self.biases.append(block)
+
+        self.state = (np.zeros((count, self.layers[0][0]), dtype=self.dtype)
+                      if self.recurrent else None)
+
+    def logits(self, states, rows=None):
+        """
+        Pré-ativação da saída para vários agentes de uma vez
+        states: matriz (n, entradas), um estado por agente
+        rows: índices dos agentes correspondentes (padrão: todos)
+        """
+        x = np.asarray(states, dtype=self.dtype)
+        if rows is None:
+            rows = slice(None)
+
+        for i, activation in enumerate(self.activations):
+            z = np.matmul(x[:, None, :], self.weights[i][rows])[:, 0, :] + self.biases[i][rows]
+            if i == 0 and self.recurrent:
+                z = z + np.matmul(self.state[rows][:, None, :],
+                                  self.recurrent_weights[rows])[:, 0, :]
+                x = activation(z)
+                self.state[rows] = x
+            else:
+                x = activation(z)
+
+        return np.matmul(x[:, None, :], self.weights[-1][rows])[:, 0, :] + self.biases[-1][rows]
+
+    def decide(self, states, rows=None):
+        """Saídas limiarizadas (sinal da pré-ativação) para vários agentes"""
+        return self.logits(states, rows) > 0
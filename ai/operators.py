@@ -0,0 +1,237 @@
+"""
+Operadores genéticos vetorizados
+
+Cada operador trabalha sobre a população inteira de uma vez:
+a matriz de genomas (um indivíduo por linha) e o vetor de fitness.
+Os operadores ficam em registros por tipo e são escolhidos pelo nome.
+"""
+import numpy as np
+
+
+# Faixas da estratégia conservadora: (proporção da população, genes mutados, força)
+# A última faixa completa o que faltar da população
+MUTATION_TIERS = (
+    (0.6, 0.1, 0.15),
+    (0.25, 0.25, 0.3),
+    (0.15, 0.4, 0.5),
+)
+
+
+def _is_tier(value):
+    """Três números (proporção, genes mutados, força)?"""
+    return (isinstance(value, (list, tuple)) and len(value) == 3 and
+            all(isinstance(item, (int, float)) and not isinstance(item, bool)
+                for item in value))
+
+
+def is_tier_list(value):
+    """Lista de faixas de mutação (e não uma lista de opções de faixas)?"""
+    return isinstance(value, (list, tuple)) and bool(value) and all(map(_is_tier, value))
+
+
+def validate_tiers(tiers):
+    """
+    Confere faixas de mutação no formato de MUTATION_TIERS
+    retorna: tupla de tuplas (aceita listas, ex: lidas de JSON/TOML)
+    """
+    if not isinstance(tiers, (list, tuple)) or not tiers:
+        raise ValueError(f"Faixas de mutação inválidas: {tiers!r} "
+                         "(use uma lista de (proporção, genes mutados, força))")
+    for tier in tiers:
+        if not _is_tier(tier):
+            raise ValueError(f"Faixa de mutação inválida: {tier!r} "
+                             "(use proporção, genes mutados, força)")
+    tiers = tuple(tuple(tier) for tier in tiers)
+    for tier in tiers:
+        proportion, rate, strength = tier
+        if not (0 <= proportion <= 1 and 0 <= rate <= 1 and strength >= 0):
+            raise ValueError(f"Faixa de mutação fora dos limites: {tier}")
+    return tiers
+
+SELECTION = {}
+CROSSOVER = {}
+MUTATION = {}
+REPLACEMENT = {}
+
+OPERATORS = {
+    'selection': SELECTION,
+    'crossover': CROSSOVER,
+    'mutation': MUTATION,
+    'replacement': REPLACEMENT,
+}
+
+
+def register_operator(kind, name):
+    """Decorador que registra um operador no registro do tipo informado"""
+    registry = OPERATORS[kind]
+
+    def decorator(func):
+        registry[name] = func
+        return func
+
+    return decorator
+
+
+def get_operator(kind, name):
+    """Busca um operador pelo tipo e nome"""
+    if kind not in OPERATORS:
+        raise ValueError(f"Tipo de operador desconhecido: {kind}")
+    if name not in OPERATORS[kind]:
+        available = ", ".join(sorted(OPERATORS[kind]))
+        raise ValueError(f"Operador de {kind} desconhecido: {name} "
+                         f"(disponíveis: {available})")
+    return OPERATORS[kind][name]
+
+
+# ===== SELEÇÃO =====
+# (fitnesses, count) -> índices dos pais escolhidos
+
+@register_operator('selection', 'roulette')
+def roulette_selection(fitnesses, count):
+    """
+    Seleção proporcional ao fitness (Roulette Wheel Selection)
+    Indivíduos com maior fitness têm maior chance de serem selecionados
+    """
+    # Evita fitness negativo e adiciona offset
+    adjusted = fitnesses - fitnesses.min() + 1
+    probabilities = adjusted / adjusted.sum()
+    return np.random.choice(len(fitnesses), size=count, p=probabilities)
+
+
+@register_operator('selection', 'tournament')
+def tournament_selection(fitnesses, count, tournament_size=5):
+    """
+    Seleção por torneio (alternativa mais agressiva)
+    Cada linha sorteia tournament_size competidores e fica com o melhor
+    """
+    tournament_size = max(1, min(tournament_size, len(fitnesses)))
+    contenders = np.random.randint(0, len(fitnesses), size=(count, tournament_size))
+    winners = np.argmax(fitnesses[contenders], axis=1)
+    return contenders[np.arange(count), winners]
+
+
+@register_operator('selection', 'truncation')
+def truncation_selection(fitnesses, count, truncation_ratio=0.2):
+    """Sorteio uniforme entre os melhores truncation_ratio da população"""
+    top = max(1, int(len(fitnesses) * truncation_ratio))
+    ranked = np.argsort(-fitnesses, kind='stable')[:top]
+    return ranked[np.random.randint(0, top, size=count)]
+
+
+# ===== CRUZAMENTO =====
+# (pais_a, pais_b) -> filhos, todos com forma (n, genes)
+
+@register_operator('crossover', 'none')
+def no_crossover(parents_a, parents_b):
+    """Sem cruzamento: filhos são cópias do primeiro pai"""
+    return parents_a.copy()
+
+
+@register_operator('crossover', 'uniform')
+def uniform_crossover(parents_a, parents_b):
+    """Crossover uniforme: cada gene vem aleatoriamente de um dos pais"""
+    mask = np.random.rand(*parents_a.shape) < 0.5
+    return np.where(mask, parents_a, parents_b)
+
+
+@register_operator('crossover', 'single_point')
+def single_point_crossover(parents_a, parents_b):
+    """Crossover de ponto único (um ponto sorteado por filho)"""
+    count, genes = parents_a.shape
+    points = np.random.randint(1, genes, size=(count, 1))
+    mask = np.arange(genes) < points
+    return np.where(mask, parents_a, parents_b)
+
+
+@register_operator('crossover', 'two_point')
+def two_point_crossover(parents_a, parents_b):
+    """Crossover de dois pontos: o trecho do meio vem do segundo pai"""
+    count, genes = parents_a.shape
+    point1 = np.random.randint(0, genes // 2, size=(count, 1))
+    point2 = np.random.randint(genes // 2, genes, size=(count, 1))
+    gene_idx = np.arange(genes)
+    mask = (gene_idx < point1) | (gene_idx >= point2)
+    return np.where(mask, parents_a, parents_b)
+
+
+@register_operator('crossover', 'average')
+def average_crossover(parents_a, parents_b):
+    """Média ponderada (blend crossover)"""
+    alpha = np.random.uniform(0.3, 0.7, size=(len(parents_a), 1))
+    return alpha * parents_a + (1 - alpha) * parents_b
+
+
+@register_operator('crossover', 'mixed')
+def mixed_crossover(parents_a, parents_b):
+    """Cada filho usa um dos métodos acima, sorteado"""
+    methods = (uniform_crossover, single_point_crossover,
+               two_point_crossover, average_crossover)
+    choice = np.random.randint(0, len(methods), size=len(parents_a))
+
+    children = np.empty_like(parents_a)
+    for i, method in enumerate(methods):
+        rows = choice == i
+        if rows.any():
+            children[rows] = method(parents_a[rows], parents_b[rows])
+    return children
+
+
+# ===== MUTAÇÃO =====
+# (genomas, rate, strength) -> genomas mutados
+
+@register_operator('mutation', 'gaussian')
+def gaussian_mutation(genomes, rate, strength):
+    """
+    Mutação gaussiana com a taxa e força atuais do algoritmo
+    Também aceita um único genoma (vetor 1D)
+    """
+    mutation_mask = np.random.rand(*genomes.shape) < rate
+    mutations = np.random.randn(*genomes.shape) * strength
+    return genomes + mutation_mask * mutations
+
+
+@register_operator('mutation', 'tiered')
+def tiered_mutation(genomes, rate, strength, tiers=MUTATION_TIERS):
+    """
+    Faixas da estratégia conservadora, linha a linha
+    Ignora rate/strength: cada faixa tem a sua taxa e força
+    tiers: faixas (proporção, genes mutados, força), ver MUTATION_TIERS
+    """
+    count = len(genomes)
+    rates = np.empty((count, 1))
+    strengths = np.empty((count, 1))
+
+    start = 0
+    for i, (proportion, tier_rate, tier_strength) in enumerate(tiers):
+        end = count if i == len(tiers) - 1 else start + int(count * proportion)
+        rates[start:end] = tier_rate
+        strengths[start:end] = tier_strength
+        start = end
+
+    mutation_mask = np.random.rand(*genomes.shape) < rates
+    mutations = np.random.randn(*genomes.shape) * strengths
+    return genomes + mutation_mask * mutations
+
+
+# ===== SUBSTITUIÇÃO =====
+# (genomas, fitnesses, filhos, elite_count) -> nova matriz com o mesmo tamanho
+
+@register_operator('replacement', 'elitist')
+def elitist_replacement(genomes, fitnesses, children, elite_count):
+    """Os elite_count melhores passam intactos, filhos completam a população"""
+    elite = genomes[np.argsort(-fitnesses, kind='stable')[:elite_count]]
+    return np.concatenate([elite, children[:len(genomes) - len(elite)]])
+
+
+@register_operator('replacement', 'replace_worst')
+def replace_worst_replacement(genomes, fitnesses, children, elite_count,
+                              replacement_ratio=0.5):
+    """
+    Substitui apenas os piores replacement_ratio da população pelos filhos
+    (nunca toca na elite)
+    """
+    population_size = len(genomes)
+    replaced = int(population_size * replacement_ratio)
+    replaced = min(replaced, population_size - elite_count)
+    survivors = genomes[np.argsort(-fitnesses, kind='stable')[:population_size - replaced]]
+    return np.concatenate([survivors, children[:replaced]])
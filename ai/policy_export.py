@@ -0,0 +1,358 @@
+"""
+Exportação de políticas compiladas
+
+Congela uma NeuralNetwork treinada em:
+- uma tabela de consulta quantizada sobre uma grade discreta de estados
+- uma função Python de aritmética pura (pesos desenrolados como constantes)
+Ambas rodam sem NumPy por frame, para máquinas fracas (quiosques de demo).
+"""
+import numpy as np
+from game.config import *
+from game.dino import Dino
+from game.engine import GameEngine
+from ai.population import ACTION_STAND, ACTION_JUMP, ACTION_DUCK
+from game.sensors import get_feature_set, sense
+
+
+# Grade padrão por entrada dos sensores: (mínimo, máximo, divisões)
+# no_chao usa (-0.5, 1.5, 2) para que os centros das divisões sejam 0 e 1
+FEATURE_GRID = {
+    'distancia': (-0.1, 1.1, 96),
+    'altura': (0.395, 0.715, 8),
+    'largura': (0.195, 0.355, 4),
+    'y': (0.4, 0.82, 12),
+    'velocidade': (0.04, 0.96, 16),
+    'no_chao': (-0.5, 1.5, 2),
+}
+
+
+def default_grid(feature_set):
+    """Grade padrão para um conjunto de entradas (game/sensors.py)"""
+    names = get_feature_set(feature_set).names
+    missing = [name for name in names if name not in FEATURE_GRID]
+    if missing:
+        raise ValueError(f"Sem grade padrão para as entradas: {', '.join(missing)}")
+    return tuple(FEATURE_GRID[name] for name in names)
+
+
+ACTION_NAMES = {ACTION_STAND: "em pé", ACTION_JUMP: "pular", ACTION_DUCK: "abaixar"}
+
+
+def actions_from_decisions(decisions):
+    """Converte saídas limiarizadas (pular, abaixar) em códigos de ação"""
+    decisions = np.atleast_2d(decisions)
+    return np.where(decisions[:, 0], ACTION_JUMP,
+                    np.where(decisions[:, 1], ACTION_DUCK, ACTION_STAND)).astype(np.uint8)
+
+
+class CompiledPolicy:
+    """Política em tabela: estado → divisão da grade → ação, em Python puro"""
+
+    def __init__(self, grid, table, idle_state, idle_action):
+        """
+        grid: (mínimo, máximo, divisões) por entrada
+        table: ações (uint8) na ordem C da grade
+        idle_state/idle_action: estado sem obstáculo e sua ação exata
+        """
+        self.grid = tuple(tuple(feature) for feature in grid)
+        self.table = np.asarray(table, dtype=np.uint8)
+        self.idle_state = list(idle_state)
+        self.idle_action = int(idle_action)
+
+        # Pré-calcula tudo que act() precisa como tipos Python nativos
+        self._lows = [float(low) for low, _, _ in self.grid]
+        self._scales = [bins / (high - low) for low, high, bins in self.grid]
+        self._last = [bins - 1 for _, _, bins in self.grid]
+        strides = []
+        stride = 1
+        for _, _, bins in reversed(self.grid):
+            strides.append(stride)
+            stride *= bins
+        self._strides = strides[::-1]
+        self._features = list(zip(self._lows, self._scales, self._last, self._strides))
+        self._table_bytes = self.table.tobytes()
+
+    def act(self, inputs):
+        """Retorna o código da ação para um estado (sem NumPy)"""
+        if inputs == self.idle_state:
+            return self.idle_action
+
+        index = 0
+        for value, (low, scale, last, stride) in zip(inputs, self._features):
+            i = int((value - low) * scale)
+            if i < 0:
+                i = 0
+            elif i > last:
+                i = last
+            index += i * stride
+        return self._table_bytes[index]
+
+    def act_batch(self, states):
+        """Versão vetorizada de act para uma matriz de estados"""
+        states = np.asarray(states, dtype=np.float64)
+        index = np.zeros(len(states), dtype=np.int64)
+        for column, (low, scale, last, stride) in enumerate(self._features):
+            i = np.clip(((states[:, column] - low) * scale).astype(np.int64), 0, last)
+            index += i * stride
+
+        actions = self.table[index]
+        idle = np.all(states == np.asarray(self.idle_state), axis=1)
+        actions[idle] = self.idle_action
+        return actions
+
+    def to_dict(self):
+        """Representação serializável (pickle)"""
+        return {
+            "grid": self.grid,
+            "table": self.table,
+            "idle_state": self.idle_state,
+            "idle_action": self.idle_action,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Recria a política a partir de to_dict"""
+        return cls(data["grid"], data["table"], data["idle_state"], data["idle_action"])
+
+
+def compile_policy(brain, grid=None, chunk_size=65536):
+    """
+    Compila a rede em uma tabela avaliando o centro de cada divisão da grade
+    chunk_size: estados avaliados por lote (limita a memória)
+    """
+    if brain.recurrent:
+        raise ValueError("Redes recorrentes dependem do histórico e não cabem em uma tabela")
+
+    grid = tuple(grid or default_grid(brain.feature_set))
+    if len(grid) != brain.input_size:
+        raise ValueError(f"Grade com {len(grid)} entradas para rede com "
+                         f"{brain.input_size} entradas")
+
+    centers = [low + (np.arange(bins) + 0.5) * (high - low) / bins
+               for low, high, bins in grid]
+    shape = tuple(bins for _, _, bins in grid)
+    total = int(np.prod(shape))
+
+    table = np.empty(total, dtype=np.uint8)
+    for start in range(0, total, chunk_size):
+        flat = np.arange(start, min(start + chunk_size, total))
+        coords = np.unravel_index(flat, shape)
+        states = np.stack([centers[i][coords[i]] for i in range(len(grid))], axis=1)
+        table[start:start + len(flat)] = actions_from_decisions(brain.decide(states))
+
+    # Estado sem obstáculo à frente (fora da grade): ação exata da rede
+    idle_state = list(get_feature_set(brain.feature_set).idle)
+    idle_action = actions_from_decisions(brain.decide(idle_state))[0]
+
+    return CompiledPolicy(grid, table, idle_state, idle_action)
+
+
+# Ativação de um neurônio oculto no código gerado (nome da variável → linhas)
+ACTIVATION_SOURCE = {
+    'relu': lambda h: [f"    if {h} < 0.0:", f"        {h} = 0.0"],
+    'leaky_relu': lambda h: [f"    if {h} < 0.0:", f"        {h} = 0.01 * {h}"],
+    'tanh': lambda h: [f"    {h} = math.tanh({h})"],
+    'sigmoid': lambda h: [f"    {h} = 1.0 / (1.0 + math.exp(-max(-500.0, min(500.0, {h}))))"],
+    'linear': lambda h: [],
+}
+
+
+def _layered_source(brain, inputs):
+    """Linhas da rede em camadas: um bloco de neurônios por camada oculta"""
+    lines = []
+    previous = inputs
+    for layer, (size, activation) in enumerate(brain.layers):
+        # Floats nativos: repr exato e sem depender do NumPy no código gerado
+        w = np.asarray(brain.weights[layer], dtype=np.float64).tolist()
+        b = np.asarray(brain.biases[layer], dtype=np.float64).tolist()
+        names = [f"h{layer}_{j}" for j in range(size)]
+        for j, name in enumerate(names):
+            terms = " + ".join(f"{w[i][j]!r} * {x}" for i, x in enumerate(previous))
+            lines.append(f"    {name} = {terms} + {b[j]!r}")
+            lines += ACTIVATION_SOURCE[activation](name)
+        previous = names
+
+    w = np.asarray(brain.weights[-1], dtype=np.float64).tolist()
+    b = np.asarray(brain.biases[-1], dtype=np.float64).tolist()
+    for k in range(brain.output_size):
+        terms = " + ".join(f"{w[j][k]!r} * {h}" for j, h in enumerate(previous))
+        lines.append(f"    o{k} = {terms} + {b[k]!r}")
+    return lines
+
+
+def _graph_source(brain, inputs):
+    """Linhas de um fenótipo NEAT: só as conexões que existem, em ordem de nível"""
+    matrix, biases, levels, _ = brain.phenotype
+    matrix = np.asarray(matrix, dtype=np.float64)
+    first_output = brain.input_size
+    first_hidden = brain.input_size + brain.output_size
+
+    names = {i: name for i, name in enumerate(inputs)}
+    for k in range(brain.output_size):
+        names[first_output + k] = f"o{k}"
+    for j in range(first_hidden, len(biases)):
+        names[j] = f"h{j - first_hidden}"
+
+    def assignment(node):
+        sources = np.flatnonzero(matrix[:, node])
+        terms = "".join(f"{matrix[i, node].tolist()!r} * {names[i]} + " for i in sources)
+        return f"    {names[node]} = {terms}{biases[node].tolist()!r}"
+
+    lines = []
+    hidden = sorted(range(first_hidden, len(biases)), key=lambda node: levels[node])
+    for node in hidden:
+        lines.append(assignment(node))
+        lines += ACTIVATION_SOURCE[brain.activation](names[node])
+    for k in range(brain.output_size):
+        lines.append(assignment(first_output + k))
+    return lines
+
+
+def export_python_source(brain, function_name="decide"):
+    """
+    Gera o código-fonte de uma função de aritmética pura equivalente à rede
+    (ativações das camadas ocultas, sinal da pré-ativação na saída).
+    Aceita redes em camadas e fenótipos NEAT. Retorna uma string.
+    """
+    if brain.recurrent:
+        raise ValueError("Redes recorrentes não podem ser exportadas como função pura")
+
+    inputs = [f"s{i}" for i in range(brain.input_size)]
+
+    lines = [
+        '"""Política compilada (gerada por ai/policy_export.py) - não editar"""',
+        "import math",
+        "",
+        "",
+        f"def {function_name}(state):",
+        f'    """Retorna a ação: {ACTION_STAND} = em pé, {ACTION_JUMP} = pular, '
+        f'{ACTION_DUCK} = abaixar"""',
+        f"    {', '.join(inputs)}{',' if len(inputs) == 1 else ''} = state",
+    ]
+
+    if hasattr(brain, 'phenotype'):
+        lines += _graph_source(brain, inputs)
+    else:
+        lines += _layered_source(brain, inputs)
+
+    lines += [
+        "    if o0 > 0.0:",
+        f"        return {ACTION_JUMP}",
+        "    if o1 > 0.0:",
+        f"        return {ACTION_DUCK}",
+        f"    return {ACTION_STAND}",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def scalar_features(dino, game, feature_set, config=None):
+    """
+    Entradas de um porquinho em Python puro, iguais às de sense()
+    (só os conjuntos que a política compila: v1 e v2)
+    config: GameConfig da normalização (padrão: a do jogo)
+    retorna: lista de floats
+    """
+    if feature_set not in ('v1', 'v2'):
+        raise ValueError(f"Sem entradas escalares para o conjunto {feature_set}")
+    config = game.config if config is None else config
+
+    obstacle = game.snapshot().next_obstacle
+    if obstacle is None:
+        return list(get_feature_set(feature_set).idle)
+
+    x, y, velocity_y = float(dino.x), float(dino.y), float(dino.velocity_y)
+    features = [
+        (obstacle.x - x) / config.display.screen_width,
+        obstacle.height / 100.0,
+        obstacle.width / 100.0,
+        y / config.display.screen_height,
+        (velocity_y + 20) / 40.0,
+    ]
+    if feature_set == 'v2':
+        features.append(1.0 if velocity_y == 0 else 0.0)
+    return features
+
+
+def load_python_policy(source, function_name="decide"):
+    """Compila o código gerado por export_python_source e retorna a função"""
+    namespace = {}
+    exec(compile(source, "<compiled_policy>", "exec"), namespace)
+    return namespace[function_name]
+
+
+def sample_play_states(brain, games=5, max_ticks=HEADLESS_MAX_TICKS, config=None):
+    """
+    Coleta os estados que a própria rede visita jogando (partidas headless)
+    config: GameConfig com que o modelo foi treinado (padrão: jogo original)
+    retorna: matriz (estados, entradas)
+    """
+    states = []
+    for _ in range(games):
+        dino = Dino(config)
+        game = GameEngine(config=config)
+
+        while dino.alive and game.score < max_ticks:
+            game.update()
+            state = sense([dino], game, brain.feature_set)[0]
+            states.append(state)
+
+            decision = brain.decide(state)
+            if decision[0]:
+                dino.jump()
+            elif decision[1]:
+                dino.duck()
+            else:
+                dino.stand()
+
+            dino.update()
+
+            if game.check_collision(dino):
+                dino.alive = False
+
+    return np.asarray(states, dtype=np.float64)
+
+
+def accuracy_report(brain, policy, states, python_policy=None):
+    """
+    Compara as ações da política compilada com as da rede em float
+    retorna: dict com concordância geral, por ação e tamanho da tabela
+    """
+    expected = actions_from_decisions(brain.decide(states))
+    compiled = policy.act_batch(states)
+
+    report = {
+        "states": len(states),
+        "table_entries": int(policy.table.size),
+        "table_bytes": int(policy.table.nbytes),
+        "agreement": float(np.mean(compiled == expected)) if len(states) else 1.0,
+        "per_action": {},
+    }
+
+    for action, name in ACTION_NAMES.items():
+        mask = expected == action
+        if mask.any():
+            report["per_action"][name] = (int(mask.sum()),
+                                          float(np.mean(compiled[mask] == action)))
+
+    if python_policy is not None:
+        arithmetic = np.array([python_policy(state) for state in states.tolist()],
+                              dtype=np.uint8)
+        report["python_agreement"] = (float(np.mean(arithmetic == expected))
+                                      if len(states) else 1.0)
+
+    return report
+
+
+def print_accuracy_report(report):
+    """Imprime o relatório de precisão"""
+    print("\n📐 POLÍTICA COMPILADA")
+    print(f"   Tabela: {report['table_entries']} entradas "
+          f"({report['table_bytes'] / 1024:.0f} KB)")
+    print(f"   Estados avaliados: {report['states']}")
+    print(f"   Concordância da tabela: {report['agreement'] * 100:.2f}%")
+    for name, (count, agreement) in report["per_action"].items():
+        print(f"      {name:8s}: {agreement * 100:6.2f}% de {count} estados")
+    if "python_agreement" in report:
+        print(f"   Concordância da função aritmética: "
+              f"{report['python_agreement'] * 100:.2f}%")
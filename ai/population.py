@@ -1,31 +1,60 @@
 """Gerenciamento da população de agentes"""
 import numpy as np
 from game.dino import Dino
-from ai.neural_network import NeuralNetwork
+from game.sensors import resolve_feature_set
+from ai.neural_network import NeuralNetwork, TRAINING_DTYPE, make_spec, normalize_layers
+
+
+# Códigos das ações (usados nos rastros de ações)
+ACTION_STAND = 0
+ACTION_JUMP = 1
+ACTION_DUCK = 2
+
+
+def apply_action(dino, action):
+    """Executa uma ação pelo código (treino, rastros e replays)"""
+    if action == ACTION_JUMP:
+        dino.jump()
+    elif action == ACTION_DUCK:
+        dino.duck()
+    else:
+        dino.stand()
 
 
 class Agent:
-    def __init__(self, neural_network):
-        self.dino = Dino()
+    def __init__(self, neural_network, config=None):
+        """config: GameConfig da partida (física do porquinho)"""
+        self.dino = Dino(config)
         self.brain = neural_network
+        # Rastro de ações por tick (None = não grava)
+        self.actions = None
         
     def think(self, inputs):
         """
         Processa entradas e decide ação
         inputs: estado do jogo
         """
-        output = self.brain.forward(inputs)
-        
-        # Decodifica ação
-        # output[0] > 0.5: pular
-        # output[1] > 0.5: abaixar
+        # Decodifica ação pelo sinal da pré-ativação
+        # (equivale a forward(inputs)[i] > 0.5, sem calcular a sigmoid)
+        # decision[0]: pular
+        # decision[1]: abaixar
+        self.apply_decision(self.brain.decide(inputs))
         
-        if output[0] > 0.5:
-            self.dino.jump()
-        elif output[1] > 0.5:
-            self.dino.duck()
+    def apply_decision(self, decision):
+        """
+        Executa a ação decidida (pela própria rede ou pelo motor em lote)
+        decision: saídas limiarizadas (pular, abaixar)
+        """
+        if decision[0]:
+            action = ACTION_JUMP
+        elif decision[1]:
+            action = ACTION_DUCK
         else:
-            self.dino.stand()
+            action = ACTION_STAND
+        apply_action(self.dino, action)
+            
+        if self.actions is not None:
+            self.actions.append(action)
             
     def update(self):
         """Atualiza o dinossauro"""
@@ -37,14 +66,48 @@ class Agent:
 
 
 class Population:
-    def __init__(self, size, input_size, hidden_size, output_size):
-        """Cria população inicial"""
+    def __init__(self, size, input_size, hidden_size, output_size,
+                 dtype=TRAINING_DTYPE, layers=None, recurrent=False,
+                 feature_set=None, config=None):
+        """
+        Cria população inicial
+        layers/recurrent: arquitetura das redes (ver NeuralNetwork)
+        feature_set: conjunto de entradas dos sensores (game/sensors.py)
+        config: GameConfig dos porquinhos e dos jogos da população (padrão: original)
+        """
         self.size = size
+        self.dtype = dtype
+        self.input_size = input_size
+        self.output_size = output_size
+        self.layers = normalize_layers(hidden_size, layers)
+        self.hidden_size = self.layers[0][0]
+        self.recurrent = recurrent
+        self.feature_set = resolve_feature_set(feature_set, input_size)
+        self.config = config
         self.agents = []
         
         for _ in range(size):
-            nn = NeuralNetwork(input_size, hidden_size, output_size)
-            self.agents.append(Agent(nn))
+            self.agents.append(Agent(self.new_brain(), config))
+
+    def new_brain(self):
+        """Cria uma rede (pesos aleatórios) com a arquitetura da população"""
+        return NeuralNetwork(self.input_size, self.hidden_size, self.output_size,
+                             dtype=self.dtype, layers=self.layers,
+                             recurrent=self.recurrent, feature_set=self.feature_set)
+
+    def get_spec(self):
+        """Especificação da arquitetura das redes da população"""
+        return make_spec(self.input_size, self.output_size, self.layers,
+                         self.recurrent, self.feature_set)
+
+    def build_batch(self):
+        """
+        Empilha os pesos de todos os agentes para a inferência em lote
+        Deve ser chamado de novo sempre que os agentes mudarem
+        """
+        brains = [agent.brain for agent in self.agents]
+        # Cada tipo de rede sabe empilhar a si mesmo (ver NeuralNetwork.batch)
+        return type(brains[0]).batch(brains) if brains else None
             
     def get_alive_agents(self):
         """Retorna agentes ainda vivos"""
@@ -59,3 +122,30 @@ class Population:
         if not self.agents:
             return 0
         return max(agent.get_fitness() for agent in self.agents)
+
+    def enable_action_traces(self):
+        """Passa a gravar as ações de cada agente (diversidade comportamental)"""
+        for agent in self.agents:
+            agent.actions = []
+            
+    def get_action_traces(self):
+        """Retorna os rastros de ações gravados"""
+        return [agent.actions for agent in self.agents if agent.actions is not None]
+        
+    def get_genome_matrix(self):
+        """Retorna os pesos de todos os agentes como matriz (um agente por linha)"""
+        return np.stack([agent.brain.get_weights() for agent in self.agents])
+        
+    def genome_chunks(self, chunk_size):
+        """Pesos dos agentes em blocos de até chunk_size linhas (sem a matriz inteira)"""
+        for start in range(0, len(self.agents), chunk_size):
+            yield np.stack([agent.brain.get_weights()
+                            for agent in self.agents[start:start + chunk_size]])
+        
+    def set_genome_matrix(self, genomes):
+        """Recria os agentes a partir de uma matriz de genomas"""
+        self.agents = []
+        for weights in genomes:
+            nn = self.new_brain()
+            nn.set_weights(weights.copy())
+            self.agents.append(Agent(nn, self.config))
@@ -0,0 +1,255 @@
+"""
+Replays de gerações headless
+
+Uma geração é totalmente determinada pela semente do percurso, pela posição
+x de cada porquinho e pelas ações que cada um tomou a cada tick. O replay
+guarda só isso (ações em RLE), sem as redes: rever uma geração é re-simular
+a física, o que permite avançar rápido e voltar no tempo sem inferência.
+"""
+import os
+import copy
+import pickle
+import numpy as np
+from game.dino import Dino
+from game.engine import GameEngine
+from game.course import CourseConfig
+from game.settings import GameConfig
+from ai.population import apply_action
+from ai.simulation import advance_dinos
+
+
+REPLAY_VERSION = 1
+REPLAY_EXTENSION = ".replay"
+
+# A cada quantos ticks o player guarda uma cópia do estado (para voltar rápido)
+KEYFRAME_INTERVAL = 250
+
+
+def encode_actions(actions):
+    """
+    Rastro de ações → bytes
+    Cada sequência de ações iguais vira um varint: (repetições << 2) | ação
+    """
+    actions = np.asarray(actions, dtype=np.int64)
+    if len(actions) == 0:
+        return b""
+
+    starts = np.concatenate([[0], np.flatnonzero(np.diff(actions)) + 1])
+    runs = np.diff(np.append(starts, len(actions)))
+
+    data = bytearray()
+    for action, run in zip(actions[starts].tolist(), runs.tolist()):
+        value = run << 2 | action
+        while value >= 0x80:
+            data.append(value & 0x7F | 0x80)
+            value >>= 7
+        data.append(value)
+    return bytes(data)
+
+
+def decode_actions(data):
+    """bytes → rastro de ações (array de códigos)"""
+    actions = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        actions.extend([value & 3] * (value >> 2))
+        value = shift = 0
+    return np.array(actions, dtype=np.uint8)
+
+
+class Replay:
+    """Gravação compacta de uma geração"""
+
+    def __init__(self, seed, positions, actions, fitness, ticks, generation=None,
+                 course=None, config=None):
+        """
+        seed: semente do percurso (GameEngine)
+        positions: posição x inicial de cada porquinho
+        actions: ações de cada porquinho codificadas (encode_actions)
+        fitness: fitness final de cada porquinho (para conferência)
+        ticks: duração da geração
+        course: parâmetros do percurso (CourseConfig.to_dict; None = original)
+        config: física e tela da partida (GameConfig.to_dict; None = original)
+        """
+        self.seed = seed
+        self.positions = list(positions)
+        self.actions = list(actions)
+        self.fitness = list(fitness)
+        self.ticks = ticks
+        self.generation = generation
+        self.course = course
+        self.config = config
+
+    @property
+    def size(self):
+        return len(self.positions)
+
+    @property
+    def best_fitness(self):
+        return max(self.fitness, default=0)
+
+    def to_dict(self):
+        return {
+            "version": REPLAY_VERSION,
+            "seed": self.seed,
+            "positions": self.positions,
+            "actions": self.actions,
+            "fitness": self.fitness,
+            "ticks": self.ticks,
+            "generation": self.generation,
+            "course": self.course,
+            "config": self.config,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Versão de replay não suportada: {data.get('version')}")
+        return cls(data["seed"], data["positions"], data["actions"], data["fitness"],
+                   data["ticks"], data.get("generation"), data.get("course"),
+                   data.get("config"))
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            pickle.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_dict(pickle.load(f))
+
+
+class ReplayRecorder:
+    """Grava gerações de run_generation em uma pasta (um arquivo por geração)"""
+
+    def __init__(self, directory, start_generation=1, every=1, prefix=""):
+        """
+        directory: pasta dos arquivos .replay
+        start_generation: número da primeira geração gravada
+        every: grava uma a cada quantas gerações
+        prefix: prefixo dos arquivos (ex: ilha de origem)
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.start_generation = start_generation
+        self.generation = start_generation
+        self.every = max(1, every)
+        self.prefix = prefix
+        self.current = None
+
+    def new_seed(self):
+        """Semente do percurso da próxima geração"""
+        return int(np.random.randint(2 ** 31))
+
+    def start(self, population, game):
+        """Início da geração: posições já sorteadas, nenhum tick simulado"""
+        if game.seed is None:
+            raise ValueError("Replays precisam de um GameEngine com semente")
+
+        self.current = None
+        if (self.generation - self.start_generation) % self.every:
+            return
+
+        self.current = (game.seed, [agent.dino.x for agent in population.agents],
+                        game.course, game.config)
+        for agent in population.agents:
+            agent.actions = []
+
+    def finish(self, population, ticks):
+        """
+        Fim da geração: salva o replay
+        retorna: caminho do arquivo (None se a geração não foi gravada)
+        """
+        generation = self.generation
+        self.generation += 1
+        if self.current is None:
+            return None
+
+        seed, positions, course, config = self.current
+        self.current = None
+        replay = Replay(seed, positions,
+                        [encode_actions(agent.actions) for agent in population.agents],
+                        [agent.get_fitness() for agent in population.agents],
+                        ticks, generation, course.to_dict(), config.to_dict())
+
+        path = os.path.join(self.directory,
+                            f"{self.prefix}gen_{generation:05d}{REPLAY_EXTENSION}")
+        replay.save(path)
+        return path
+
+
+class ReplayPlayer:
+    """Re-simula um replay tick a tick, com avanço e retrocesso"""
+
+    def __init__(self, replay, keyframe_interval=KEYFRAME_INTERVAL):
+        self.replay = replay
+        self.actions = [decode_actions(data) for data in replay.actions]
+        self.keyframe_interval = keyframe_interval
+        self.keyframes = {}
+        self.restart()
+
+    def restart(self):
+        """Volta ao tick 0"""
+        config = GameConfig.from_dict(self.replay.config)
+        self.game = GameEngine(self.replay.seed, CourseConfig.from_dict(self.replay.course),
+                               config)
+        self.dinos = []
+        for x in self.replay.positions:
+            dino = Dino(config)
+            dino.x = x
+            self.dinos.append(dino)
+        self.tick = 0
+
+    @property
+    def finished(self):
+        return self.tick >= self.replay.ticks or not any(dino.alive for dino in self.dinos)
+
+    def step(self):
+        """
+        Avança um tick (mesma ordem do treino: jogo, ações, física, colisão)
+        retorna: False se o replay já terminou
+        """
+        if self.finished:
+            return False
+
+        self.game.update()
+        alive = [i for i, dino in enumerate(self.dinos) if dino.alive]
+        for i in alive:
+            if self.tick >= len(self.actions[i]):
+                raise ValueError(f"Replay dessincronizado no tick {self.tick} "
+                                 f"(porquinho {i} sem ações gravadas)")
+            apply_action(self.dinos[i], self.actions[i][self.tick])
+        advance_dinos(self.game, [self.dinos[i] for i in alive])
+        self.tick += 1
+
+        if self.tick % self.keyframe_interval == 0 and self.tick not in self.keyframes:
+            self.keyframes[self.tick] = copy.deepcopy((self.game, self.dinos))
+        return True
+
+    def seek(self, tick):
+        """Vai para um tick qualquer, partindo da cópia guardada mais próxima"""
+        tick = max(0, min(tick, self.replay.ticks))
+        base = max((k for k in self.keyframes if k <= tick), default=0)
+
+        if tick < self.tick or base > self.tick:
+            if base == 0:
+                self.restart()
+            else:
+                self.game, self.dinos = copy.deepcopy(self.keyframes[base])
+                self.tick = base
+
+        while self.tick < tick and self.step():
+            pass
+
+    def verify(self):
+        """
+        Re-simula até o fim e compara com o fitness gravado
+        retorna: maior diferença de fitness entre gravação e re-simulação
+        """
+        self.seek(self.replay.ticks)
+        return max((abs(dino.fitness - fitness)
+                    for dino, fitness in zip(self.dinos, self.replay.fitness)), default=0)
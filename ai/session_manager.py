@@ -2,7 +2,47 @@
 import os
 import json
 import pickle
+from collections.abc import Sequence
 from datetime import datetime
+from ai.model_cache import ModelCache
+
+
+class SessionRows(Sequence):
+    """
+    Sessões ordenadas por fitness, com as linhas montadas sob demanda
+    (a lista de seleção só pede as linhas visíveis)
+    """
+
+    def __init__(self, sessions):
+        self.sessions = sessions
+        self.ids = sorted(sessions, key=lambda session_id: sessions[session_id]["best_fitness"],
+                          reverse=True)
+        self._rows = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self.find(self.ids[index])
+
+    def find(self, session_id):
+        """Linha de uma sessão pelo id (None se não existe)"""
+        if session_id not in self.sessions:
+            return None
+        row = self._rows.get(session_id)
+        if row is None:
+            data = self.sessions[session_id]
+            row = {
+                "id": session_id,
+                "best_fitness": data["best_fitness"],
+                "final_generation": data["end_generation"],  # Geração final
+                "start_time": data["start_time"]
+            }
+            self._rows[session_id] = row
+        return row
+
 
 class SessionManager:
     def __init__(self, sessions_dir="sessions"):
@@ -14,7 +54,16 @@ class SessionManager:
         self.current_best_fitness = 0
         
         self._create_directory()
-        self._load_sessions_history()
+        # Histórico lido só no primeiro uso (o menu principal abre sem ele)
+        self._sessions_history = None
+        self.model_cache = ModelCache()
+        
+    @property
+    def sessions_history(self):
+        """Histórico de sessões (carregado do JSON na primeira consulta)"""
+        if self._sessions_history is None:
+            self._load_sessions_history()
+        return self._sessions_history
         
     def _create_directory(self):
         """Cria diretório de sessões"""
@@ -25,9 +74,9 @@ class SessionManager:
         """Carrega histórico de sessões"""
         if os.path.exists(self.sessions_file):
             with open(self.sessions_file, 'r') as f:
-                self.sessions_history = json.load(f)
+                self._sessions_history = json.load(f)
         else:
-            self.sessions_history = {
+            self._sessions_history = {
                 "sessions": {},
                 "global_best": None
             }
@@ -51,6 +100,7 @@ class SessionManager:
         if os.path.exists(model_path):
             os.remove(model_path)
             print(f"✓ Arquivo deletado: {model_file}")
+        self.model_cache.discard(model_path)
         
         # Remove do histórico
         del self.sessions_history["sessions"][session_id]
@@ -77,8 +127,14 @@ class SessionManager:
         print(f"✓ Sessão deletada: {session_id}")
         return True
             
-    def start_new_session(self, start_generation=1):
-        """Inicia nova sessão"""
+    def start_new_session(self, start_generation=1, config=None):
+        """
+        Inicia nova sessão
+        config: GameConfig do treino (gravado na sessão e nos modelos; padrão: original)
+        """
+        if config is None:
+            from game.settings import DEFAULT_CONFIG
+            config = DEFAULT_CONFIG
         self.current_session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         self.current_session_data = {
             "session_id": self.current_session_id,
@@ -90,7 +146,8 @@ class SessionManager:
             "best_generation": start_generation,
             "avg_fitness": 0,
             "model_file": f"{self.current_session_id}_best.pkl",
-            "total_generations": 0
+            "total_generations": 0,
+            "config": config.to_dict()
         }
         self.current_best_fitness = 0
         
@@ -172,31 +229,41 @@ class SessionManager:
         
         model_data = {
             "session_id": self.current_session_id,
-            "input_size": brain.input_size,
-            "hidden_size": brain.hidden_size,
-            "output_size": brain.output_size,
+            # input_size, hidden_size, output_size, layers, recurrent
+            **brain.get_spec(),
             "weights": brain.get_weights(),
             "fitness": fitness,
             "generation": generation,  # Geração REAL
+            "config": self.current_session_data.get("config"),
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
         
         with open(model_path, 'wb') as f:
             pickle.dump(model_data, f)
+        self.model_cache.discard(model_path)
             
-    def load_session_model(self, session_id):
-        """Carrega modelo de uma sessão"""
+    def session_model_path(self, session_id):
+        """Caminho do arquivo de modelo de uma sessão"""
         if session_id not in self.sessions_history["sessions"]:
             raise ValueError(f"Sessão não encontrada: {session_id}")
         
         model_file = self.sessions_history["sessions"][session_id]["model_file"]
-        model_path = os.path.join(self.sessions_dir, model_file)
+        return os.path.join(self.sessions_dir, model_file)
+            
+    def prefetch_models(self, session_ids):
+        """Carrega em segundo plano os modelos das sessões (ex: as primeiras da lista)"""
+        paths = [self.session_model_path(session_id) for session_id in session_ids
+                 if session_id in self.sessions_history["sessions"]]
+        self.model_cache.prefetch([path for path in paths if os.path.exists(path)])
+            
+    def load_session_model(self, session_id):
+        """Carrega modelo de uma sessão (do cache, se já foi lido ou pré-carregado)"""
+        model_path = self.session_model_path(session_id)
         
         if not os.path.exists(model_path):
             raise FileNotFoundError(f"Modelo não encontrado: {model_path}")
         
-        with open(model_path, 'rb') as f:
-            model_data = pickle.load(f)
+        model_data = self.model_cache.get(model_path)
         
         print(f"\n✓ Modelo carregado: {session_id}")
         print(f"  Fitness: {model_data['fitness']:.0f}")
@@ -214,22 +281,13 @@ class SessionManager:
         
         return self.load_session_model(best_session_id)
         
-    def list_all_sessions(self):
-        """Lista todas as sessões"""
-        if not self.sessions_history["sessions"]:
-            return []
-        
-        sessions = []
-        for session_id, data in self.sessions_history["sessions"].items():
-            sessions.append({
-                "id": session_id,
-                "best_fitness": data["best_fitness"],
-                "final_generation": data["end_generation"],  # Geração final
-                "start_time": data["start_time"]
-            })
+    def close(self):
+        """Cancela pré-carregamentos pendentes"""
+        self.model_cache.close()
         
-        sessions.sort(key=lambda x: x["best_fitness"], reverse=True)
-        return sessions
+    def list_all_sessions(self):
+        """Lista todas as sessões (melhor fitness primeiro, linhas sob demanda)"""
+        return SessionRows(self.sessions_history["sessions"])
         
     def print_sessions_summary(self):
         """Imprime resumo de sessões"""
@@ -0,0 +1,245 @@
+"""Simulação headless (sem renderização) das gerações"""
+import numpy as np
+from game.config import *
+from game.engine import GameEngine
+from game.sensors import DEFAULT_FEATURE_SET, get_feature_set, sense
+from game.timeline import WorldTimeline
+from ai.population import (Population, Agent, apply_action,
+                           ACTION_STAND, ACTION_JUMP, ACTION_DUCK)
+
+
+# Com até tantos agentes vivos, run_generation passa ao modo por eventos
+EVENT_DRIVEN_AGENTS = 4
+
+# Máximo de ticks decididos de uma vez por agente no modo por eventos
+EVENT_WINDOW = 64
+
+
+def get_game_state(dino, game, feature_set=DEFAULT_FEATURE_SET):
+    """Estado do jogo para um único porquinho (ver game/sensors.py)"""
+    return sense([dino], game, feature_set)[0].tolist()
+
+
+def randomize_agent_positions(population, rng=None):
+    """
+    Randomiza posições X dos agentes (±15 pixels para não confundir)
+    rng: gerador das posições (padrão: o global np.random)
+    """
+    rng = np.random if rng is None else rng
+    for agent in population.agents:
+        x_offset = rng.uniform(-15, 15)
+        agent.dino.x = 50 + x_offset
+
+
+def step_population(population, game, batch=None):
+    """
+    Avança a simulação em um tick
+    Atualiza o jogo, cada agente vivo decide, se move e é testado contra colisão
+    batch: redes empilhadas (Population.build_batch); se informado, todos
+           os agentes vivos decidem em uma única inferência em lote
+    """
+    game.update()
+
+    rows = [i for i, agent in enumerate(population.agents) if agent.dino.alive]
+    if not rows:
+        return
+    alive = [population.agents[i] for i in rows]
+
+    # Entradas de todos os agentes vivos de uma vez
+    states = sense([agent.dino for agent in alive], game, population.feature_set,
+                   population.config)
+
+    if batch is None:
+        for agent, state in zip(alive, states):
+            agent.think(state)
+    else:
+        for agent, decision in zip(alive, batch.decide(states, rows)):
+            agent.apply_decision(decision)
+
+    advance_dinos(game, [agent.dino for agent in alive])
+
+
+def advance_dinos(game, dinos):
+    """
+    Move os porquinhos que já agiram neste tick e testa colisão
+    Sensores e colisão usam o mesmo retrato do tick (treino e replays)
+    """
+    for dino in dinos:
+        dino.update()
+
+        # BÔNUS: Recompensa pequena por abaixar (incentiva usar essa ação)
+        if dino.is_ducking:
+            dino.fitness += 0.05
+
+    # Colisão de todos de uma vez
+    hits = game.snapshot().collisions([dino.x for dino in dinos],
+                                      [dino.y for dino in dinos],
+                                      [dino.width for dino in dinos],
+                                      [dino.height for dino in dinos])
+    for dino, hit in zip(dinos, hits):
+        if hit:
+            dino.alive = False
+
+
+def _hold_action(dino, action):
+    """Um tick do porquinho com a ação já decidida (mesmas somas de advance_dinos)"""
+    apply_action(dino, action)
+    dino.update()
+    if dino.is_ducking:
+        dino.fitness += 0.05
+
+
+def _dino_state(dino):
+    return (dino.y, dino.velocity_y, dino.is_jumping, dino.air_ticks, dino.arc_base,
+            dino.is_ducking, dino.height, dino.fitness)
+
+
+def _restore_dino(dino, state):
+    (dino.y, dino.velocity_y, dino.is_jumping, dino.air_ticks, dino.arc_base,
+     dino.is_ducking, dino.height, dino.fitness) = state
+
+
+def _decode_actions(decisions):
+    """Códigos das ações de várias decisões (mesma regra de Agent.apply_decision)"""
+    return np.where(decisions[:, 0], ACTION_JUMP,
+                    np.where(decisions[:, 1], ACTION_DUCK, ACTION_STAND))
+
+
+def play_agent_events(agent, row, batch, timeline, feature_set, max_ticks):
+    """
+    Joga um agente até morrer (ou até max_ticks), janela a janela
+    Cada janela vai até o próximo evento do percurso e o agente repete a
+    última ação nela; uma inferência confere todos os ticks e a janela vale
+    até a primeira decisão diferente ou colisão. A física e o fitness andam
+    tick a tick, com as mesmas somas do loop normal
+    row: linha do agente no lote de redes
+    retorna: tick da morte (None se sobreviveu)
+    """
+    dino = agent.dino
+    compute = get_feature_set(feature_set).compute
+    config = timeline.game.config
+    action = ACTION_STAND
+    tick = timeline.first
+
+    while not max_ticks or tick <= max_ticks:
+        limit = tick + EVENT_WINDOW - 1
+        if max_ticks:
+            limit = min(limit, max_ticks)
+        world = timeline.window(tick, limit)
+        size = len(world)
+
+        # Especula: a mesma ação em todos os ticks da janela
+        saved = _dino_state(dino)
+        y, velocity_y, top, height = [], [], [], []
+        for _ in range(size):
+            y.append(dino.y)
+            velocity_y.append(dino.velocity_y)
+            _hold_action(dino, action)
+            top.append(dino.y)
+            height.append(dino.height)
+
+        x = np.full(size, dino.x, dtype=np.float64)
+        states = np.column_stack(compute(world, x, np.array(y, dtype=np.float64),
+                                         np.array(velocity_y, dtype=np.float64), config))
+        actions = _decode_actions(batch.decide(states, [row] * size))
+        changed = np.flatnonzero(actions != action)
+        change = int(changed[0]) if len(changed) else size
+        hits = np.flatnonzero(world.collisions(x, top, np.full(size, dino.width), height))
+        hit = int(hits[0]) if len(hits) else size
+
+        # Ticks em que a especulação vale (a colisão conta o próprio tick)
+        keep = hit + 1 if hit < change else change
+        if keep < size:
+            _restore_dino(dino, saved)
+            for _ in range(keep):
+                _hold_action(dino, action)
+        if agent.actions is not None:
+            agent.actions.extend([action] * keep)
+        tick += keep
+
+        if hit < change:
+            dino.alive = False
+            return tick - 1
+        if change < size:
+            action = int(actions[change])
+    return None
+
+
+def finish_generation_events(population, game, batch, max_ticks):
+    """
+    Termina a geração no modo por eventos (agentes um a um, ver play_agent_events)
+    O percurso é simulado antes, em uma cópia do jogo; no fim o jogo original
+    é avançado até o mesmo tick em que o loop tick a tick pararia
+    retorna: número de ticks simulados
+    """
+    timeline = WorldTimeline(game)
+    last = game.score
+    for row, agent in enumerate(population.agents):
+        if agent.dino.alive:
+            death = play_agent_events(agent, row, batch, timeline,
+                                      population.feature_set, max_ticks)
+            last = max(last, max_ticks if death is None else death)
+
+    while game.score < last:
+        game.update()
+    return last
+
+
+def run_generation(population, max_ticks=HEADLESS_MAX_TICKS, game=None, recorder=None,
+                   event_driven=True, course=None, rng=None):
+    """
+    Simula uma geração inteira sem renderizar
+    max_ticks: limite de ticks (evita que um campeão jogue para sempre)
+    recorder: ReplayRecorder (ai/replay.py); grava a geração para rever depois
+    event_driven: com poucos agentes vivos, pula para o modo por eventos
+                  (mesmos resultados, tick a tick; redes recorrentes não usam)
+    course: CourseConfig do jogo criado aqui (ex: currículo, ai/curriculum.py);
+            o resto da configuração vem de population.config
+    rng: gerador das posições iniciais (padrão: o global np.random)
+    retorna: número de ticks simulados
+    """
+    if game is None:
+        game = GameEngine(recorder.new_seed() if recorder is not None else None, course,
+                          population.config)
+
+    randomize_agent_positions(population, rng)
+    batch = population.build_batch()
+
+    if recorder is not None:
+        recorder.start(population, game)
+
+    event_driven = (event_driven and batch is not None and
+                    not getattr(batch, 'recurrent', False))
+    ticks = game.score
+    while not population.all_dead():
+        if event_driven and len(population.get_alive_agents()) <= EVENT_DRIVEN_AGENTS:
+            ticks = finish_generation_events(population, game, batch, max_ticks)
+            break
+
+        step_population(population, game, batch)
+        ticks = game.score
+
+        if max_ticks and game.score >= max_ticks:
+            break
+
+    if recorder is not None:
+        recorder.finish(population, ticks)
+
+    return ticks
+
+
+def evaluate_brain(brain, max_ticks=HEADLESS_MAX_TICKS, game=None, rng=None):
+    """
+    Joga uma partida headless com uma única rede e retorna o fitness
+    game: partida a jogar (padrão: percurso aleatório); a configuração vem dela
+    rng: gerador da posição inicial (padrão: o global np.random)
+    """
+    config = game.config if game is not None else None
+    population = Population(0, brain.input_size, brain.hidden_size, brain.output_size,
+                            dtype=brain.dtype, feature_set=brain.feature_set,
+                            config=config)
+    population.agents.append(Agent(brain, config))
+
+    run_generation(population, max_ticks, game, rng=rng)
+
+    return population.agents[0].get_fitness()
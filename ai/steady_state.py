@@ -0,0 +1,212 @@
+"""Evolução steady-state assíncrona (sem barreira entre gerações)"""
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import numpy as np
+from game.config import *
+from game.engine import GameEngine
+from ai.operators import MUTATION_TIERS, gaussian_mutation, validate_tiers
+from ai.neural_network import (NeuralNetwork, TRAINING_DTYPE, describe_spec,
+                               make_spec, normalize_layers)
+from ai.simulation import evaluate_brain
+
+
+def _seed_worker():
+    """Cada processo do pool precisa de sua própria semente (fork copia o RNG)"""
+    np.random.seed(None)
+    random.seed(None)
+
+
+def _evaluate_genome(weights, spec, dtype, max_ticks, course_seed, config=None):
+    """
+    Avalia um genoma em uma partida própria (executa no pool)
+    course_seed: semente do percurso, igual para todas as avaliações da rodada
+    config: GameConfig da partida (padrão: jogo original)
+    """
+    brain = NeuralNetwork.from_spec(spec, dtype=dtype)
+    brain.set_weights(weights)
+    return evaluate_brain(brain, max_ticks, GameEngine(course_seed, config=config),
+                          rng=np.random.RandomState(course_seed))
+
+
+class SteadyStateEvolution:
+    """
+    Evolução steady-state: cada agente que termina é substituído
+    imediatamente por um filho da elite atual, sem esperar os demais
+    """
+
+    def __init__(self, population_size=POPULATION_SIZE,
+                 input_size=6, hidden_size=10, output_size=2,
+                 elite_size=5, workers=None, max_ticks=HEADLESS_MAX_TICKS,
+                 dtype=TRAINING_DTYPE, layers=None, recurrent=False,
+                 feature_set=None, mutation_tiers=MUTATION_TIERS, rotate_every=None,
+                 config=None):
+        """
+        population_size: tamanho do arquivo de indivíduos avaliados
+        elite_size: quantos melhores podem ser pais
+        workers: processos avaliando em paralelo (padrão: um por núcleo)
+        max_ticks: limite de ticks por partida
+        dtype: tipo de ponto flutuante das redes avaliadas
+        layers/recurrent: arquitetura das redes (ver NeuralNetwork)
+        feature_set: conjunto de entradas dos sensores (game/sensors.py)
+        mutation_tiers: faixas (proporção, genes mutados, força), ver MUTATION_TIERS
+        rotate_every: avaliações por percurso; ao trocar, o arquivo inteiro é
+                      reavaliado no novo (None = um percurso só)
+        config: GameConfig das partidas (game/settings.py; padrão: original)
+        """
+        self.population_size = population_size
+        self.spec = make_spec(input_size, output_size,
+                              normalize_layers(hidden_size, layers), recurrent,
+                              feature_set)
+        self.elite_size = max(1, min(elite_size, population_size))
+        self.workers = workers or os.cpu_count() or 1
+        self.max_ticks = max_ticks
+        self.dtype = dtype
+        self.mutation_tiers = validate_tiers(mutation_tiers)
+        self.rotate_every = rotate_every
+        self.config = config
+        # Todas as avaliações de uma rodada jogam o mesmo percurso, então
+        # os fitness do arquivo são comparáveis entre si
+        self.course_seed = np.random.randint(2 ** 31)
+
+        # Arquivo ordenado (melhor → pior) de (fitness, pesos)
+        self.archive = []
+        self.evaluations = 0
+        self.best_fitness_history = []
+        self.avg_fitness_history = []
+
+        tier_weights = np.array([tier[0] for tier in self.mutation_tiers])
+        self.tier_probabilities = tier_weights / tier_weights.sum()
+
+        print(f"\n🧬 Evolução Steady-State Inicializada:")
+        print(f"   População: {population_size} (elite: {self.elite_size})")
+        print(f"   Processos: {self.workers}")
+        if rotate_every:
+            print(f"   Percurso: troca a cada {rotate_every} avaliações")
+        print(f"   Arquitetura: {describe_spec(self.spec)}\n")
+
+    def _random_genome(self):
+        """Genoma de uma rede recém inicializada"""
+        return NeuralNetwork.from_spec(self.spec, dtype=self.dtype).get_weights()
+
+    def _make_offspring(self):
+        """
+        Filho de um pai sorteado na elite atual, com a faixa de
+        mutação sorteada nas mesmas proporções da evolução geracional
+        """
+        if len(self.archive) < self.population_size:
+            return self._random_genome()
+
+        _, parent = self.archive[np.random.randint(self.elite_size)]
+        tier = self.mutation_tiers[np.random.choice(len(self.mutation_tiers),
+                                                    p=self.tier_probabilities)]
+        _, rate, strength = tier
+        return gaussian_mutation(parent, rate, strength)
+
+    def _insert(self, fitness, weights):
+        """Insere no arquivo substituindo o pior, se o novo for melhor"""
+        if len(self.archive) >= self.population_size:
+            if fitness <= self.archive[-1][0]:
+                return
+            self.archive.pop()
+
+        position = len(self.archive)
+        while position > 0 and self.archive[position - 1][0] < fitness:
+            position -= 1
+        self.archive.insert(position, (fitness, weights))
+
+    def get_best_brain(self):
+        """Retorna a rede do melhor indivíduo do arquivo"""
+        if not self.archive:
+            return None
+        brain = NeuralNetwork.from_spec(self.spec)
+        brain.set_weights(self.archive[0][1])
+        return brain
+
+    def run(self, evaluations, session_manager=None):
+        """
+        Executa até um número total de avaliações
+        A cada population_size avaliações conta uma "geração" para estatísticas
+        session_manager: se informado, registra o melhor modelo na sessão atual
+        """
+        pending = {}
+
+        with ProcessPoolExecutor(max_workers=self.workers,
+                                 initializer=_seed_worker) as pool:
+            submitted = 0
+            try:
+                while submitted < evaluations:
+                    if submitted:
+                        self._rotate_course(pool, pending)
+                    round_end = evaluations
+                    if self.rotate_every:
+                        round_end = min(evaluations, submitted + self.rotate_every)
+
+                    # Mantém todos os núcleos ocupados (com uma pequena folga na fila)
+                    while submitted < round_end and len(pending) < self.workers * 2:
+                        self._submit(pool, pending, self._make_offspring())
+                        submitted += 1
+
+                    while pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                        for future in done:
+                            weights = pending.pop(future)
+                            self._insert(future.result(), weights)
+                            self.evaluations += 1
+
+                            if self.evaluations % self.population_size == 0:
+                                self._report(session_manager)
+
+                            if submitted < round_end:
+                                self._submit(pool, pending, self._make_offspring())
+                                submitted += 1
+            except KeyboardInterrupt:
+                print("\n⚠ Interrompido, aguardando avaliações em andamento...")
+                for future in pending:
+                    future.cancel()
+
+        return self.get_best_brain()
+
+    def _submit(self, pool, pending, weights):
+        """Avalia um genoma no percurso da rodada atual"""
+        future = pool.submit(_evaluate_genome, weights, self.spec, self.dtype,
+                             self.max_ticks, self.course_seed, self.config)
+        pending[future] = weights
+
+    def _rotate_course(self, pool, pending):
+        """
+        Troca de percurso e reavalia o arquivo inteiro (elite inclusive) nele:
+        fitness de percursos diferentes não são comparáveis
+        """
+        self.course_seed = np.random.randint(2 ** 31)
+        archive = self.archive
+        for _, weights in archive:
+            self._submit(pool, pending, weights)
+
+        reevaluated = []
+        for future in wait(pending).done:
+            reevaluated.append((future.result(), pending.pop(future)))
+        # Só substitui o arquivo quando todas as reavaliações terminaram
+        self.archive = []
+        for fitness, weights in reevaluated:
+            self._insert(fitness, weights)
+
+    def _report(self, session_manager):
+        """Imprime estatísticas a cada population_size avaliações"""
+        generation = self.evaluations // self.population_size
+        fitnesses = [fitness for fitness, _ in self.archive]
+        best_fitness = fitnesses[0]
+        avg_fitness = float(np.mean(fitnesses))
+
+        self.best_fitness_history.append(best_fitness)
+        self.avg_fitness_history.append(avg_fitness)
+
+        print(f"Gen {generation:3d} | "
+              f"Avaliações: {self.evaluations:6d} | "
+              f"Melhor: {best_fitness:7.0f} | "
+              f"Média: {avg_fitness:7.0f}")
+
+        if session_manager is not None:
+            session_manager.update_session(generation, best_fitness,
+                                           avg_fitness, self.get_best_brain())
@@ -0,0 +1,433 @@
+"""
+Varredura de hiperparâmetros: várias execuções headless comparadas em uma tabela
+
+Um arquivo .toml ou .json descreve a busca (grade completa ou amostras
+aleatórias) sobre os hiperparâmetros do algoritmo evolutivo (faixas de
+mutação, tamanho da rede e, com operadores vetorizados, taxa de mutação e
+elite) e sobre campos da
+configuração do jogo ('seção.campo', game/settings.py):
+
+    search = "grid"          # ou "random" (com samples = N)
+    generations = 30
+    repeats = 3              # sementes por combinação
+
+    [parameters]
+    hidden_size = [6, 10, 16]
+    mutation_tiers = ["conservative", "exploratory", [[0.5, 0.1, 0.2], [0.5, 0.3, 0.5]]]
+    "training.population_size" = [50, 100]
+    "course.speed_increment" = {min = 0.002, max = 0.006}    # intervalo: só na busca aleatória
+
+Uma lista é uma lista de opções. Em mutation_tiers, cada opção é o nome de
+um preset (TIER_PRESETS) ou uma lista de faixas [proporção, genes, força];
+uma lista de faixas sozinha é um único valor, não uma opção por faixa.
+
+Sem `operators`, as execuções usam a estratégia conservadora do modo treino,
+que só lê hidden_size e mutation_tiers. Com uma tabela de operadores
+vetorizados (ai/operators.py; tipos omitidos usam DEFAULT_OPERATORS), passam a
+valer mutation_rate, mutation_strength e elite_ratio:
+
+    [operators]
+    selection = "tournament"
+    mutation = "gaussian"    # "tiered" lê mutation_tiers no lugar da taxa/força
+
+Parâmetros que a estratégia escolhida ignora são recusados ao ler o arquivo.
+
+Cada execução roda em um processo do pool, com limite de memória e de tempo.
+A repetição r de todas as combinações joga os mesmos percursos (mesmas
+sementes), então as diferenças vêm dos hiperparâmetros e não da sorte.
+"""
+import os
+import csv
+import json
+import time
+import random
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
+from game.config import *
+from game.engine import GameEngine
+from game.sensors import DEFAULT_FEATURE_SET, get_feature_set
+from game.settings import DEFAULT_CONFIG, read_settings_file
+from ai.evolutionary_algorithm import (EvolutionaryAlgorithm, DEFAULT_OPERATORS,
+                                       TRAINING_HYPERPARAMETERS)
+from ai.operators import MUTATION_TIERS, get_operator, is_tier_list, validate_tiers
+from ai.simulation import run_generation
+
+
+# Faixas de mutação com nome: (proporção da população, genes mutados, força)
+TIER_PRESETS = {
+    'conservative': MUTATION_TIERS,
+    'gentle': ((0.8, 0.05, 0.1), (0.15, 0.15, 0.2), (0.05, 0.3, 0.4)),
+    'exploratory': ((0.4, 0.15, 0.2), (0.3, 0.3, 0.4), (0.3, 0.5, 0.7)),
+}
+
+# Padrões do arquivo de varredura
+SWEEP_DEFAULTS = {
+    'search': 'grid',
+    'samples': 10,
+    'generations': 20,
+    'repeats': 3,
+    'seed': 0,
+    'operators': None,
+    'parameters': {},
+}
+
+# Hiperparâmetros lidos pela estratégia conservadora (faixas fixas, uma cópia do melhor)
+CONSERVATIVE_HYPERPARAMETERS = ('hidden_size', 'mutation_tiers')
+
+# Distância entre as sementes de percurso de duas repetições (uma por geração)
+COURSE_SEED_STRIDE = 100000
+
+SWEEP_METRICS = ('best_mean', 'best_std', 'final_avg', 'generations', 'seconds',
+                 'runs', 'truncated')
+
+
+def load_sweep_spec(path):
+    """
+    Lê e confere um arquivo de varredura (.toml ou .json)
+    retorna: dicionário com os padrões de SWEEP_DEFAULTS preenchidos
+    """
+    data = read_settings_file(path)
+    unknown = set(data) - set(SWEEP_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Campo desconhecido na varredura: {', '.join(sorted(unknown))} "
+                         f"(disponíveis: {', '.join(SWEEP_DEFAULTS)})")
+    spec = {**SWEEP_DEFAULTS, **data}
+    if spec['search'] not in ('grid', 'random'):
+        raise ValueError(f"Busca desconhecida: {spec['search']} (grid ou random)")
+    if spec['operators'] is not None:
+        if not isinstance(spec['operators'], dict):
+            raise ValueError("operators: tabela tipo → nome do operador")
+        for kind, name in spec['operators'].items():
+            get_operator(kind, name)
+
+    used = used_hyperparameters(spec['operators'])
+    for name in spec['parameters']:
+        if name not in TRAINING_HYPERPARAMETERS and '.' not in name:
+            available = ", ".join(sorted(TRAINING_HYPERPARAMETERS))
+            raise ValueError(f"Parâmetro desconhecido: {name} "
+                             f"(disponíveis: {available} ou seção.campo da configuração)")
+        if name in TRAINING_HYPERPARAMETERS and name not in used:
+            strategy = ("a estratégia conservadora" if spec['operators'] is None
+                        else "estes operadores")
+            raise ValueError(f"{name} não tem efeito com {strategy} "
+                             f"(usados: {', '.join(used)})")
+    return spec
+
+
+def used_hyperparameters(operators):
+    """
+    Hiperparâmetros que de fato mudam uma execução com estes operadores
+    operators: dict tipo → nome (None = estratégia conservadora)
+    """
+    if operators is None:
+        return CONSERVATIVE_HYPERPARAMETERS
+    # A mutação por faixas ignora taxa e força (cada faixa tem as suas)
+    if {**DEFAULT_OPERATORS, **operators}['mutation'] == 'tiered':
+        return ('hidden_size', 'elite_ratio', 'mutation_tiers')
+    return ('hidden_size', 'mutation_rate', 'mutation_strength', 'elite_ratio')
+
+
+def resolve_tiers(value):
+    """Faixas de mutação a partir do nome de um preset ou da lista de faixas"""
+    if isinstance(value, str):
+        if value not in TIER_PRESETS:
+            available = ", ".join(sorted(TIER_PRESETS))
+            raise ValueError(f"Faixas de mutação desconhecidas: {value} "
+                             f"(disponíveis: {available})")
+        return TIER_PRESETS[value]
+    return validate_tiers(value)
+
+
+def _is_range(value):
+    return isinstance(value, dict)
+
+
+def _options(name, value):
+    """
+    Opções de um parâmetro (lista ou valor fixo)
+    Uma lista de faixas em mutation_tiers é um valor só, não uma opção por faixa
+    """
+    if not isinstance(value, list) or (name == 'mutation_tiers' and is_tier_list(value)):
+        return [value]
+    return value
+
+
+def _sample(name, value, rng):
+    """Um valor de parâmetro na busca aleatória"""
+    if _is_range(value):
+        low, high = value['min'], value['max']
+        if value.get('log'):
+            return float(np.exp(rng.uniform(np.log(low), np.log(high))))
+        if isinstance(low, int) and isinstance(high, int):
+            return rng.randint(low, high)
+        return rng.uniform(low, high)
+    options = _options(name, value)
+    return options[0] if len(options) == 1 else rng.choice(options)
+
+
+def expand_parameters(spec):
+    """
+    Combinações de parâmetros da varredura
+    grid: produto de todas as listas; random: `samples` sorteios
+    retorna: lista de dicts parâmetro → valor
+    """
+    parameters = spec['parameters']
+    names = sorted(parameters)
+
+    if spec['search'] == 'random':
+        rng = random.Random(spec['seed'])
+        return [{name: _sample(name, parameters[name], rng) for name in names}
+                for _ in range(spec['samples'])]
+
+    options = []
+    for name in names:
+        value = parameters[name]
+        if _is_range(value):
+            raise ValueError(f"{name}: intervalos {{min, max}} só na busca aleatória")
+        options.append(_options(name, value))
+    return [dict(zip(names, values)) for values in itertools.product(*options)]
+
+
+def build_trials(spec, config=None):
+    """
+    Execuções da varredura: cada combinação em `repeats` sementes
+    A configuração de cada combinação é montada aqui, então erros nos
+    parâmetros aparecem antes de abrir o pool
+    config: GameConfig base (padrão: jogo original)
+    """
+    config = DEFAULT_CONFIG if config is None else config
+    # Só os parâmetros que variam identificam a combinação na tabela
+    varying = [name for name, value in spec['parameters'].items()
+               if _is_range(value) or len(_options(name, value)) > 1]
+    trials = []
+    for combination, values in enumerate(expand_parameters(spec)):
+        params = {name: values[name] for name in sorted(varying)}
+        overrides = {name: value for name, value in values.items() if '.' in name}
+        hyperparameters = {**TRAINING_HYPERPARAMETERS,
+                           **{name: value for name, value in values.items()
+                              if '.' not in name}}
+        hyperparameters['mutation_tiers'] = resolve_tiers(hyperparameters['mutation_tiers'])
+        trial_config = config.with_overrides(overrides)
+
+        for repeat in range(spec['repeats']):
+            trials.append({
+                'combination': combination,
+                'params': params,
+                'hyperparameters': hyperparameters,
+                'config': trial_config,
+                'operators': spec['operators'],
+                'seed': spec['seed'] + repeat,
+                'generations': spec['generations'],
+            })
+    return trials
+
+
+def course_seed(seed, generation):
+    """Semente do percurso de uma geração (igual para todas as combinações)"""
+    return seed * COURSE_SEED_STRIDE + generation
+
+
+def run_trial(trial, time_limit=None):
+    """
+    Uma execução completa da varredura (executa no pool)
+    time_limit: segundos; passando disso, para ao fim da geração atual
+    retorna: dicionário com o histórico, ou com o erro se não pôde rodar
+    """
+    result = {'combination': trial['combination'], 'seed': trial['seed'],
+              'best_history': [], 'avg_history': [], 'ticks': 0,
+              'elapsed': 0.0, 'truncated': False, 'error': None}
+    config = trial['config']
+    np.random.seed(trial['seed'])
+    random.seed(trial['seed'])
+
+    start = time.perf_counter()
+    try:
+        ea = EvolutionaryAlgorithm(
+            population_size=config.training.population_size,
+            input_size=get_feature_set(DEFAULT_FEATURE_SET).size,
+            output_size=2,
+            verbose=False,
+            operators=trial['operators'],
+            config=config,
+            **trial['hyperparameters']
+        )
+        for generation in range(trial['generations']):
+            if time_limit and time.perf_counter() - start > time_limit:
+                result['truncated'] = True
+                break
+            game = GameEngine(course_seed(trial['seed'], generation), config=config)
+            result['ticks'] += run_generation(ea.population,
+                                              config.training.headless_max_ticks, game)
+            ea.evolve()
+        result['best_history'] = [float(value) for value in ea.best_fitness_history]
+        result['avg_history'] = [float(value) for value in ea.avg_fitness_history]
+    except (ValueError, MemoryError) as e:
+        result['error'] = str(e) or type(e).__name__
+
+    result['elapsed'] = time.perf_counter() - start
+    return result
+
+
+def _limit_resources(memory_limit):
+    """Inicializador dos processos do pool: limita a memória de cada um (MB)"""
+    if not memory_limit:
+        return
+    try:
+        import resource
+    except ImportError:
+        print("⚠ Limite de memória requer o módulo resource (Linux/macOS); ignorado")
+        return
+    limit = memory_limit * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def run_sweep(spec, config=None, workers=None, memory_limit=None, time_limit=None):
+    """
+    Executa todas as execuções da varredura em um pool de processos
+    workers: processos em paralelo (padrão: um por núcleo)
+    memory_limit: memória máxima por processo, em MB (None = sem limite)
+    time_limit: segundos por execução (None = sem limite)
+    retorna: (tabela de comparação, execuções que falharam [(parâmetros, erro)])
+    """
+    trials = build_trials(spec, config)
+    combinations = len(trials) // max(1, spec['repeats'])
+    workers = min(workers or os.cpu_count() or 1, max(1, len(trials)))
+
+    strategy = ("conservadora" if spec['operators'] is None else
+                ", ".join(f"{kind}={name}" for kind, name in
+                          {**DEFAULT_OPERATORS, **spec['operators']}.items()))
+    print(f"\n🔬 Varredura ({spec['search']}, {strategy}): {combinations} combinações x "
+          f"{spec['repeats']} sementes = {len(trials)} execuções de "
+          f"{spec['generations']} gerações ({workers} processos)")
+
+    params = {trial['combination']: trial['params'] for trial in trials}
+    results = []
+
+    def record(result):
+        results.append(result)
+        _print_progress(result, params[result['combination']], len(results), len(trials))
+
+    interrupted = _run_pool(trials, workers, memory_limit, time_limit, record)
+
+    # Um processo morto derruba o pool inteiro e não dá para saber qual
+    # execução o matou: as interrompidas rodam de novo, uma por processo
+    if interrupted:
+        print(f"   ⚠ Um processo foi encerrado pelo sistema; repetindo "
+              f"{len(interrupted)} execuções interrompidas uma a uma")
+    for trial in interrupted:
+        if _run_pool([trial], 1, memory_limit, time_limit, record):
+            # Processo morto pelo sistema (ex: falta de memória)
+            record({'combination': trial['combination'], 'seed': trial['seed'],
+                    'error': "processo encerrado pelo sistema"})
+
+    failed = [(params[result['combination']], result['error'])
+              for result in results if result['error']]
+    return build_table(params, results), failed
+
+
+def _run_pool(trials, workers, memory_limit, time_limit, record):
+    """
+    Executa as execuções em um pool novo, chamando record(resultado) a cada uma
+    retorna: execuções interrompidas porque um processo do pool morreu
+    """
+    interrupted = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_limit_resources,
+                             initargs=(memory_limit,)) as pool:
+        futures = {pool.submit(run_trial, trial, time_limit): trial for trial in trials}
+        for future in as_completed(futures):
+            try:
+                record(future.result())
+            except BrokenProcessPool:
+                interrupted.append(futures[future])
+    return interrupted
+
+
+def _print_progress(result, params, done, total):
+    label = describe_params(params)
+    if result['error']:
+        print(f"   [{done}/{total}] ⚠ {label} (semente {result['seed']}): {result['error']}")
+    else:
+        truncated = " ⏱ tempo esgotado" if result['truncated'] else ""
+        print(f"   [{done}/{total}] {label} (semente {result['seed']}): "
+              f"melhor {max(result['best_history'], default=0):.0f}{truncated}")
+
+
+def format_value(value):
+    """Valor de parâmetro legível (faixas de mutação viram proporção/genes/força)"""
+    if isinstance(value, (list, tuple)):
+        return " ".join(f"{proportion:.0%}/{rate:g}/{strength:g}"
+                        for proportion, rate, strength in value)
+    if isinstance(value, float):
+        return f"{value:.4g}"
+    return str(value)
+
+
+def describe_params(params):
+    """Combinação em uma linha, ex: hidden_size=10 mutation_rate=0.15"""
+    if not params:
+        return "(padrão)"
+    return " ".join(f"{name}={format_value(value)}" for name, value in params.items())
+
+
+def build_table(params, results):
+    """
+    Uma linha por combinação, com as sementes agregadas
+    params: dict combinação → parâmetros
+    Ordena pelo melhor fitness médio (desempate pela média da última geração)
+    """
+    by_combination = {}
+    for result in results:
+        if not result['error']:
+            by_combination.setdefault(result['combination'], []).append(result)
+
+    rows = []
+    for combination, runs in by_combination.items():
+        best = np.array([max(run['best_history'], default=0) for run in runs], dtype=float)
+        final = [run['avg_history'][-1] for run in runs if run['avg_history']]
+        rows.append({
+            'params': params[combination],
+            'best_mean': round(float(best.mean()), 2),
+            'best_std': round(float(best.std()), 2),
+            'final_avg': round(float(np.mean(final)), 2) if final else 0.0,
+            'generations': round(float(np.mean([len(run['best_history']) for run in runs])), 2),
+            'seconds': round(float(np.mean([run['elapsed'] for run in runs])), 2),
+            'runs': len(runs),
+            'truncated': sum(run['truncated'] for run in runs),
+            'scores': [float(value) for value in best],
+        })
+
+    rows.sort(key=lambda row: (row['best_mean'], row['final_avg']), reverse=True)
+    for rank, row in enumerate(rows, 1):
+        row['rank'] = rank
+    return rows
+
+
+def print_table(rows):
+    """Tabela de comparação no terminal"""
+    print(f"\n🏆 Comparação")
+    print(f"{'#':>3}  {'parâmetros':<50} {'melhor':>8} {'±':>6} {'média':>8} "
+          f"{'gerações':>8} {'s':>7}")
+    for row in rows:
+        print(f"{row['rank']:>3}  {describe_params(row['params']):<50} "
+              f"{row['best_mean']:>8.0f} {row['best_std']:>6.0f} {row['final_avg']:>8.0f} "
+              f"{row['generations']:>8.1f} {row['seconds']:>7.1f}"
+              f"{' ⏱' if row['truncated'] else ''}")
+
+
+def save_table(rows, path):
+    """Salva a tabela em CSV (uma coluna por parâmetro) ou JSON (pela extensão)"""
+    if path.endswith('.json'):
+        with open(path, 'w') as f:
+            json.dump(rows, f, indent=2)
+        return
+
+    names = sorted({name for row in rows for name in row['params']})
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=('rank',) + tuple(names) + SWEEP_METRICS)
+        writer.writeheader()
+        for row in rows:
+            line = {name: format_value(row['params'].get(name, '')) for name in names}
+            line.update({key: row[key] for key in ('rank',) + SWEEP_METRICS})
+            writer.writerow(line)
@@ -0,0 +1,668 @@
+"""Linha de comando para execuções headless (sem interface gráfica)"""
+import os
+import pickle
+import argparse
+from game.config import *
+
+
+def operators_from_args(args):
+    """Monta os operadores vetorizados a partir dos argumentos (None = conservador)"""
+    chosen = {kind: getattr(args, kind) for kind in
+              ('selection', 'crossover', 'mutation', 'replacement')
+              if getattr(args, kind)}
+    if not chosen:
+        return None, None
+
+    params = {}
+    if args.tournament_size is not None:
+        params['selection'] = {'tournament_size': args.tournament_size}
+    return chosen, params
+
+
+def add_operator_arguments(parser):
+    """Opções para escolher os operadores genéticos por execução"""
+    from ai.operators import OPERATORS
+
+    group = parser.add_argument_group("operadores genéticos (padrão: estratégia conservadora)")
+    for kind, registry in OPERATORS.items():
+        group.add_argument(f"--{kind}", choices=sorted(registry), default=None)
+    group.add_argument("--tournament-size", type=int, default=None)
+
+
+def add_dtype_argument(parser):
+    """Opção do tipo de ponto flutuante das redes no treino"""
+    parser.add_argument("--dtype", choices=["float16", "float32", "float64"],
+                        default="float32",
+                        help="precisão das redes (float64 para reprodução exata)")
+
+
+def parse_layer(text):
+    """Camada oculta no formato neurônios[:ativação], ex: 16:tanh"""
+    size, _, activation = text.partition(":")
+    try:
+        return int(size), activation or "relu"
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"camada inválida: {text}")
+
+
+def feature_size(name):
+    """Número de entradas de um conjunto de sensores"""
+    from game.sensors import get_feature_set
+    return get_feature_set(name).size
+
+
+def add_features_argument(parser):
+    """Opção do conjunto de entradas dos sensores"""
+    from game.sensors import FEATURE_SETS, DEFAULT_FEATURE_SET
+
+    parser.add_argument("--features", choices=sorted(FEATURE_SETS),
+                        default=DEFAULT_FEATURE_SET,
+                        help="conjunto de entradas dos sensores (gravado no modelo)")
+
+
+def add_architecture_arguments(parser):
+    """Opções da arquitetura das redes"""
+    from ai.neural_network import ACTIVATIONS
+
+    add_features_argument(parser)
+    group = parser.add_argument_group("arquitetura")
+    group.add_argument("--hidden-size", type=int, default=10,
+                       help="neurônios da camada oculta (rede clássica)")
+    group.add_argument("--layers", type=parse_layer, nargs="+", default=None,
+                       metavar="N[:ATIVAÇÃO]",
+                       help="camadas ocultas, ex: 16:tanh 8 "
+                            f"(ativações: {', '.join(sorted(ACTIVATIONS))})")
+    group.add_argument("--recurrent", action="store_true",
+                       help="memória recorrente na primeira camada oculta")
+
+
+def add_replay_arguments(parser):
+    """Opções de gravação de replays das gerações"""
+    parser.add_argument("--record-replays", default=None, metavar="PASTA",
+                        help="grava replays das gerações nesta pasta "
+                             "(rever com: python cli.py replay PASTA)")
+    parser.add_argument("--replay-every", type=int, default=1,
+                        help="grava uma geração a cada N")
+
+
+def add_config_argument(parser):
+    """Opção do arquivo de configuração (física, percurso, tela e treino)"""
+    parser.add_argument("--config", default=None, metavar="ARQUIVO",
+                        help="configuração .toml ou .json (ver game/settings.py); "
+                             "gravada na sessão")
+
+
+def load_config_arg(args):
+    """GameConfig de --config (None = jogo original)"""
+    if not args.config:
+        return None
+    from game.settings import load_config
+    return load_config(args.config)
+
+
+def training_default(value, config, key):
+    """Valor da opção ou, se omitida, o da seção training da configuração"""
+    if value is not None:
+        return value
+    if config is None:
+        from game.settings import DEFAULT_CONFIG
+        config = DEFAULT_CONFIG
+    return getattr(config.training, key)
+
+
+def add_curriculum_argument(parser):
+    """Opção do currículo de dificuldade (percurso escolhido por geração)"""
+    from ai.curriculum import CURRICULUM_TARGET_TICKS
+
+    parser.add_argument("--curriculum", type=int, nargs="?", const=CURRICULUM_TARGET_TICKS,
+                        default=None, metavar="TICKS",
+                        help="ajusta a dificuldade a cada geração para que dure "
+                             f"cerca de TICKS (padrão: {CURRICULUM_TARGET_TICKS})")
+
+
+def run_islands(args):
+    """Treina com o modelo de ilhas e salva o melhor como uma sessão"""
+    from ai.island_model import IslandModel
+    from ai.session_manager import SessionManager
+
+    operators, operator_params = operators_from_args(args)
+    config = load_config_arg(args)
+    model = IslandModel(
+        num_islands=args.islands,
+        island_size=training_default(args.island_size, config, 'population_size'),
+        migration_interval=args.migration_interval,
+        migrants=args.migrants,
+        input_size=feature_size(args.features),
+        feature_set=args.features,
+        hidden_size=args.hidden_size,
+        max_ticks=training_default(args.max_ticks, config, 'headless_max_ticks'),
+        seed=args.seed,
+        operators=operators,
+        operator_params=operator_params,
+        track_behavior=args.track_behavior,
+        dtype=args.dtype,
+        layers=args.layers,
+        recurrent=args.recurrent,
+        replay_dir=args.record_replays,
+        replay_every=args.replay_every,
+        curriculum=args.curriculum,
+        config=config
+    )
+
+    session_manager = SessionManager(sessions_dir=args.sessions_dir)
+    session_manager.start_new_session(config=config)
+
+    best_brain = model.run(args.generations, session_manager)
+    session_manager.end_session(best_brain)
+
+
+def run_steady_state(args):
+    """Treina com evolução steady-state assíncrona e salva o melhor como sessão"""
+    from ai.steady_state import SteadyStateEvolution
+    from ai.session_manager import SessionManager
+
+    if args.seed is not None:
+        import random
+        import numpy as np
+        np.random.seed(args.seed)
+        random.seed(args.seed)
+
+    config = load_config_arg(args)
+    evolution = SteadyStateEvolution(
+        population_size=training_default(args.population_size, config, 'population_size'),
+        input_size=feature_size(args.features),
+        feature_set=args.features,
+        hidden_size=args.hidden_size,
+        elite_size=args.elite_size,
+        workers=args.workers,
+        max_ticks=training_default(args.max_ticks, config, 'headless_max_ticks'),
+        dtype=args.dtype,
+        layers=args.layers,
+        recurrent=args.recurrent,
+        rotate_every=args.rotate_every,
+        config=config
+    )
+
+    session_manager = SessionManager(sessions_dir=args.sessions_dir)
+    session_manager.start_new_session(config=config)
+
+    best_brain = evolution.run(args.evaluations, session_manager)
+    session_manager.end_session(best_brain)
+
+
+def run_neat(args):
+    """Evolui topologias (NEAT) e salva o melhor como sessão"""
+    from ai.neat import NeatEvolution
+    from ai.replay import ReplayRecorder
+    from ai.session_manager import SessionManager
+
+    if args.seed is not None:
+        import random
+        import numpy as np
+        np.random.seed(args.seed)
+        random.seed(args.seed)
+
+    config = load_config_arg(args)
+    evolution = NeatEvolution(
+        population_size=training_default(args.population_size, config, 'population_size'),
+        input_size=feature_size(args.features),
+        feature_set=args.features,
+        activation=args.activation,
+        compatibility_threshold=args.compatibility_threshold,
+        target_species=args.target_species,
+        add_connection_rate=args.add_connection_rate,
+        add_node_rate=args.add_node_rate,
+        max_ticks=training_default(args.max_ticks, config, 'headless_max_ticks'),
+        dtype=args.dtype,
+        config=config
+    )
+
+    recorder = None
+    if args.record_replays:
+        recorder = ReplayRecorder(args.record_replays, evolution.generation,
+                                  args.replay_every)
+
+    session_manager = SessionManager(sessions_dir=args.sessions_dir)
+    session_manager.start_new_session(config=config)
+
+    curriculum = None
+    if args.curriculum:
+        from ai.curriculum import CurriculumScheduler
+        curriculum = CurriculumScheduler(args.curriculum, config=config)
+
+    best_brain = evolution.run(args.generations, session_manager, recorder, curriculum)
+    session_manager.end_session(best_brain)
+
+
+def run_es(args):
+    """Treina com estratégias evolutivas (OpenAI-ES) e salva o melhor como sessão"""
+    import random
+    import numpy as np
+    from ai.evolution_strategies import EvolutionStrategy
+    from ai.neural_network import load_brain
+    from ai.session_manager import SessionManager
+
+    if args.seed is not None:
+        np.random.seed(args.seed)
+        random.seed(args.seed)
+
+    initial_weights = None
+    if args.session or args.model:
+        model_data, _ = load_model(args)
+        if 'topology' in model_data:
+            raise SystemExit("Modelos NEAT não têm layout fixo de genoma para o ES")
+        initial_weights = model_data['weights']
+        args.layers = model_data.get('layers')
+        args.recurrent = model_data.get('recurrent', False)
+        args.hidden_size = model_data['hidden_size']
+        args.features = load_brain(model_data).feature_set
+
+    config = load_config_arg(args)
+    strategy = EvolutionStrategy(
+        population_size=args.population_size,
+        input_size=feature_size(args.features),
+        feature_set=args.features,
+        hidden_size=args.hidden_size,
+        layers=args.layers,
+        recurrent=args.recurrent,
+        sigma=args.sigma,
+        learning_rate=args.learning_rate,
+        weight_decay=args.weight_decay,
+        workers=args.workers,
+        max_ticks=args.max_ticks,
+        dtype=args.dtype,
+        initial_weights=initial_weights,
+        config=config
+    )
+
+    session_manager = SessionManager(sessions_dir=args.sessions_dir)
+    session_manager.start_new_session(config=config)
+
+    best_brain = strategy.run(args.generations, session_manager)
+    session_manager.end_session(best_brain)
+
+
+def load_model(args, session_manager=None):
+    """
+    Carrega o modelo pedido (--session ou --model) e o caminho do arquivo
+    session_manager: gerenciador (e cache) usado para as sessões (padrão: um novo)
+    """
+    if args.model:
+        with open(args.model, 'rb') as f:
+            return pickle.load(f), args.model
+
+    if session_manager is None:
+        from ai.session_manager import SessionManager
+        session_manager = SessionManager(sessions_dir=args.sessions_dir)
+    if args.session:
+        model_data = session_manager.load_session_model(args.session)
+        session_id = args.session
+    else:
+        model_data = session_manager.load_global_best_model()
+        session_id = session_manager.sessions_history["global_best"]["session_id"]
+
+    model_file = session_manager.sessions_history["sessions"][session_id]["model_file"]
+    return model_data, os.path.join(args.sessions_dir, model_file)
+
+
+def add_model_arguments(parser):
+    """Opções para escolher o modelo (padrão: melhor global)"""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--session", default=None, help="id da sessão")
+    group.add_argument("--model", default=None, help="caminho de um arquivo .pkl")
+
+
+def run_compile(args):
+    """Compila um modelo em tabela de consulta + função aritmética"""
+    from ai.neural_network import load_brain
+    from ai.policy_export import (default_grid, compile_policy, export_python_source,
+                                  load_python_policy, sample_play_states,
+                                  accuracy_report, print_accuracy_report)
+    from ai.session_manager import SessionManager
+    from game.settings import GameConfig
+
+    session_manager = None if args.model else SessionManager(sessions_dir=args.sessions_dir)
+    model_data, model_path = load_model(args, session_manager)
+
+    brain = load_brain(model_data)
+    config = GameConfig.from_dict(model_data.get('config'))
+
+    try:
+        grid = default_grid(brain.feature_set)
+    except ValueError as e:
+        raise SystemExit(f"❌ Não é possível compilar este modelo: {e}")
+    if args.bins:
+        if len(args.bins) != brain.input_size:
+            raise SystemExit(f"--bins precisa de {brain.input_size} valores")
+        grid = tuple((low, high, bins) for (low, high, _), bins in zip(grid, args.bins))
+
+    policy = compile_policy(brain, grid)
+    source = export_python_source(brain)
+
+    states = sample_play_states(brain, games=args.games, max_ticks=args.max_ticks,
+                                config=config)
+    report = accuracy_report(brain, policy, states, load_python_policy(source))
+    print_accuracy_report(report)
+
+    prefix = args.output or os.path.splitext(model_path)[0]
+    with open(f"{prefix}_policy.pkl", 'wb') as f:
+        pickle.dump({**policy.to_dict(), "report": report}, f)
+    with open(f"{prefix}_policy.py", 'w') as f:
+        f.write(source)
+    print(f"\n✓ Tabela salva: {prefix}_policy.pkl")
+    print(f"✓ Função aritmética salva: {prefix}_policy.py")
+
+    if args.attach:
+        import shutil
+        from ai.model_cache import write_model_file
+
+        # O modo de visualização usa a tabela anexada no lugar da rede;
+        # o arquivo original fica guardado ao lado
+        backup = f"{model_path}.bak"
+        shutil.copy2(model_path, backup)
+        model_data['compiled_policy'] = policy.to_dict()
+        cache = session_manager.model_cache if session_manager is not None else None
+        write_model_file(model_path, model_data, cache)
+        print(f"✓ Política anexada ao modelo: {model_path} (original: {backup})")
+
+
+def run_video(args):
+    """Renderiza a partida de um modelo em GIF ou quadros PNG, sem janela"""
+    model_data, model_path = load_model(args)
+
+    from video_export import init_offscreen, export_video
+
+    output = args.output
+    if output is None:
+        name = os.path.splitext(os.path.basename(model_path))[0]
+        output = f"{name}.gif" if args.format == "gif" else f"{name}_frames"
+
+    init_offscreen()
+    try:
+        export_video(model_data, output, args.format, args.max_ticks, args.seed,
+                     args.every, args.scale)
+    except ImportError as e:
+        raise SystemExit(f"❌ {e}")
+
+
+def run_benchmark(args):
+    """Avalia todos os modelos salvos nos mesmos percursos e gera o leaderboard"""
+    from ai.benchmark import find_models, run_benchmark, print_leaderboard, save_leaderboard
+
+    paths = args.models or find_models(args.dirs or [args.sessions_dir, "checkpoints"])
+    if not paths:
+        raise SystemExit("❌ Nenhum modelo encontrado")
+
+    rows, skipped = run_benchmark(paths, args.courses, args.max_ticks, args.seed,
+                                  args.workers)
+    print_leaderboard(rows)
+    if skipped:
+        print(f"\n⚠ {len(skipped)} arquivos ignorados (não jogáveis)")
+
+    if args.output:
+        save_leaderboard(rows, args.output)
+        print(f"\n✓ Leaderboard salvo: {args.output}")
+
+
+def run_sweep(args):
+    """Varredura de hiperparâmetros em um pool de processos, com tabela de comparação"""
+    from ai.sweep import load_sweep_spec, run_sweep, print_table, save_table
+
+    # Erros no arquivo (parâmetros, faixas, configuração) aparecem antes do pool
+    try:
+        spec = load_sweep_spec(args.spec)
+        for key in ('generations', 'repeats', 'samples', 'seed'):
+            if getattr(args, key) is not None:
+                spec[key] = getattr(args, key)
+
+        rows, failed = run_sweep(spec, load_config_arg(args), args.workers,
+                                 args.memory_limit, args.time_limit)
+    except ValueError as e:
+        raise SystemExit(f"❌ {e}")
+    print_table(rows)
+    if failed:
+        print(f"\n⚠ {len(failed)} execuções falharam")
+
+    if args.output:
+        save_table(rows, args.output)
+        print(f"\n✓ Tabela salva: {args.output}")
+
+
+def run_startup(args):
+    """Mede a abertura da interface em processos novos (regressões de inicialização)"""
+    from startup_benchmark import run_startup_benchmark
+
+    if not run_startup_benchmark(args.runs, args.budget, args.window):
+        raise SystemExit(1)
+
+
+def replay_paths(path):
+    """Arquivos de replay de um caminho (arquivo ou pasta, em ordem)"""
+    from ai.replay import REPLAY_EXTENSION
+
+    if os.path.isdir(path):
+        paths = sorted(os.path.join(path, name) for name in os.listdir(path)
+                       if name.endswith(REPLAY_EXTENSION))
+    else:
+        paths = [path]
+    if not paths:
+        raise SystemExit(f"❌ Nenhum replay em {path}")
+    return paths
+
+
+def run_replay(args):
+    """Abre o visualizador de replays (ou confere os replays sem janela)"""
+    paths = replay_paths(args.path)
+
+    if args.check:
+        from ai.replay import Replay, ReplayPlayer
+
+        for path in paths:
+            replay = Replay.load(path)
+            difference = ReplayPlayer(replay).verify()
+            status = "✓" if difference == 0 else f"❌ diferença de fitness {difference}"
+            print(f"{os.path.basename(path)}: {replay.size} porquinhos, "
+                  f"{replay.ticks} ticks, melhor {replay.best_fitness:.0f} {status}")
+        return
+
+    from main import DinoAIApp
+    from replay_viewer import replay_mode
+
+    import pygame
+
+    app = DinoAIApp()
+    # Abre na geração mais recente
+    replay_mode(app, paths, len(paths) - 1)
+    pygame.quit()
+
+
+def build_parser():
+    """Monta o parser com um subcomando por modo headless"""
+    parser = argparse.ArgumentParser(description="DINO AI - modos headless")
+    parser.add_argument("--sessions-dir", default="sessions",
+                        help="diretório das sessões salvas")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    islands = subparsers.add_parser("islands",
+                                    help="evolução em ilhas com migração periódica")
+    islands.add_argument("--islands", type=int, default=None,
+                         help="número de ilhas (padrão: um por núcleo)")
+    islands.add_argument("--island-size", type=int, default=None,
+                         help=f"agentes por ilha (padrão: {POPULATION_SIZE} "
+                              "ou o da configuração)")
+    islands.add_argument("--generations", type=int, default=100)
+    islands.add_argument("--migration-interval", type=int, default=10)
+    islands.add_argument("--migrants", type=int, default=2)
+    islands.add_argument("--max-ticks", type=int, default=None,
+                         help=f"limite por geração (padrão: {HEADLESS_MAX_TICKS} "
+                              "ou o da configuração)")
+    islands.add_argument("--seed", type=int, default=None)
+    add_architecture_arguments(islands)
+    add_dtype_argument(islands)
+    islands.add_argument("--track-behavior", action="store_true",
+                         help="usa também a diversidade comportamental (ações)")
+    add_operator_arguments(islands)
+    add_replay_arguments(islands)
+    add_curriculum_argument(islands)
+    add_config_argument(islands)
+    islands.set_defaults(func=run_islands)
+
+    steady = subparsers.add_parser("steady",
+                                   help="evolução steady-state assíncrona em um pool")
+    steady.add_argument("--evaluations", type=int, default=5000,
+                        help="total de partidas avaliadas")
+    steady.add_argument("--population-size", type=int, default=None,
+                        help=f"padrão: {POPULATION_SIZE} ou o da configuração")
+    steady.add_argument("--elite-size", type=int, default=5)
+    steady.add_argument("--workers", type=int, default=None,
+                        help="processos avaliando (padrão: um por núcleo)")
+    steady.add_argument("--max-ticks", type=int, default=None,
+                        help=f"padrão: {HEADLESS_MAX_TICKS} ou o da configuração")
+    steady.add_argument("--rotate-every", type=int, default=None, metavar="N",
+                        help="troca de percurso a cada N avaliações, reavaliando "
+                             "o arquivo (padrão: um percurso só)")
+    steady.add_argument("--seed", type=int, default=None)
+    add_architecture_arguments(steady)
+    add_dtype_argument(steady)
+    add_config_argument(steady)
+    steady.set_defaults(func=run_steady_state)
+
+    neat = subparsers.add_parser("neat",
+                                 help="evolução de topologias (NEAT) com especiação")
+    neat.add_argument("--generations", type=int, default=100)
+    neat.add_argument("--population-size", type=int, default=None,
+                      help=f"padrão: {POPULATION_SIZE} ou o da configuração")
+    neat.add_argument("--activation", default="tanh",
+                      help="ativação dos neurônios ocultos")
+    neat.add_argument("--compatibility-threshold", type=float, default=3.0)
+    neat.add_argument("--target-species", type=int, default=8)
+    neat.add_argument("--add-connection-rate", type=float, default=0.08)
+    neat.add_argument("--add-node-rate", type=float, default=0.03)
+    neat.add_argument("--max-ticks", type=int, default=None,
+                      help=f"padrão: {HEADLESS_MAX_TICKS} ou o da configuração")
+    neat.add_argument("--seed", type=int, default=None)
+    add_features_argument(neat)
+    add_dtype_argument(neat)
+    add_replay_arguments(neat)
+    add_curriculum_argument(neat)
+    add_config_argument(neat)
+    neat.set_defaults(func=run_neat)
+
+    es = subparsers.add_parser("es",
+                               help="estratégias evolutivas (OpenAI-ES) antitéticas")
+    es.add_argument("--generations", type=int, default=200)
+    es.add_argument("--population-size", type=int, default=100,
+                    help="perturbações por geração (par)")
+    es.add_argument("--sigma", type=float, default=0.1)
+    es.add_argument("--learning-rate", type=float, default=0.03)
+    es.add_argument("--weight-decay", type=float, default=0.005)
+    es.add_argument("--workers", type=int, default=None,
+                    help="processos avaliando (padrão: um por núcleo)")
+    es.add_argument("--max-ticks", type=int, default=HEADLESS_MAX_TICKS)
+    es.add_argument("--seed", type=int, default=None)
+    add_model_arguments(es)
+    add_architecture_arguments(es)
+    add_dtype_argument(es)
+    add_config_argument(es)
+    es.set_defaults(func=run_es)
+
+    compile_parser = subparsers.add_parser(
+        "compile", help="congela um modelo em tabela de consulta / função aritmética")
+    add_model_arguments(compile_parser)
+    compile_parser.add_argument("--output", default=None,
+                                help="prefixo dos arquivos gerados")
+    compile_parser.add_argument("--bins", type=int, nargs="+", default=None,
+                                help="divisões da grade por entrada")
+    compile_parser.add_argument("--games", type=int, default=5,
+                                help="partidas usadas no relatório de precisão")
+    compile_parser.add_argument("--max-ticks", type=int, default=HEADLESS_MAX_TICKS)
+    compile_parser.add_argument("--attach", action="store_true",
+                                help="anexa a tabela ao arquivo do modelo "
+                                     "(usada pelo modo de visualização; o "
+                                     "original fica em .bak)")
+    compile_parser.set_defaults(func=run_compile)
+
+    video = subparsers.add_parser("video",
+                                  help="grava a partida de um modelo em GIF/PNG, sem janela")
+    add_model_arguments(video)
+    video.add_argument("--output", default=None,
+                       help="arquivo .gif ou pasta dos quadros PNG")
+    video.add_argument("--format", choices=["gif", "png"], default="gif",
+                       help="gif (requer Pillow) ou sequência de quadros PNG")
+    video.add_argument("--max-ticks", type=int, default=None,
+                       help="duração máxima da partida (padrão: 30 s de jogo no fps do modelo)")
+    video.add_argument("--every", type=int, default=2,
+                       help="um quadro a cada N ticks")
+    video.add_argument("--scale", type=float, default=1.0,
+                       help="escala dos quadros (ex: 0.5 para GIFs menores)")
+    video.add_argument("--seed", type=int, default=None,
+                       help="semente do percurso (mesma semente = mesmo vídeo)")
+    video.set_defaults(func=run_video)
+
+    from ai.benchmark import BENCHMARK_SEED
+
+    benchmark = subparsers.add_parser(
+        "benchmark", help="compara modelos salvos em percursos fixos (leaderboard)")
+    benchmark.add_argument("--dirs", nargs="+", default=None,
+                           help="pastas com modelos .pkl (padrão: sessões e checkpoints)")
+    benchmark.add_argument("--models", nargs="+", default=None,
+                           help="arquivos de modelo específicos (em vez das pastas)")
+    benchmark.add_argument("--courses", type=int, default=20,
+                           help="percursos por modelo")
+    benchmark.add_argument("--max-ticks", type=int, default=HEADLESS_MAX_TICKS)
+    benchmark.add_argument("--seed", type=int, default=BENCHMARK_SEED,
+                           help="semente do primeiro percurso (fixa o conjunto)")
+    benchmark.add_argument("--workers", type=int, default=None,
+                           help="processos em paralelo (padrão: um por núcleo)")
+    benchmark.add_argument("--output", default="leaderboard.csv",
+                           help="arquivo do leaderboard (.csv ou .json)")
+    benchmark.set_defaults(func=run_benchmark)
+
+    sweep = subparsers.add_parser(
+        "sweep", help="varredura de hiperparâmetros (grade ou aleatória) com tabela")
+    sweep.add_argument("spec", help="arquivo .toml ou .json da varredura (ver ai/sweep.py)")
+    sweep.add_argument("--generations", type=int, default=None,
+                       help="gerações por execução (substitui a do arquivo)")
+    sweep.add_argument("--repeats", type=int, default=None,
+                       help="sementes por combinação (substitui a do arquivo)")
+    sweep.add_argument("--samples", type=int, default=None,
+                       help="combinações sorteadas na busca aleatória")
+    sweep.add_argument("--seed", type=int, default=None,
+                       help="primeira semente (percursos e sorteios)")
+    sweep.add_argument("--workers", type=int, default=None,
+                       help="processos em paralelo (padrão: um por núcleo)")
+    sweep.add_argument("--memory-limit", type=int, default=None, metavar="MB",
+                       help="memória máxima por processo")
+    sweep.add_argument("--time-limit", type=float, default=None, metavar="SEGUNDOS",
+                       help="tempo máximo por execução (para ao fim da geração)")
+    sweep.add_argument("--output", default="sweep.csv",
+                       help="arquivo da tabela de comparação (.csv ou .json)")
+    add_config_argument(sweep)
+    sweep.set_defaults(func=run_sweep)
+
+    startup = subparsers.add_parser(
+        "startup", help="tempo até o primeiro quadro do menu (processos novos)")
+    startup.add_argument("--runs", type=int, default=5,
+                         help="aberturas medidas (mediana)")
+    startup.add_argument("--budget", type=float, default=None,
+                         help="falha se o primeiro quadro passar de BUDGET ms")
+    startup.add_argument("--window", action="store_true",
+                         help="abre a janela de verdade (padrão: driver de vídeo dummy)")
+    startup.set_defaults(func=run_startup)
+
+    replay = subparsers.add_parser("replay", help="revê gerações gravadas (--record-replays)")
+    replay.add_argument("path", help="arquivo .replay ou pasta de replays")
+    replay.add_argument("--check", action="store_true",
+                        help="só re-simula (sem janela) e confere o fitness gravado")
+    replay.set_defaults(func=run_replay)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -32,3 +32,6 @@ FPS = 60
 
 # População
 POPULATION_SIZE = 50
+
+# Treinamento headless (sem renderização)
+HEADLESS_MAX_TICKS = 20000
@@ -0,0 +1,66 @@
+"""
+Parâmetros do percurso: velocidade e obstáculos
+
+O GameEngine lê tudo daqui em vez das constantes do módulo, então cada
+partida pode ter o próprio percurso (currículo de dificuldade, ai/curriculum.py).
+O padrão reproduz exatamente o jogo original: mesmos sorteios, na mesma
+ordem, então replays e modelos antigos continuam valendo.
+"""
+from dataclasses import dataclass, asdict, fields
+from game.config import *
+
+
+@dataclass(frozen=True)
+class CourseConfig:
+    """Percurso de uma partida (imutável: pode ser compartilhado entre jogos)"""
+
+    initial_speed: float = INITIAL_SPEED
+    speed_increment: float = SPEED_INCREMENT
+    max_speed: float = MAX_SPEED
+    # Distância até o primeiro obstáculo (tempo para começar)
+    first_gap: int = 400
+    # Distância entre obstáculos, sorteada entre min_gap e max_gap
+    min_gap: int = 250
+    max_gap: int = 450
+    # Tamanhos sorteados nas faixas (vermelhos originais)...
+    min_height: int = 40
+    max_height: int = 70
+    min_width: int = 20
+    max_width: int = 35
+    # ...ou escolhidos entre tipos fixos de cacto (largura, altura)
+    cactus_types: tuple = ()
+
+    def __post_init__(self):
+        # Listas (ex: CACTUS_TYPES, JSON) viram tuplas: o percurso continua imutável
+        object.__setattr__(self, 'cactus_types',
+                           tuple(tuple(cactus) for cactus in self.cactus_types))
+        if not 0 < self.min_gap <= self.max_gap:
+            raise ValueError(f"Distância entre obstáculos inválida: "
+                             f"{self.min_gap}-{self.max_gap}")
+
+    def obstacle_size(self, rng):
+        """Sorteia (altura, largura) de um obstáculo com o gerador do jogo"""
+        if self.cactus_types:
+            width, height = rng.choice(self.cactus_types)
+            return height, width
+        height = rng.randint(self.min_height, self.max_height)
+        width = rng.randint(self.min_width, self.max_width)
+        return height, width
+
+    def to_dict(self):
+        """Dicionário simples (replays, sessões)"""
+        data = asdict(self)
+        data['cactus_types'] = [list(cactus) for cactus in self.cactus_types]
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """Percurso gravado com to_dict (chaves desconhecidas são ignoradas)"""
+        if data is None:
+            return cls()
+        names = {field.name for field in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in names})
+
+
+# Percurso do jogo original
+DEFAULT_COURSE = CourseConfig()
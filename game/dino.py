@@ -2,17 +2,26 @@
 import pygame
 import random
 from game.config import *
+from game.settings import DEFAULT_CONFIG
 
 
 class Dino:
-    def __init__(self):
-        self.x = DINO_X
-        self.y = GROUND_Y
+    def __init__(self, config=None):
+        """config: GameConfig (física do pulo e posição; padrão: jogo original)"""
+        physics = (DEFAULT_CONFIG if config is None else config).physics
+        # Tabelas do pulo desta física (compartilhadas entre porquinhos)
+        self.jump_arc = physics.jump
+        self.ground_y = physics.ground_y
+        self.x = physics.dino_x
+        self.y = self.ground_y
         # HITBOX ORIGINAL - NÃO MUDA
         self.width = 40
         self.height = 50
         self.velocity_y = 0
         self.is_jumping = False
+        # Ticks desde a decolagem e base do arco (ver game/trajectory.py)
+        self.air_ticks = 0
+        self.arc_base = 1
         self.is_ducking = False
         self.fitness = 0
         self.alive = True
@@ -82,32 +91,40 @@ class Dino:
     def jump(self):
         """Faz o porquinho pular"""
         if not self.is_jumping and not self.is_ducking:
-            self.velocity_y = JUMP_VELOCITY
+            self.velocity_y = self.jump_arc.jump_velocity
             self.is_jumping = True
+            self.air_ticks = 0
+            self.arc_base = 1
             
     def duck(self):
         """Faz o porquinho abaixar"""
         if not self.is_jumping:
             self.is_ducking = True
             self.height = 30
-            self.y = GROUND_Y + 20
+            self.y = self.ground_y + 20
             
     def stand(self):
         """Volta à posição normal"""
         self.is_ducking = False
         self.height = 50
-        self.y = GROUND_Y
+        self.y = self.ground_y
+        # No ar, o arco continua a partir do chão no próximo tick
+        if self.is_jumping:
+            self.arc_base = self.air_ticks + 1
         
     def update(self):
-        """Atualiza física do porquinho"""
+        """Atualiza física do porquinho (arco do pulo tabelado)"""
         if self.is_jumping:
-            self.velocity_y += GRAVITY
-            self.y += self.velocity_y
+            self.air_ticks += 1
+            arc = self.jump_arc
             
-            if self.y >= GROUND_Y:
-                self.y = GROUND_Y
+            if self.air_ticks >= arc.landing[self.arc_base]:
+                self.y = self.ground_y
                 self.velocity_y = 0
                 self.is_jumping = False
+            else:
+                self.velocity_y = arc.velocities[self.air_ticks]
+                self.y = arc.heights[self.arc_base][self.air_ticks]
                 
         self.fitness += 1
         
@@ -1,35 +1,72 @@
 """Motor do jogo"""
+import copy
 import random
+from collections import deque
+from itertools import islice
 from game.config import *
+from game.settings import DEFAULT_CONFIG
+from game.world import WorldSnapshot
 
 class GameEngine:
     """Motor principal do jogo"""
     
-    def __init__(self):
-        """Inicializa motor do jogo"""
+    def __init__(self, seed=None, course=None, config=None):
+        """
+        Inicializa motor do jogo
+        seed: semente do percurso; com ela os obstáculos usam um gerador
+              próprio e a partida é reproduzível (replays)
+        course: CourseConfig com velocidade e obstáculos (padrão: o de config)
+        config: GameConfig (chão, borda da tela e percurso; padrão: jogo original)
+        """
         from game.obstacle import Obstacle
         self.Obstacle = Obstacle
         
-        self.obstacles = []
+        self.seed = seed
+        self.rng = random if seed is None else random.Random(seed)
+        self.config = DEFAULT_CONFIG if config is None else config
+        self.course = self.config.course if course is None else course
+        
+        # Ordenados por x: nascem sempre à direita e andam juntos
+        self.obstacles = deque()
+        # Quantos obstáculos do início da fila já passaram do dinossauro
+        self.passed = 0
+        # Retrato do tick atual (sensores e colisão), refeito a cada update
+        self.world = None
         self.score = 0
-        self.speed = INITIAL_SPEED
+        self.speed = self.course.initial_speed
         self.distance_since_last_obstacle = 0
         # Distância inicial maior para dar tempo de começar
-        self.next_obstacle_distance = 400
+        self.next_obstacle_distance = self.course.first_gap
         
     def reset(self):
-        """Reinicia o jogo"""
-        self.obstacles = []
+        """Reinicia o jogo (com semente, repete o mesmo percurso)"""
+        if self.seed is not None:
+            self.rng = random.Random(self.seed)
+        self.obstacles = deque()
+        self.passed = 0
+        self.world = None
         self.score = 0
-        self.speed = INITIAL_SPEED
+        self.speed = self.course.initial_speed
         self.distance_since_last_obstacle = 0
-        self.next_obstacle_distance = 400
+        self.next_obstacle_distance = self.course.first_gap
+        
+    def fork(self):
+        """
+        Cópia independente no mesmo tick: os próximos obstáculos são os mesmos
+        (o gerador é copiado, inclusive o global quando não há semente)
+        """
+        clone = copy.copy(self)
+        clone.rng = random.Random()
+        clone.rng.setstate(self.rng.getstate())
+        clone.obstacles = deque(copy.copy(obstacle) for obstacle in self.obstacles)
+        clone.world = None
+        return clone
         
     def update(self):
         """Atualiza estado do jogo"""
         # Atualiza velocidade gradualmente
-        if self.speed < MAX_SPEED:
-            self.speed += SPEED_INCREMENT
+        if self.speed < self.course.max_speed:
+            self.speed += self.course.speed_increment
             
         # Atualiza score
         self.score += 1
@@ -38,44 +75,48 @@ class GameEngine:
         for obstacle in self.obstacles:
             obstacle.update(self.speed)
             
-        # Remove obstáculos fora da tela
-        self.obstacles = [obs for obs in self.obstacles if not obs.off_screen()]
+        # Remove obstáculos fora da tela (sempre os primeiros da fila)
+        while self.obstacles and self.obstacles[0].off_screen():
+            self.obstacles.popleft()
+            self.passed = max(0, self.passed - 1)
         
         # Cria novos obstáculos
         self.distance_since_last_obstacle += self.speed
         
         if self.distance_since_last_obstacle >= self.next_obstacle_distance:
-            # TAMANHOS ORIGINAIS DOS RETÂNGULOS VERMELHOS
-            height = random.randint(40, 70)  # Altura original: 40-70
-            width = random.randint(20, 35)   # Largura original: 20-35
-            obstacle = self.Obstacle(SCREEN_WIDTH + 50, height, width)
+            # Tamanhos do percurso (padrão: retângulos vermelhos originais)
+            height, width = self.course.obstacle_size(self.rng)
+            obstacle = self.Obstacle(self.config.display.screen_width + 50, height, width,
+                                     self.config.physics.ground_y)
             self.obstacles.append(obstacle)
             
             self.distance_since_last_obstacle = 0
-            # FREQUÊNCIA ORIGINAL: 250-450 pixels entre obstáculos
-            self.next_obstacle_distance = random.randint(250, 450)
+            # Frequência do percurso (padrão: 250-450 pixels entre obstáculos)
+            self.next_obstacle_distance = self.rng.randint(self.course.min_gap,
+                                                           self.course.max_gap)
+            
+        # Avança o índice do próximo obstáculo à frente do dinossauro (x > 50)
+        while self.passed < len(self.obstacles) and self.obstacles[self.passed].x <= 50:
+            self.passed += 1
+        self.world = None
             
+    def snapshot(self):
+        """Retrato do tick atual, calculado uma vez e compartilhado por todos os agentes"""
+        if self.world is None:
+            self.world = WorldSnapshot(self.obstacles, self.passed, self.speed)
+        return self.world
+        
     def get_next_obstacle(self):
         """Retorna o próximo obstáculo mais próximo"""
-        if not self.obstacles:
-            return None
-            
-        # Obstáculos à frente do dinossauro
-        ahead_obstacles = [obs for obs in self.obstacles if obs.x > 50]
+        if self.passed < len(self.obstacles):
+            return self.obstacles[self.passed]
+        return None
         
-        if not ahead_obstacles:
-            return None
-            
-        return min(ahead_obstacles, key=lambda obs: obs.x)
+    def get_next_obstacles(self, count):
+        """Retorna até count obstáculos à frente, do mais próximo ao mais distante"""
+        return list(islice(self.obstacles, self.passed, self.passed + count))
         
     def check_collision(self, dino):
         """Verifica colisão com dinossauro"""
-        dino_rect = dino.get_rect()
-        
-        for obstacle in self.obstacles:
-            obstacle_rect = obstacle.get_rect()
-            
-            if dino_rect.colliderect(obstacle_rect):
-                return True
-                
-        return False
+        hits = self.snapshot().collisions([dino.x], [dino.y], [dino.width], [dino.height])
+        return bool(hits[0])
@@ -5,12 +5,12 @@ from game.config import GROUND_Y
 class Obstacle:
     """Obstáculo em forma de cacto que o dinossauro deve evitar"""
     
-    def __init__(self, x, height, width):
+    def __init__(self, x, height, width, ground_y=GROUND_Y):
         """Inicializa obstáculo com posição e dimensões"""
         self.x = x
         self.height = height
         self.width = width
-        self.y = GROUND_Y + 50 - height  # Posicionado no chão
+        self.y = ground_y + 50 - height  # Posicionado no chão
         self.speed = 0
         
         # Cores do cacto
@@ -1,11 +1,14 @@
 """Renderização gráfica com painel de estatísticas melhorado"""
 import pygame
 from game.config import *
+from game.settings import DEFAULT_CONFIG
 
 
 class Renderer:
-    def __init__(self, screen):
+    def __init__(self, screen, config=None):
+        """config: GameConfig (tamanho base da tela e altura do chão)"""
         self.screen = screen
+        self.config = DEFAULT_CONFIG if config is None else config
         
         # Fontes mais legíveis
         try:
@@ -17,8 +20,8 @@ class Renderer:
             self.font_medium = pygame.font.Font(None, 28)
             self.font_small = pygame.font.Font(None, 24)
         
-        self.base_width = SCREEN_WIDTH
-        self.base_height = SCREEN_HEIGHT
+        self.base_width = self.config.display.screen_width
+        self.base_height = self.config.display.screen_height
         self.game_surface = pygame.Surface((self.base_width, self.base_height))
         
         self.update_scale()
@@ -49,7 +52,7 @@ class Renderer:
         self.game_surface.fill((245, 245, 245))
         
         # === CHÃO ===
-        ground_y = GROUND_Y + 50
+        ground_y = self.config.physics.ground_y + 50
         
         # Terra (marrom)
         ground_rect = pygame.Rect(0, ground_y, self.base_width, 
@@ -0,0 +1,164 @@
+"""
+Sensores: vetor de entrada das redes para todos os agentes de uma vez
+
+Os conjuntos de entradas são versionados. O nome do conjunto fica gravado
+no modelo salvo, para que treino, visualização e avaliações headless
+sempre alimentem a rede com as mesmas entradas com que ela foi treinada.
+"""
+import numpy as np
+from game.config import *
+from game.trajectory import time_to_land
+
+
+class FeatureSet:
+    """Conjunto versionado de entradas"""
+
+    def __init__(self, name, names, idle, compute):
+        """
+        names: nome de cada entrada (ordem das colunas)
+        idle: valores quando não há obstáculo à frente (None se variam)
+        compute: função (retrato do tick, x, y, velocidade_y, GameConfig) → lista de colunas
+        """
+        self.name = name
+        self.names = tuple(names)
+        self.idle = None if idle is None else tuple(idle)
+        self.compute = compute
+
+    @property
+    def size(self):
+        return len(self.names)
+
+
+# Quantos obstáculos à frente o conjunto v3 enxerga
+LOOKAHEAD = 3
+
+# Valores de distância, altura e largura de um obstáculo ausente
+MISSING_OBSTACLE = (1.0, 1.0, 1.0)
+
+
+def _obstacle_columns(obstacle, x, config):
+    """Distância, altura e largura de um obstáculo (normalizadas)"""
+    if obstacle is None:
+        return [np.full(len(x), value) for value in MISSING_OBSTACLE]
+    return [
+        (obstacle.x - x) / config.display.screen_width,
+        np.full(len(x), obstacle.height / 100.0),
+        np.full(len(x), obstacle.width / 100.0),
+    ]
+
+
+def _dino_columns(y, velocity_y, config):
+    """Altura e velocidade vertical do porquinho (normalizadas)"""
+    return [y / config.display.screen_height, (velocity_y + 20) / 40.0]
+
+
+def _on_ground_column(velocity_y):
+    """Está no chão? (velocidade = 0 significa no chão)"""
+    return [(velocity_y == 0).astype(np.float64)]
+
+
+def _features_v1(world, x, y, velocity_y, config):
+    obstacle = world.next_obstacle
+    if obstacle is None:
+        return [np.full(len(x), value) for value in FEATURE_SETS['v1'].idle]
+    return _obstacle_columns(obstacle, x, config) + _dino_columns(y, velocity_y, config)
+
+
+def _features_v2(world, x, y, velocity_y, config):
+    if world.next_obstacle is None:
+        return [np.full(len(x), value) for value in FEATURE_SETS['v2'].idle]
+    return _features_v1(world, x, y, velocity_y, config) + _on_ground_column(velocity_y)
+
+
+def _features_v3(world, x, y, velocity_y, config):
+    obstacles = world.next_obstacles(LOOKAHEAD)
+    obstacles += [None] * (LOOKAHEAD - len(obstacles))
+
+    columns = []
+    for obstacle in obstacles:
+        columns += _obstacle_columns(obstacle, x, config)
+    speed = np.full(len(x), world.speed / config.course.max_speed)
+    return (columns + _dino_columns(y, velocity_y, config) +
+            _on_ground_column(velocity_y) + [speed])
+
+
+def _features_v4(world, x, y, velocity_y, config):
+    # Ticks até o pouso (pela tabela do pulo da física do jogo), 0 no chão
+    jump = config.physics.jump
+    landing = time_to_land(y, velocity_y, jump) / jump.max_air_ticks
+    return _features_v3(world, x, y, velocity_y, config) + [landing]
+
+
+def _lookahead_names():
+    names = []
+    for i in range(1, LOOKAHEAD + 1):
+        names += [f"distancia_{i}", f"altura_{i}", f"largura_{i}"]
+    return names + ['y', 'velocidade', 'no_chao', 'velocidade_jogo']
+
+
+FEATURE_SETS = {
+    # Entradas originais (modelos antigos de 5 entradas)
+    'v1': FeatureSet('v1',
+                     ('distancia', 'altura', 'largura', 'y', 'velocidade'),
+                     (1.0, 1.0, 1.0, 0.0, 0.0),
+                     _features_v1),
+    # v1 + no chão
+    'v2': FeatureSet('v2',
+                     ('distancia', 'altura', 'largura', 'y', 'velocidade', 'no_chao'),
+                     (1.0, 1.0, 1.0, 0.0, 0.0, 1.0),
+                     _features_v2),
+    # Próximos LOOKAHEAD obstáculos + porquinho + velocidade do jogo
+    'v3': FeatureSet('v3', _lookahead_names(), None, _features_v3),
+    # v3 + tempo até o pouso
+    'v4': FeatureSet('v4', _lookahead_names() + ['tempo_pouso'], None, _features_v4),
+}
+
+DEFAULT_FEATURE_SET = 'v2'
+
+# Modelos salvos antes dos conjuntos versionados: deduzido pelo número de entradas
+LEGACY_FEATURE_SETS = {5: 'v1', 6: 'v2'}
+
+
+def get_feature_set(name):
+    """Busca um conjunto de entradas pelo nome"""
+    if name not in FEATURE_SETS:
+        available = ", ".join(sorted(FEATURE_SETS))
+        raise ValueError(f"Conjunto de entradas desconhecido: {name} "
+                         f"(disponíveis: {available})")
+    return FEATURE_SETS[name]
+
+
+def resolve_feature_set(name, input_size):
+    """
+    Nome do conjunto de entradas de uma rede
+    Sem nome (modelos antigos), escolhe o conjunto original com input_size
+    entradas; None se nenhum servir (rede fora do jogo)
+    """
+    if name is None:
+        return LEGACY_FEATURE_SETS.get(input_size)
+
+    if get_feature_set(name).size != input_size:
+        raise ValueError(f"O conjunto {name} tem {get_feature_set(name).size} "
+                         f"entradas, a rede tem {input_size}")
+    return name
+
+
+def sense_arrays(game, x, y, velocity_y, feature_set=DEFAULT_FEATURE_SET, config=None):
+    """
+    Entradas de vários agentes a partir de arrays de posição
+    O próximo obstáculo é o mesmo para todos: vem do retrato do tick
+    config: GameConfig da normalização e do pulo (padrão: a do jogo)
+    retorna: matriz (agentes, entradas)
+    """
+    columns = get_feature_set(feature_set).compute(
+        game.snapshot(), np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64),
+        np.asarray(velocity_y, dtype=np.float64), game.config if config is None else config)
+    return np.column_stack(columns)
+
+
+def sense(dinos, game, feature_set=DEFAULT_FEATURE_SET, config=None):
+    """Entradas de uma lista de porquinhos (uma linha por porquinho)"""
+    x = [dino.x for dino in dinos]
+    y = [dino.y for dino in dinos]
+    velocity_y = [dino.velocity_y for dino in dinos]
+    return sense_arrays(game, x, y, velocity_y, feature_set, config)
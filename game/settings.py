@@ -0,0 +1,178 @@
+"""
+Configuração tipada e imutável de uma execução
+
+As constantes de game/config.py continuam sendo o padrão, mas física,
+percurso, tela e treino também podem vir de um GameConfig passado
+explicitamente para GameEngine, Dino, Population, EvolutionaryAlgorithm e
+Renderer. Assim execuções com parâmetros diferentes convivem no mesmo
+processo (varreduras de parâmetros em um pool), sem reimportar módulos.
+
+Arquivos TOML ou JSON têm uma seção por grupo; campos ausentes ficam com
+o padrão:
+
+    [physics]
+    gravity = 1.0
+
+    [course]
+    speed_increment = 0.006
+"""
+import os
+import json
+from dataclasses import dataclass, field, fields, asdict
+from game.config import *
+from game.course import CourseConfig
+from game.trajectory import jump_tables
+
+
+@dataclass(frozen=True)
+class PhysicsConfig:
+    """Física do porquinho"""
+
+    gravity: float = GRAVITY
+    jump_velocity: float = JUMP_VELOCITY
+    ground_y: int = GROUND_Y
+    dino_x: int = DINO_X
+
+    def __post_init__(self):
+        if self.gravity <= 0 or self.jump_velocity >= 0:
+            raise ValueError("A física precisa de gravidade positiva e pulo para cima "
+                             f"(gravity={self.gravity}, jump_velocity={self.jump_velocity})")
+
+    @property
+    def jump(self):
+        """Tabelas do pulo desta física (game/trajectory.py)"""
+        return jump_tables(self.jump_velocity, self.gravity, self.ground_y)
+
+
+@dataclass(frozen=True)
+class DisplayConfig:
+    """
+    Tela base do jogo (os obstáculos nascem na borda direita) e quadros por
+    segundo em tempo real (visualização, replays e vídeos)
+    """
+
+    screen_width: int = SCREEN_WIDTH
+    screen_height: int = SCREEN_HEIGHT
+    fps: int = FPS
+
+
+@dataclass(frozen=True)
+class TrainingConfig:
+    """Padrões dos treinos"""
+
+    population_size: int = POPULATION_SIZE
+    headless_max_ticks: int = HEADLESS_MAX_TICKS
+
+
+# Seção do arquivo → classe
+SECTIONS = {
+    'physics': PhysicsConfig,
+    'course': CourseConfig,
+    'display': DisplayConfig,
+    'training': TrainingConfig,
+}
+
+
+def _check_type(section, name, expected, value):
+    """Valida o tipo de um campo lido de arquivo (int serve onde se espera float)"""
+    if expected is float:
+        valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+    elif expected is int:
+        valid = isinstance(value, int) and not isinstance(value, bool)
+    elif expected is tuple:
+        valid = isinstance(value, (list, tuple))
+    else:
+        valid = isinstance(value, expected)
+    if not valid:
+        raise ValueError(f"{section}.{name}: esperado {expected.__name__}, "
+                         f"recebido {value!r}")
+
+
+def _build_section(section, data):
+    cls = SECTIONS[section]
+    types = {item.name: item.type for item in fields(cls)}
+    for name, value in data.items():
+        if name not in types:
+            available = ", ".join(sorted(types))
+            raise ValueError(f"Campo desconhecido: {section}.{name} "
+                             f"(disponíveis: {available})")
+        _check_type(section, name, types[name], value)
+    return cls(**data)
+
+
+@dataclass(frozen=True)
+class GameConfig:
+    """Configuração completa: física, percurso, tela e treino"""
+
+    physics: PhysicsConfig = field(default_factory=PhysicsConfig)
+    course: CourseConfig = field(default_factory=CourseConfig)
+    display: DisplayConfig = field(default_factory=DisplayConfig)
+    training: TrainingConfig = field(default_factory=TrainingConfig)
+
+    def to_dict(self):
+        """Dicionário simples por seção (sessões, arquivos JSON)"""
+        data = asdict(self)
+        data['course'] = self.course.to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Configuração a partir de um dicionário por seção (None = padrão)
+        Seções e campos desconhecidos ou com tipo errado geram ValueError
+        """
+        if data is None:
+            return cls()
+        unknown = set(data) - set(SECTIONS)
+        if unknown:
+            raise ValueError(f"Seção desconhecida: {', '.join(sorted(unknown))} "
+                             f"(disponíveis: {', '.join(SECTIONS)})")
+        return cls(**{section: _build_section(section, values)
+                      for section, values in data.items()})
+
+    def with_overrides(self, overrides):
+        """
+        Cópia com alguns campos trocados
+        overrides: dict 'seção.campo' → valor, ex: {'physics.gravity': 1.0}
+        """
+        data = self.to_dict()
+        for key, value in overrides.items():
+            section, _, name = key.partition('.')
+            if section not in data or not name:
+                raise ValueError(f"Campo inválido: {key} (use seção.campo)")
+            data[section][name] = value
+        return GameConfig.from_dict(data)
+
+
+# Jogo original (constantes de game/config.py)
+DEFAULT_CONFIG = GameConfig()
+
+
+def read_settings_file(path):
+    """
+    Lê um arquivo .toml ou .json (configurações, varreduras em ai/sweep.py)
+    retorna: dicionário
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.toml':
+        try:
+            import tomllib
+        except ImportError:
+            raise ImportError("Ler TOML requer Python 3.11+ (tomllib); "
+                              "use um arquivo .json") from None
+        with open(path, 'rb') as f:
+            data = tomllib.load(f)
+    elif extension == '.json':
+        with open(path) as f:
+            data = json.load(f)
+    else:
+        raise ValueError(f"Formato de arquivo não suportado: {path} (.toml ou .json)")
+    return data
+
+
+def load_config(path):
+    """
+    Lê uma configuração de arquivo .toml ou .json
+    retorna: GameConfig
+    """
+    return GameConfig.from_dict(read_settings_file(path))
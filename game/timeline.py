@@ -0,0 +1,122 @@
+"""
+Linha do tempo do percurso, simulada antes dos agentes
+
+O percurso não depende dos agentes: uma cópia do GameEngine pode andar na
+frente e guardar, tick a tick, as posições dos obstáculos e a velocidade.
+Entre dois eventos do percurso (obstáculo nasce, sai da tela ou passa do
+porquinho) o conjunto de obstáculos é o mesmo; um trecho desses vira uma
+WorldWindow, que responde aos sensores e à colisão de vários ticks de uma
+vez (uma linha por tick), com as mesmas contas do WorldSnapshot.
+"""
+import numpy as np
+from game.world import _pixels
+
+
+class _Track:
+    """Um obstáculo ao longo de uma janela (x é um array, um valor por tick)"""
+
+    def __init__(self, x, height, width):
+        self.x = x
+        self.height = height
+        self.width = width
+
+
+class WorldWindow:
+    """Retrato de vários ticks seguidos com os mesmos obstáculos"""
+
+    def __init__(self, obstacles, passed, speeds, positions):
+        """
+        obstacles: obstáculos do trecho (ordenados por x)
+        passed: quantos do início já passaram do dinossauro
+        speeds: velocidade do jogo em cada tick
+        positions: matriz (ticks, obstáculos) com o x exato de cada um
+        """
+        self.speed = np.asarray(speeds, dtype=np.float64)
+        self.positions = positions
+        self.ahead = [_Track(positions[:, i], obstacle.height, obstacle.width)
+                      for i, obstacle in enumerate(obstacles) if i >= passed]
+        self.next_obstacle = self.ahead[0] if self.ahead else None
+
+        self.left = _pixels(positions)
+        self.top = _pixels([obstacle.y for obstacle in obstacles])
+        self.width = _pixels([obstacle.width for obstacle in obstacles])
+        self.height = _pixels([obstacle.height for obstacle in obstacles])
+
+    def __len__(self):
+        return len(self.speed)
+
+    def next_obstacles(self, count):
+        """Até count obstáculos à frente, do mais próximo ao mais distante"""
+        return self.ahead[:count]
+
+    def collisions(self, x, y, width, height):
+        """
+        Colisão de um porquinho em cada tick da janela (regra de colliderect)
+        x, y, width, height: valores do porquinho, um por tick
+        retorna: array booleano, um por tick
+        """
+        left, top = _pixels(x)[:, None], _pixels(y)[:, None]
+        right, bottom = left + _pixels(width)[:, None], top + _pixels(height)[:, None]
+
+        hits = ((left < self.left + self.width) & (right > self.left) &
+                (top < self.top + self.height) & (bottom > self.top))
+        return hits.any(axis=1)
+
+
+class WorldTimeline:
+    """Ticks futuros do percurso, simulados em uma cópia do jogo sob demanda"""
+
+    def __init__(self, game):
+        """game: jogo no tick atual (não é alterado; a cópia anda sozinha)"""
+        self.game = game.fork()
+        # Primeiro tick guardado (o próximo do jogo original)
+        self.first = game.score + 1
+        self.speeds = []
+        self.positions = []
+        # Trechos: (primeiro tick, obstáculos, passados)
+        self.segments = []
+        self.segment_of = []
+
+    @property
+    def last(self):
+        """Último tick já simulado"""
+        return self.first + len(self.speeds) - 1
+
+    def _advance(self):
+        game = self.game
+        game.update()
+        obstacles = game.obstacles
+        segment = self.segments[-1] if self.segments else None
+
+        if (segment is None or segment[2] != game.passed or
+                len(segment[1]) != len(obstacles) or
+                (obstacles and segment[1][0] is not obstacles[0])):
+            self.segments.append((game.score, tuple(obstacles), game.passed))
+
+        self.speeds.append(game.speed)
+        self.positions.append([obstacle.x for obstacle in obstacles])
+        self.segment_of.append(len(self.segments) - 1)
+
+    def window(self, tick, limit):
+        """
+        Ticks de tick em diante até o próximo evento do percurso
+        limit: último tick que pode entrar na janela
+        retorna: WorldWindow (pelo menos um tick)
+        """
+        while self.last < tick:
+            self._advance()
+
+        segment = self.segment_of[tick - self.first]
+        end = tick
+        while end < limit:
+            if self.last <= end:
+                self._advance()
+            if self.segment_of[end + 1 - self.first] != segment:
+                break
+            end += 1
+
+        start, stop = tick - self.first, end + 1 - self.first
+        _, obstacles, passed = self.segments[segment]
+        positions = np.array(self.positions[start:stop], dtype=np.float64)
+        return WorldWindow(obstacles, passed, self.speeds[start:stop],
+                           positions.reshape(stop - start, len(obstacles)))
@@ -0,0 +1,127 @@
+"""
+Trajetória do pulo pré-calculada
+
+O arco do pulo é sempre o mesmo: velocidade inicial JUMP_VELOCITY e
+GRAVITY somada a cada tick. As tabelas guardam, por tick desde a
+decolagem, a velocidade e a altura exatamente como a integração tick a
+tick as calcularia (mesmas somas de ponto flutuante, na mesma ordem).
+
+Ficar em pé no ar (stand) devolve y ao chão sem zerar a velocidade
+(comportamento original, mantido). A altura depende então do tick em que
+isso aconteceu por último, a "base" do arco: JUMP_HEIGHTS[base][tick].
+Sem stand no ar, a base é 1 (a decolagem).
+"""
+from functools import lru_cache
+import numpy as np
+from game.config import *
+
+
+def _build_tables(jump_velocity=JUMP_VELOCITY, gravity=GRAVITY, ground_y=GROUND_Y):
+    """Velocidades, alturas por base e tick de pouso por base"""
+    velocities = [jump_velocity]
+    heights = [[]]
+    landing = [0]
+
+    base = 1
+    while True:
+        row = [None] * base
+        y = ground_y
+        tick = base
+        while True:
+            while len(velocities) <= tick:
+                velocities.append(velocities[-1] + gravity)
+            y += velocities[tick]
+            if y >= ground_y:
+                break
+            row.append(y)
+            tick += 1
+        heights.append(row)
+        landing.append(tick)
+
+        # Bases depois do pouso natural (base 1) não acontecem
+        if base >= landing[1]:
+            break
+        base += 1
+
+    return velocities, heights, landing
+
+
+class JumpTables:
+    """
+    Tabelas do pulo de uma física (ver jump_tables)
+    velocities[tick]: velocidade depois de cada tick no ar (0: a de decolagem)
+    heights[base][tick]: y depois do tick, com y no chão antes do tick base
+    landing[base]: tick em que o porquinho toca o chão
+    max_air_ticks: duração do pulo completo (sem stand no ar)
+    As mesmas tabelas como arrays servem às consultas vetorizadas
+    (velocity_table, arc_table com NaN fora do arco, landing_table)
+    """
+
+    def __init__(self, jump_velocity, gravity, ground_y):
+        self.key = (jump_velocity, gravity, ground_y)
+        self.jump_velocity = jump_velocity
+        self.ground_y = ground_y
+        self.velocities, self.heights, self.landing = _build_tables(*self.key)
+        self.max_air_ticks = self.landing[1]
+
+        self.velocity_table = np.array(self.velocities[:self.max_air_ticks], dtype=np.float64)
+        self.arc_table = np.full((self.max_air_ticks + 1, self.max_air_ticks), np.nan)
+        for base in range(1, self.max_air_ticks + 1):
+            for tick in range(base, self.landing[base]):
+                self.arc_table[base, tick] = self.heights[base][tick]
+        self.landing_table = np.array(self.landing)
+
+    def __deepcopy__(self, memo):
+        # Imutáveis na prática: cópias de porquinhos (replays) compartilham
+        return self
+
+    def __reduce__(self):
+        return jump_tables, self.key
+
+
+@lru_cache(maxsize=None)
+def jump_tables(jump_velocity=JUMP_VELOCITY, gravity=GRAVITY, ground_y=GROUND_Y):
+    """Tabelas do pulo, calculadas uma vez por física"""
+    return JumpTables(jump_velocity, gravity, ground_y)
+
+
+# Tabelas da física padrão (game/config.py)
+DEFAULT_JUMP = jump_tables()
+JUMP_VELOCITIES, JUMP_HEIGHTS, LANDING_TICKS = (DEFAULT_JUMP.velocities, DEFAULT_JUMP.heights,
+                                                DEFAULT_JUMP.landing)
+
+# Duração do pulo completo da física padrão (sem stand no ar)
+MAX_AIR_TICKS = DEFAULT_JUMP.max_air_ticks
+
+
+def air_state(y, velocity_y, jump=DEFAULT_JUMP):
+    """
+    Tick no ar e base do arco a partir da altura e da velocidade
+    (os valores são exatamente os das tabelas, então a busca é exata)
+    jump: JumpTables da física do porquinho (PhysicsConfig.jump)
+    retorna: (tick, base), arrays; 0 para quem está no chão
+    """
+    y = np.asarray(y, dtype=np.float64)
+    velocity_y = np.asarray(velocity_y, dtype=np.float64)
+    max_air_ticks = jump.max_air_ticks
+
+    # A velocidade só cresce: o tick é a posição dela na tabela
+    tick = np.searchsorted(jump.velocity_table, velocity_y)
+    airborne = (velocity_y != 0) & (tick < max_air_ticks)
+    airborne &= jump.velocity_table[np.minimum(tick, max_air_ticks - 1)] == velocity_y
+    tick = np.where(airborne, tick, 0)
+
+    # A base é a linha da tabela com essa altura nesse tick
+    matches = jump.arc_table[:, tick].T == y[:, None]
+    base = np.where(airborne & matches.any(axis=1), matches.argmax(axis=1), 0)
+    return tick, base
+
+
+def time_to_land(y, velocity_y, jump=DEFAULT_JUMP):
+    """
+    Ticks até o pouso se o porquinho não ficar em pé no ar de novo
+    jump: JumpTables da física do porquinho (PhysicsConfig.jump)
+    retorna: array (0 para quem está no chão)
+    """
+    tick, base = air_state(y, velocity_y, jump)
+    return np.where(base > 0, jump.landing_table[base] - tick, 0)
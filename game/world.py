@@ -0,0 +1,63 @@
+"""
+Retrato do mundo em um tick
+
+Os obstáculos são os mesmos para todos os agentes: o próximo obstáculo,
+a velocidade e as hitboxes são calculados uma vez por tick e reutilizados
+pelos sensores e pelo teste de colisão de todos os porquinhos.
+"""
+from itertools import islice
+import numpy as np
+
+
+def _pixels(values):
+    """Coordenadas como o pygame.Rect as guarda (inteiros, truncados para zero)"""
+    return np.trunc(np.asarray(values, dtype=np.float64))
+
+
+class WorldSnapshot:
+    """Estado compartilhado dos obstáculos em um tick"""
+
+    def __init__(self, obstacles, passed, speed):
+        """
+        obstacles: obstáculos ordenados por x (GameEngine.obstacles)
+        passed: quantos do início da fila já passaram do dinossauro
+        speed: velocidade do jogo no tick
+        """
+        self.speed = speed
+        self.ahead = list(islice(obstacles, passed, None))
+        self.next_obstacle = self.ahead[0] if self.ahead else None
+
+        # Posição x exata e hitboxes (esquerda, topo, direita, base)
+        # em pixels, uma linha por obstáculo
+        self.positions = np.array([obstacle.x for obstacle in obstacles], dtype=np.float64)
+        self.hitboxes = np.empty((len(obstacles), 4))
+        if obstacles:
+            left = _pixels(self.positions)
+            top = _pixels([obstacle.y for obstacle in obstacles])
+            width = _pixels([obstacle.width for obstacle in obstacles])
+            height = _pixels([obstacle.height for obstacle in obstacles])
+            self.hitboxes = np.column_stack([left, top, left + width, top + height])
+
+    def next_obstacles(self, count):
+        """Até count obstáculos à frente, do mais próximo ao mais distante"""
+        return self.ahead[:count]
+
+    def collisions(self, x, y, width, height):
+        """
+        Colisão de vários porquinhos de uma vez (mesma regra de colliderect)
+        Só os obstáculos na faixa horizontal ocupada pelos porquinhos são testados
+        retorna: array booleano, um por porquinho
+        """
+        left, top = _pixels(x), _pixels(y)
+        right, bottom = left + _pixels(width), top + _pixels(height)
+        if len(left) == 0:
+            return np.zeros(0, dtype=bool)
+
+        band = self.hitboxes[(self.hitboxes[:, 2] > left.min()) &
+                             (self.hitboxes[:, 0] < right.max())]
+        if len(band) == 0:
+            return np.zeros(len(left), dtype=bool)
+
+        hits = ((left[:, None] < band[:, 2]) & (right[:, None] > band[:, 0]) &
+                (top[:, None] < band[:, 3]) & (bottom[:, None] > band[:, 1]))
+        return hits.any(axis=1)
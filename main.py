@@ -1,22 +1,24 @@
 """Sistema completo com interface gráfica - ajustado"""
 import pygame
 import sys
-import numpy as np
 from game.config import *
-from game.engine import GameEngine
-from game.renderer import Renderer
-from ai.evolutionary_algorithm import EvolutionaryAlgorithm
 from ai.session_manager import SessionManager
-from ai.neural_network import NeuralNetwork
-from ai.population import Agent
-from ui.gui_components import Button, ScrollableList, InfoBox
+from ui.gui_components import Button, ScrollableList, Label, MenuCanvas, vertical_gradient
+
+# Tempo que show_message fica na tela (ms)
+MESSAGE_DURATION = 3000
+
+# Sessões do topo da lista pré-carregadas enquanto o menu está aberto
+PREFETCH_SESSIONS = 3
 
 
 class DinoAIApp:
     """Aplicação principal com interface gráfica"""
     
     def __init__(self):
-        pygame.init()
+        # Só vídeo e fontes: pygame.init() abriria também áudio e joystick, sem uso
+        pygame.display.init()
+        pygame.font.init()
         
         # Configuração de tela
         self.screen_info = pygame.display.Info()
@@ -26,6 +28,8 @@ class DinoAIApp:
         pygame.display.set_caption("DINO AI - Evolutionary Algorithm")
         
         self.clock = pygame.time.Clock()
+        # Fundo dos menus, desenhado uma vez por resolução
+        self.background = None
         self.session_manager = SessionManager(sessions_dir="sessions")
         
         # Fontes
@@ -40,16 +44,21 @@ class DinoAIApp:
             self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
         else:
             self.screen = pygame.display.set_mode(self.windowed_size)
-            
+        
+        # Nova resolução: o fundo guardado não serve mais
+        self.background = None
         return self.screen.get_size()
         
+    def get_background(self, size=None):
+        """Fundo gradiente na resolução pedida (padrão: a da tela), em cache"""
+        size = size or self.screen.get_size()
+        if self.background is None or self.background.get_size() != size:
+            self.background = vertical_gradient(size)
+        return self.background
+        
     def draw_background(self):
         """Desenha fundo gradiente"""
-        width, height = self.screen.get_size()
-        for y in range(height):
-            color_value = int(20 + (y / height) * 50)
-            pygame.draw.line(self.screen, (color_value, color_value, color_value + 20), 
-                           (0, y), (width, y))
+        self.screen.blit(self.get_background(), (0, 0))
     
     def main_menu(self):
         """Menu principal"""
@@ -70,9 +79,8 @@ class DinoAIApp:
         quit_button = Button(button_x, start_y + 270, button_width, button_height,
                             "SAIR", (200, 50, 50), (230, 70, 70))
         
-        running = True
-        while running:
-            self.draw_background()
+        def draw_static(surface):
+            width, height = surface.get_size()
             
             # Título SEM ícone
             title = self.title_font.render("DINO AI", True, (255, 255, 255))
@@ -81,14 +89,28 @@ class DinoAIApp:
             title_rect = title.get_rect(center=(width // 2, 120))
             subtitle_rect = subtitle.get_rect(center=(width // 2, 190))
             
-            self.screen.blit(title, title_rect)
-            self.screen.blit(subtitle, subtitle_rect)
+            surface.blit(title, title_rect)
+            surface.blit(subtitle, subtitle_rect)
             
+            # Instruções
+            instructions = self.subtitle_font.render("Pressione F11 para alternar tela cheia", 
+                                                     True, (150, 150, 150))
+            inst_rect = instructions.get_rect(center=(width // 2, height - 50))
+            surface.blit(instructions, inst_rect)
+        
+        canvas = MenuCanvas(self.get_background, draw_static)
+        
+        running = True
+        while running:
             # Atualiza texto do botão fullscreen
             fullscreen_button.text = f"TELA CHEIA: {'ON' if self.fullscreen else 'OFF'}"
             
-            # Eventos
-            for event in pygame.event.get():
+            # Desenha só os botões que mudaram
+            canvas.render(self.screen, [train_button, watch_button, fullscreen_button, quit_button])
+            self.clock.tick(60)
+            
+            # Eventos (bloqueia até o próximo: menu parado não gasta CPU)
+            for event in canvas.wait_events():
                 if event.type == pygame.QUIT:
                     return "quit"
                     
@@ -120,21 +142,6 @@ class DinoAIApp:
                     quit_button.rect.x = button_x
                 if quit_button.handle_event(event):
                     return "quit"
-            
-            # Desenha botões
-            train_button.draw(self.screen)
-            watch_button.draw(self.screen)
-            fullscreen_button.draw(self.screen)
-            quit_button.draw(self.screen)
-            
-            # Instruções
-            instructions = self.subtitle_font.render("Pressione F11 para alternar tela cheia", 
-                                                     True, (150, 150, 150))
-            inst_rect = instructions.get_rect(center=(width // 2, height - 50))
-            self.screen.blit(instructions, inst_rect)
-            
-            pygame.display.flip()
-            self.clock.tick(60)
         
         return "quit"
     
@@ -143,6 +150,7 @@ class DinoAIApp:
         width, height = self.screen.get_size()
         
         sessions = self.session_manager.list_all_sessions()
+        self.session_manager.prefetch_models(sessions.ids[:PREFETCH_SESSIONS])
         
         # Botões ABAIXO da lista com espaço
         button_y = height - 80
@@ -165,38 +173,41 @@ class DinoAIApp:
         if sessions:
             session_list = ScrollableList(50, 230, width - 100, list_height, sessions, selected_session_id)
         
-        running = True
-        while running:
-            self.draw_background()
-            
+        def draw_static(surface):
             # Título
             title = self.title_font.render("Selecionar Modelo", True, (255, 255, 255))
             title_rect = title.get_rect(center=(width // 2, 80))
-            self.screen.blit(title, title_rect)
-            
+            surface.blit(title, title_rect)
+        
+        canvas = MenuCanvas(self.get_background, draw_static)
+        info_label = Label(self.subtitle_font, (200, 200, 200), (width // 2, 160))
+        no_sessions_label = Label(self.subtitle_font, (200, 200, 100), (width // 2, height // 2),
+                                  "Nenhuma sessao encontrada - Inicie do zero!")
+        
+        running = True
+        while running:
             # Informações
             if sessions:
                 info_text = f"{len(sessions)} sessoes ordenadas por fitness"
                 if selected_session_id:
-                    selected_data = next((s for s in sessions if s['id'] == selected_session_id), None)
+                    selected_data = sessions.find(selected_session_id)
                     if selected_data:
                         info_text = f"SELECIONADA: Fitness {selected_data['best_fitness']:.0f}"
                 else:
                     info_text = "Clique em uma sessao para selecionar"
-                    
-                info_surface = self.subtitle_font.render(info_text, True, (200, 200, 200))
-                info_rect = info_surface.get_rect(center=(width // 2, 160))
-                self.screen.blit(info_surface, info_rect)
+                info_label.set_text(info_text)
                 
-                session_list.draw(self.screen)
+                widgets = [info_label, session_list, new_train_button,
+                           start_selected_button, delete_button, back_button]
             else:
-                no_sessions = self.subtitle_font.render("Nenhuma sessao encontrada - Inicie do zero!", 
-                                                        True, (200, 200, 100))
-                no_rect = no_sessions.get_rect(center=(width // 2, height // 2))
-                self.screen.blit(no_sessions, no_rect)
+                widgets = [no_sessions_label, new_train_button, back_button]
             
-            # Eventos
-            for event in pygame.event.get():
+            # Desenha só o que mudou
+            canvas.render(self.screen, widgets)
+            self.clock.tick(60)
+            
+            # Eventos (bloqueia até o próximo: menu parado não gasta CPU)
+            for event in canvas.wait_events():
                 if event.type == pygame.QUIT:
                     return None, None
                     
@@ -230,9 +241,13 @@ class DinoAIApp:
                         pass
                 
                 if delete_button.handle_event(event) and selected_session_id:
-                    if self.confirm_dialog("Apagar sessao?", selected_session_id[:30]):
+                    confirmed = self.confirm_dialog("Apagar sessao?", selected_session_id[:30])
+                    # O diálogo desenhou por cima do menu
+                    canvas.invalidate()
+                    if confirmed:
                         self.session_manager.delete_session(selected_session_id)
                         sessions = self.session_manager.list_all_sessions()
+                        self.session_manager.prefetch_models(sessions.ids[:PREFETCH_SESSIONS])
                         selected_session_id = None
                         
                         if sessions:
@@ -251,18 +266,9 @@ class DinoAIApp:
                             selected_session_id = None
                         else:
                             selected_session_id = clicked_id
+                            self.session_manager.prefetch_models([clicked_id])
                         
                         session_list.update_selection(selected_session_id)
-            
-            # Desenha botões
-            new_train_button.draw(self.screen)
-            if sessions:
-                start_selected_button.draw(self.screen)
-                delete_button.draw(self.screen)
-            back_button.draw(self.screen)
-            
-            pygame.display.flip()
-            self.clock.tick(60)
         
         return None, None
     
@@ -271,6 +277,7 @@ class DinoAIApp:
         width, height = self.screen.get_size()
         
         sessions = self.session_manager.list_all_sessions()
+        self.session_manager.prefetch_models(sessions.ids[:PREFETCH_SESSIONS])
         
         if not sessions:
             self.show_message("Nenhum modelo treinado!", 
@@ -294,31 +301,33 @@ class DinoAIApp:
         session_list = ScrollableList(50, 230, width - 100, list_height, 
                                      sessions, selected_session_id)
         
-        running = True
-        while running:
-            self.draw_background()
-            
+        def draw_static(surface):
             # Título
             title = self.title_font.render("Assistir IA Jogar", True, (255, 255, 255))
             title_rect = title.get_rect(center=(width // 2, 80))
-            self.screen.blit(title, title_rect)
-            
+            surface.blit(title, title_rect)
+        
+        canvas = MenuCanvas(self.get_background, draw_static)
+        info_label = Label(self.subtitle_font, (200, 200, 200), (width // 2, 160))
+        
+        running = True
+        while running:
             info_text = f"{len(sessions)} sessoes disponveis"
             if selected_session_id:
-                selected_data = next((s for s in sessions if s['id'] == selected_session_id), None)
+                selected_data = sessions.find(selected_session_id)
                 if selected_data:
                     info_text = f"SELECIONADA: Fitness {selected_data['best_fitness']:.0f}"
             else:
                 info_text = "Selecione uma sessao"
-                
-            info_surface = self.subtitle_font.render(info_text, True, (200, 200, 200))
-            info_rect = info_surface.get_rect(center=(width // 2, 160))
-            self.screen.blit(info_surface, info_rect)
+            info_label.set_text(info_text)
             
-            session_list.draw(self.screen)
+            # Desenha só o que mudou
+            canvas.render(self.screen, [info_label, session_list, start_selected_button,
+                                        delete_button, back_button])
+            self.clock.tick(60)
             
-            # Eventos
-            for event in pygame.event.get():
+            # Eventos (bloqueia até o próximo: menu parado não gasta CPU)
+            for event in canvas.wait_events():
                 if event.type == pygame.QUIT:
                     return None
                     
@@ -335,9 +344,13 @@ class DinoAIApp:
                         pass
                 
                 if delete_button.handle_event(event) and selected_session_id:
-                    if self.confirm_dialog("Apagar sessao?", selected_session_id[:30]):
+                    confirmed = self.confirm_dialog("Apagar sessao?", selected_session_id[:30])
+                    # O diálogo desenhou por cima do menu
+                    canvas.invalidate()
+                    if confirmed:
                         self.session_manager.delete_session(selected_session_id)
                         sessions = self.session_manager.list_all_sessions()
+                        self.session_manager.prefetch_models(sessions.ids[:PREFETCH_SESSIONS])
                         selected_session_id = None
                         
                         if not sessions:
@@ -357,15 +370,9 @@ class DinoAIApp:
                         selected_session_id = None
                     else:
                         selected_session_id = clicked_id
+                        self.session_manager.prefetch_models([clicked_id])
                     
                     session_list.update_selection(selected_session_id)
-            
-            start_selected_button.draw(self.screen)
-            delete_button.draw(self.screen)
-            back_button.draw(self.screen)
-            
-            pygame.display.flip()
-            self.clock.tick(60)
         
         return None
     
@@ -383,26 +390,30 @@ class DinoAIApp:
         no_button = Button(dialog_x + 350, dialog_y + 200, 200, 60,
                           "NAO", (200, 50, 50), (230, 70, 70))
         
-        running = True
-        while running:
-            self.draw_background()
-            
+        def draw_static(surface):
             # Fundo do diálogo
             dialog_rect = pygame.Rect(dialog_x, dialog_y, dialog_width, dialog_height)
-            pygame.draw.rect(self.screen, (40, 40, 60), dialog_rect, border_radius=15)
-            pygame.draw.rect(self.screen, (200, 100, 100), dialog_rect, 5, border_radius=15)
+            pygame.draw.rect(surface, (40, 40, 60), dialog_rect, border_radius=15)
+            pygame.draw.rect(surface, (200, 100, 100), dialog_rect, 5, border_radius=15)
             
             # Textos
             title_surf = self.subtitle_font.render(title, True, (255, 255, 255))
             title_rect = title_surf.get_rect(center=(width // 2, dialog_y + 70))
-            self.screen.blit(title_surf, title_rect)
+            surface.blit(title_surf, title_rect)
             
             msg_surf = pygame.font.Font(None, 28).render(message, True, (200, 200, 200))
             msg_rect = msg_surf.get_rect(center=(width // 2, dialog_y + 130))
-            self.screen.blit(msg_surf, msg_rect)
+            surface.blit(msg_surf, msg_rect)
+        
+        canvas = MenuCanvas(self.get_background, draw_static)
+        
+        running = True
+        while running:
+            canvas.render(self.screen, [yes_button, no_button])
+            self.clock.tick(60)
             
-            # Eventos
-            for event in pygame.event.get():
+            # Eventos (bloqueia até o próximo: menu parado não gasta CPU)
+            for event in canvas.wait_events():
                 if event.type == pygame.QUIT:
                     return False
                 elif event.type == pygame.KEYDOWN:
@@ -413,12 +424,6 @@ class DinoAIApp:
                     return True
                 if no_button.handle_event(event):
                     return False
-            
-            yes_button.draw(self.screen)
-            no_button.draw(self.screen)
-            
-            pygame.display.flip()
-            self.clock.tick(60)
         
         return False
     
@@ -426,30 +431,29 @@ class DinoAIApp:
         """Mostra mensagem temporária"""
         width, height = self.screen.get_size()
         
-        for _ in range(180):
-            self.draw_background()
-            
+        def draw_static(surface):
             title_surf = self.title_font.render(title, True, (255, 200, 100))
             msg_surf = self.subtitle_font.render(message, True, (200, 200, 200))
             
             title_rect = title_surf.get_rect(center=(width // 2, height // 2 - 40))
             msg_rect = msg_surf.get_rect(center=(width // 2, height // 2 + 20))
             
-            self.screen.blit(title_surf, title_rect)
-            self.screen.blit(msg_surf, msg_rect)
-            
-            pygame.display.flip()
-            self.clock.tick(60)
+            surface.blit(title_surf, title_rect)
+            surface.blit(msg_surf, msg_rect)
+        
+        # Conteúdo fixo: desenhado uma vez, depois só espera o tempo da mensagem
+        canvas = MenuCanvas(self.get_background, draw_static)
+        deadline = pygame.time.get_ticks() + MESSAGE_DURATION
+        
+        while pygame.time.get_ticks() < deadline:
+            canvas.render(self.screen, [])
             
-            for event in pygame.event.get():
+            for event in canvas.wait_events(deadline - pygame.time.get_ticks()):
                 if event.type == pygame.QUIT:
                     return
     
     def run(self):
         """Loop principal da aplicação"""
-        from training import training_mode
-        from viewing import viewing_mode
-        
         running = True
         while running:
             choice = self.main_menu()
@@ -460,13 +464,18 @@ class DinoAIApp:
             elif choice == "train":
                 model_data, start_gen = self.training_selection_menu()
                 if start_gen is not None:
+                    # Importados só quando usados: o menu abre sem carregar
+                    # rede neural, engine e renderer
+                    from training import training_mode
                     training_mode(self, model_data, start_gen)
                     
             elif choice == "watch":
                 model_data = self.viewing_selection_menu()
                 if model_data:
+                    from viewing import viewing_mode
                     viewing_mode(self, model_data)
         
+        self.session_manager.close()
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,143 @@
+"""Modo replay: rever gerações gravadas no treino headless"""
+import pygame
+from game.config import *
+from game.renderer import Renderer
+from ai.replay import Replay, ReplayPlayer
+from ui.gui_components import Button
+
+# Multiplicadores de velocidade (ticks simulados por quadro)
+PLAYBACK_SPEEDS = (1, 2, 4, 8, 16, 32, 64)
+
+# Quanto as setas andam na linha do tempo (segundos de jogo)
+SEEK_SECONDS = 2
+
+TIMELINE_HEIGHT = 14
+
+
+class Timeline:
+    """Barra de progresso clicável (arrastar = voltar/avançar no replay)"""
+
+    def __init__(self):
+        self.rect = pygame.Rect(0, 0, 0, TIMELINE_HEIGHT)
+        self.font = pygame.font.Font(None, 26)
+        self.dragging = False
+
+    def place(self, screen_width, screen_height):
+        """Posiciona acima do botão de voltar"""
+        self.rect = pygame.Rect(230, screen_height - 42, screen_width - 250, TIMELINE_HEIGHT)
+
+    def tick_at(self, x, ticks):
+        """Tick correspondente a uma posição horizontal da barra"""
+        fraction = (x - self.rect.x) / max(1, self.rect.width)
+        return int(round(min(max(fraction, 0.0), 1.0) * ticks))
+
+    def handle_event(self, event, ticks):
+        """retorna: tick escolhido pelo mouse (None se nenhum)"""
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.rect.inflate(0, 16).collidepoint(event.pos):
+                self.dragging = True
+                return self.tick_at(event.pos[0], ticks)
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            self.dragging = False
+        elif event.type == pygame.MOUSEMOTION and self.dragging:
+            return self.tick_at(event.pos[0], ticks)
+        return None
+
+    def draw(self, screen, player, speed, paused, title):
+        """Desenha barra, cursor e situação do replay"""
+        pygame.draw.rect(screen, (60, 60, 80), self.rect, border_radius=6)
+
+        progress = player.tick / max(1, player.replay.ticks)
+        filled = self.rect.copy()
+        filled.width = int(self.rect.width * progress)
+        pygame.draw.rect(screen, (100, 150, 200), filled, border_radius=6)
+        pygame.draw.rect(screen, (200, 200, 220), self.rect, 2, border_radius=6)
+
+        state = "PAUSADO" if paused else f"x{speed}"
+        text = (f"{title}  |  tick {player.tick}/{player.replay.ticks}  |  {state}  |  "
+                f"ESPAÇO pausa  ←/→ busca  ↑/↓ velocidade  PgUp/PgDn geração")
+        surface = self.font.render(text, True, (220, 220, 230))
+        screen.blit(surface, (self.rect.x, self.rect.y - 24))
+
+
+def replay_mode(app, paths, index=0):
+    """
+    Reproduz replays gravados, com avanço rápido e busca na linha do tempo
+    paths: arquivos .replay (PgUp/PgDn alterna entre eles)
+    index: arquivo inicial
+    """
+    timeline = Timeline()
+
+    screen_width, screen_height = app.screen.get_size()
+    back_button = Button(10, screen_height - 60, 200, 50,
+                         "VOLTAR", (100, 100, 100), (130, 130, 130))
+    timeline.place(screen_width, screen_height)
+
+    def open_replay(i):
+        replay = Replay.load(paths[i])
+        print(f"\n▶ Replay: {paths[i]} ({replay.size} porquinhos, {replay.ticks} ticks)")
+        player = ReplayPlayer(replay)
+        # Cada replay desenha com a configuração do seu treino (tela e chão)
+        return player, Renderer(app.screen, player.game.config)
+
+    player, renderer = open_replay(index)
+    speed_index = 0
+    paused = False
+    running = True
+
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_F11:
+                    app.toggle_fullscreen()
+                    renderer.screen = app.screen
+                    renderer.update_scale()
+                    screen_width, screen_height = app.screen.get_size()
+                    back_button.rect.y = screen_height - 60
+                    timeline.place(screen_width, screen_height)
+                elif event.key == pygame.K_SPACE:
+                    paused = not paused
+                elif event.key in (pygame.K_RIGHT, pygame.K_LEFT):
+                    # Pausado anda um tick por vez
+                    step = 1 if paused else SEEK_SECONDS * player.game.config.display.fps
+                    if event.key == pygame.K_LEFT:
+                        step = -step
+                    player.seek(player.tick + step)
+                elif event.key == pygame.K_UP:
+                    speed_index = min(speed_index + 1, len(PLAYBACK_SPEEDS) - 1)
+                elif event.key == pygame.K_DOWN:
+                    speed_index = max(speed_index - 1, 0)
+                elif event.key == pygame.K_HOME:
+                    player.seek(0)
+                elif event.key in (pygame.K_PAGEUP, pygame.K_PAGEDOWN) and len(paths) > 1:
+                    index += -1 if event.key == pygame.K_PAGEUP else 1
+                    index %= len(paths)
+                    player, renderer = open_replay(index)
+
+            tick = timeline.handle_event(event, player.replay.ticks)
+            if tick is not None:
+                player.seek(tick)
+
+            if back_button.handle_event(event):
+                running = False
+
+        # Avanço rápido: vários ticks de física por quadro, um único desenho
+        if not paused:
+            for _ in range(PLAYBACK_SPEEDS[speed_index]):
+                if not player.step():
+                    paused = True
+                    break
+
+        generation = player.replay.generation if player.replay.generation is not None else "-"
+        renderer.draw_game(player.game, player.dinos, generation, player.replay.best_fitness)
+        timeline.draw(app.screen, player, PLAYBACK_SPEEDS[speed_index], paused,
+                      f"Replay {index + 1}/{len(paths)}")
+        back_button.draw(app.screen)
+
+        pygame.display.flip()
+        # Tempo real do replay: quadros por segundo da configuração gravada
+        app.clock.tick(player.game.config.display.fps)
@@ -0,0 +1,106 @@
+"""
+Benchmark de inicialização: tempo até o primeiro quadro do menu
+
+Cada medição roda em um processo Python novo (importação a frio, como ao
+abrir o jogo). Além dos tempos, confere que treino, engine, renderer e
+rede neural continuam fora da inicialização: se algum deles passar a ser
+importado antes do menu aparecer, o benchmark falha.
+"""
+import os
+import sys
+import json
+import time
+import statistics
+import subprocess
+
+# Referência do processo filho: antes de importar pygame e o jogo
+START = time.perf_counter()
+
+# Módulos que só devem ser carregados quando o usuário escolhe treinar/assistir
+LAZY_MODULES = ('training', 'viewing', 'game.engine', 'game.renderer',
+                'ai.evolutionary_algorithm', 'ai.neural_network', 'ai.population')
+
+# Fases medidas no processo filho (ms desde START)
+PHASES = (('pygame', 'import pygame'), ('main', 'import main'),
+          ('app', 'DinoAIApp()'), ('first_frame', 'primeiro quadro'))
+
+
+def probe():
+    """
+    Processo filho: abre o app, desenha o primeiro quadro do menu e sai
+    Imprime os tempos (JSON) na última linha da saída
+    """
+    times = {}
+    import pygame
+    times['pygame'] = time.perf_counter()
+    import main
+    times['main'] = time.perf_counter()
+    app = main.DinoAIApp()
+    times['app'] = time.perf_counter()
+    # O menu desenha o primeiro quadro e só então lê o QUIT
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+    app.main_menu()
+    times['first_frame'] = time.perf_counter()
+    pygame.quit()
+
+    result = {name: (moment - START) * 1000 for name, moment in times.items()}
+    result['eager'] = [name for name in LAZY_MODULES if name in sys.modules]
+    print(json.dumps(result))
+
+
+def measure_startup(window=False):
+    """
+    Uma abertura a frio em um processo novo
+    window: usa o driver de vídeo real (padrão: sem janela)
+    retorna: tempos do filho + 'process' (ms do processo inteiro)
+    """
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    if not window:
+        env["SDL_VIDEODRIVER"] = "dummy"
+
+    root = os.path.dirname(os.path.abspath(__file__))
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), "--probe"],
+                            cwd=root, env=env, capture_output=True, text=True, check=True)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    result = json.loads(output.stdout.strip().splitlines()[-1])
+    result['process'] = elapsed
+    return result
+
+
+def run_startup_benchmark(runs=5, budget=None, window=False):
+    """
+    Mede várias aberturas e compara com o orçamento
+    budget: limite (ms) para a mediana do primeiro quadro (None = sem limite)
+    retorna: True se passou (orçamento e importações preguiçosas)
+    """
+    print(f"\n⏱ Inicialização: {runs} aberturas a frio (tempo acumulado)")
+    results = [measure_startup(window) for _ in range(max(1, runs))]
+
+    for name, label in PHASES + (('process', 'processo inteiro'),):
+        values = [result[name] for result in results]
+        print(f"   {label:<18} mediana {statistics.median(values):7.1f} ms "
+              f"(mín {min(values):.1f}, máx {max(values):.1f})")
+
+    passed = True
+    eager = sorted({name for result in results for name in result['eager']})
+    if eager:
+        print(f"❌ Importados antes do menu: {', '.join(eager)}")
+        passed = False
+
+    first_frame = statistics.median(result['first_frame'] for result in results)
+    if budget is not None and first_frame > budget:
+        print(f"❌ Primeiro quadro em {first_frame:.0f} ms (orçamento: {budget:.0f} ms)")
+        passed = False
+
+    if passed:
+        print("✓ Inicialização dentro do esperado")
+    return passed
+
+
+if __name__ == "__main__":
+    if "--probe" in sys.argv[1:]:
+        probe()
+    else:
+        sys.exit(0 if run_startup_benchmark() else 1)
@@ -1,109 +1,46 @@
 """Modo de treinamento com botões de controle"""
 import pygame
-import numpy as np
 from game.config import *
 from game.engine import GameEngine
 from game.renderer import Renderer
-from ai.evolutionary_algorithm import EvolutionaryAlgorithm
+from game.sensors import DEFAULT_FEATURE_SET, get_feature_set
+from ai.evolutionary_algorithm import EvolutionaryAlgorithm, TRAINING_HYPERPARAMETERS
 from ai.neural_network import NeuralNetwork
-from ai.population import Agent
+from ai.simulation import randomize_agent_positions, step_population
 from ui.gui_components import Button
 
 
-def get_game_state(dino, game):
-    """Extrai estado do jogo COM MAIS INFORMAÇÕES"""
-    obstacle = game.get_next_obstacle()
-    
-    if obstacle is None:
-        return [1.0, 1.0, 1.0, 0.0, 0.0, 1.0]
-    
-    distance = (obstacle.x - dino.x) / SCREEN_WIDTH
-    obstacle_height = obstacle.height / 100.0
-    obstacle_width = obstacle.width / 100.0
-    dino_y = dino.y / SCREEN_HEIGHT
-    dino_velocity = (dino.velocity_y + 20) / 40.0
-    
-    # Está no chão? (velocidade = 0 significa no chão)
-    on_ground = 1.0 if dino.velocity_y == 0 else 0.0
-    
-    return [distance, obstacle_height, obstacle_width, dino_y, dino_velocity, on_ground]
-
-
 def load_population_from_model(ea, model_data):
-    """Carrega população COM CONSERVAÇÃO DO COMPORTAMENTO"""
-    best_brain = NeuralNetwork(ea.input_size, ea.hidden_size, ea.output_size)
-    best_brain.set_weights(model_data['weights'])
-    
-    new_agents = []
-    
-    # 1 cópia EXATA
-    new_agents.append(Agent(best_brain.copy()))
-    
-    # 60% da população: Mutação MUITO LEVE (conserva comportamento)
-    num_conservative = int(ea.population_size * 0.6)
-    for _ in range(num_conservative):
-        mutated_brain = best_brain.copy()
-        weights = mutated_brain.get_weights()
-        
-        # 10% genes, força 0.15
-        mutation_mask = np.random.rand(len(weights)) < 0.1
-        mutations = np.random.randn(len(weights)) * 0.15
-        weights += mutation_mask * mutations
-        
-        mutated_brain.set_weights(weights)
-        new_agents.append(Agent(mutated_brain))
-    
-    # 25% Mutação MODERADA
-    num_moderate = int(ea.population_size * 0.25)
-    for _ in range(num_moderate):
-        if len(new_agents) >= ea.population_size:
-            break
-        mutated_brain = best_brain.copy()
-        weights = mutated_brain.get_weights()
-        
-        # 25% genes, força 0.3
-        mutation_mask = np.random.rand(len(weights)) < 0.25
-        mutations = np.random.randn(len(weights)) * 0.3
-        weights += mutation_mask * mutations
-        
-        mutated_brain.set_weights(weights)
-        new_agents.append(Agent(mutated_brain))
-    
-    # 15% restante: Mutação FORTE (exploração)
-    while len(new_agents) < ea.population_size:
-        mutated_brain = best_brain.copy()
-        weights = mutated_brain.get_weights()
-        
-        # 40% genes, força 0.5
-        mutation_mask = np.random.rand(len(weights)) < 0.4
-        mutations = np.random.randn(len(weights)) * 0.5
-        weights += mutation_mask * mutations
-        
-        mutated_brain.set_weights(weights)
-        new_agents.append(Agent(mutated_brain))
-    
-    ea.population.agents = new_agents
-
-
-def randomize_agent_positions(population):
-    """Randomiza posições X dos agentes (±15 pixels para não confundir)"""
-    for agent in population.agents:
-        x_offset = np.random.uniform(-15, 15)
-        agent.dino.x = 50 + x_offset
+    """
+    Carrega população COM CONSERVAÇÃO DO COMPORTAMENTO
+    Uma cópia exata do modelo e filhos dele pelas faixas de mutação do
+    algoritmo (ea.mutation_tiers)
+    """
+    best_brain = NeuralNetwork.from_model_data(model_data, dtype=ea.dtype)
+    ea.population.agents = ea.offspring_of(best_brain)
 
 
 def training_mode(app, model_data, start_generation):
     """Executa treinamento com botões de controle"""
-    # AGORA USA 6 INPUTS (adicionou on_ground)
+    # Modelos NEAT continuam pelo modo headless (python cli.py neat)
+    if model_data and 'topology' in model_data:
+        print("\n⚠ Modelo NEAT não pode continuar neste modo, iniciando do zero")
+        model_data = None
+        start_generation = 1
+    
+    # AGORA USA 6 INPUTS (adicionou on_ground): conjunto padrão dos sensores
+    # Ao continuar um modelo, mantém a arquitetura e as entradas dele
+    # Hiperparâmetros em TRAINING_HYPERPARAMETERS (compare com python cli.py sweep)
+    spec = NeuralNetwork.from_model_data(model_data).get_spec() if model_data else {}
     ea = EvolutionaryAlgorithm(
         population_size=POPULATION_SIZE,
-        input_size=6,
-        hidden_size=10,
+        input_size=spec.get('input_size', get_feature_set(DEFAULT_FEATURE_SET).size),
         output_size=2,
-        mutation_rate=0.15,
-        mutation_strength=0.25,
-        elite_ratio=0.02,
-        start_generation=start_generation
+        start_generation=start_generation,
+        **TRAINING_HYPERPARAMETERS,
+        layers=spec.get('layers'),
+        recurrent=spec.get('recurrent', False),
+        feature_set=spec.get('feature_set')
     )
     
     if model_data:
@@ -165,6 +102,7 @@ def training_mode(app, model_data, start_generation):
             # RANDOMIZA POSIÇÕES X NO INÍCIO DE CADA GERAÇÃO
             population = ea.get_current_population()
             randomize_agent_positions(population)
+            batch = population.build_batch()
             
             # Simulação da geração
             game = GameEngine()
@@ -195,19 +133,7 @@ def training_mode(app, model_data, start_generation):
                         exit_action = 'no_save'
                         running = False
                         
-                game.update()
-                
-                for agent in population.get_alive_agents():
-                    state = get_game_state(agent.dino, game)
-                    agent.think(state)
-                    agent.update()
-                    
-                    # BÔNUS: Recompensa pequena por abaixar (incentiva usar essa ação)
-                    if agent.dino.is_ducking:
-                        agent.dino.fitness += 0.05
-                    
-                    if game.check_collision(agent.dino):
-                        agent.dino.alive = False
+                step_population(population, game, batch)
                         
                 # Renderiza jogo
                 renderer.draw_game(
@@ -1,6 +1,13 @@
 """Componentes GUI para interface gráfica - simplificado"""
+from collections import OrderedDict
 import pygame
 
+# Espera máxima por eventos com o menu parado (ms): o loop dorme em vez de girar
+MENU_IDLE_TIMEOUT = 1000
+
+# Eventos em que a janela pode ter perdido o conteúdo (redesenho completo)
+REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+
 class Button:
     """Botão interativo"""
     def __init__(self, x, y, width, height, text, color=(70, 130, 180), 
@@ -34,6 +41,14 @@ class Button:
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
         
+    def visual_state(self):
+        """Tudo que muda a aparência do botão (MenuCanvas redesenha se mudar)"""
+        return (tuple(self.rect), self.text, self.current_color, self.is_hovered)
+        
+    def dirty_rect(self):
+        """Área ocupada pelo botão, incluindo a sombra"""
+        return self.rect.union(self.rect.move(4, 4))
+        
     def handle_event(self, event):
         """Verifica interação com o botão"""
         if event.type == pygame.MOUSEMOTION:
@@ -110,53 +125,107 @@ class SessionListItem:
         return False
 
 class ScrollableList:
-    """Lista scrollável de sessões com numeração"""
+    """
+    Lista scrollável de sessões com numeração (virtualizada)
+    Só as linhas visíveis são materializadas: o intervalo visível sai da
+    posição do scroll, poucos itens são reaproveitados para desenhar e cada
+    linha desenhada fica em cache até mudar de estado
+    """
+    # Linhas desenhadas guardadas (cada uma é uma Surface do tamanho do item)
+    ROW_CACHE_SIZE = 64
+    
     def __init__(self, x, y, width, height, items_data, selected_session_id=None):
+        """
+        items_data: sequência de sessões (len e índice; ex: SessionRows),
+                    lida só nas linhas que aparecem
+        """
         self.rect = pygame.Rect(x, y, width, height)
-        self.items = []
+        self.items_data = items_data
         self.scroll_offset = 0
         self.item_height = 75
         self.spacing = 10
         self.selected_session_id = selected_session_id
+        self.hovered_index = None
         
-        # Cria itens com ranking
-        for i, item_data in enumerate(items_data):
-            item_y = y + 10 + i * (self.item_height + self.spacing)
-            is_selected = (selected_session_id and item_data['id'] == selected_session_id)
-            rank = i + 1  # Ranking: 1º, 2º, 3º...
-            item = SessionListItem(x + 10, item_y, width - 20, self.item_height, 
-                                  item_data, rank, is_selected)
-            self.items.append(item)
+        # Itens reaproveitados para desenhar as linhas (um por linha visível)
+        self.pool = []
+        self.row_cache = OrderedDict()
+        
+    @property
+    def row_pitch(self):
+        return self.item_height + self.spacing
+        
+    def visible_range(self):
+        """Índices (início, fim) das linhas que aparecem com o scroll atual"""
+        first = max(0, (-self.scroll_offset - 10 - self.item_height) // self.row_pitch + 1)
+        last = (self.rect.height - self.scroll_offset - 10) // self.row_pitch + 1
+        return first, min(len(self.items_data), max(first, last))
+        
+    def index_at(self, pos):
+        """Índice da linha sob uma posição da tela (None se nenhuma)"""
+        if not self.rect.collidepoint(pos):
+            return None
+        relative_y = pos[1] - self.rect.y - self.scroll_offset - 10
+        index, inside = divmod(relative_y, self.row_pitch)
+        if relative_y < 0 or inside >= self.item_height or index >= len(self.items_data):
+            return None
+        return index
     
     def update_selection(self, selected_session_id):
         """Atualiza qual sessão está selecionada"""
         self.selected_session_id = selected_session_id
-        for item in self.items:
-            item.is_selected = (item.session_data['id'] == selected_session_id)
+        
+    def visual_state(self):
+        return (tuple(self.rect), self.scroll_offset, self.hovered_index,
+                self.selected_session_id, len(self.items_data))
+        
+    def dirty_rect(self):
+        return self.rect
+        
+    def _row_surface(self, index):
+        """Linha desenhada (do cache, ou desenhada com um item do pool)"""
+        session_data = self.items_data[index]
+        is_selected = bool(self.selected_session_id and
+                           session_data['id'] == self.selected_session_id)
+        key = (index, is_selected, index == self.hovered_index)
+        
+        surface = self.row_cache.get(key)
+        if surface is not None:
+            self.row_cache.move_to_end(key)
+            return surface
+        
+        first, last = self.visible_range()
+        while len(self.pool) <= index - first:
+            self.pool.append(SessionListItem(0, 0, self.rect.width - 20, self.item_height,
+                                             session_data, index + 1))
+        item = self.pool[index - first]
+        item.session_data = session_data
+        item.rank = index + 1  # Ranking: 1º, 2º, 3º...
+        item.is_selected = is_selected
+        item.is_hovered = key[2]
+        
+        surface = pygame.Surface(item.rect.size)
+        surface.fill((30, 30, 50))
+        item.draw(surface)
+        
+        self.row_cache[key] = surface
+        if len(self.row_cache) > self.ROW_CACHE_SIZE:
+            self.row_cache.popitem(last=False)
+        return surface
             
     def draw(self, screen):
-        """Desenha lista com scroll"""
-        # Fundo
-        pygame.draw.rect(screen, (30, 30, 50), self.rect, border_radius=10)
-        pygame.draw.rect(screen, (100, 100, 120), self.rect, 2, border_radius=10)
+        """Desenha só as linhas visíveis, recortadas pela área da lista"""
+        screen.fill((30, 30, 50), self.rect)
         
-        # Superfície para clipping
-        list_surface = pygame.Surface((self.rect.width, self.rect.height))
-        list_surface.fill((30, 30, 50))
+        previous_clip = screen.get_clip()
+        screen.set_clip(self.rect.clip(previous_clip) if previous_clip else self.rect)
         
-        # Desenha itens
-        for item in self.items:
-            adjusted_rect = item.rect.copy()
-            adjusted_rect.y = item.rect.y - self.rect.y + self.scroll_offset
-            
-            if -self.item_height < adjusted_rect.y < self.rect.height:
-                temp_item = SessionListItem(10, adjusted_rect.y, item.rect.width, 
-                                           item.rect.height, item.session_data, 
-                                           item.rank, item.is_selected)
-                temp_item.is_hovered = item.is_hovered
-                temp_item.draw(list_surface)
+        first, last = self.visible_range()
+        for index in range(first, last):
+            row_y = self.rect.y + 10 + index * self.row_pitch + self.scroll_offset
+            screen.blit(self._row_surface(index), (self.rect.x + 10, row_y))
         
-        screen.blit(list_surface, self.rect)
+        screen.set_clip(previous_clip)
         
     def handle_event(self, event):
         """Gerencia eventos da lista"""
@@ -165,21 +234,19 @@ class ScrollableList:
                 self.scroll_offset += event.y * 20
                 
                 max_scroll = 0
-                min_scroll = -(len(self.items) * (self.item_height + self.spacing) - self.rect.height + 20)
+                content_height = len(self.items_data) * self.row_pitch + 20
+                min_scroll = min(0, self.rect.height - content_height)
                 self.scroll_offset = max(min_scroll, min(max_scroll, self.scroll_offset))
+                self.hovered_index = self.index_at(pygame.mouse.get_pos())
                 
         elif event.type == pygame.MOUSEMOTION:
-            mouse_y = event.pos[1] - self.rect.y - self.scroll_offset
-            for item in self.items:
-                item_relative_y = item.rect.y - self.rect.y
-                item.is_hovered = (self.rect.collidepoint(event.pos) and 
-                                  item_relative_y <= mouse_y < item_relative_y + item.rect.height)
+            self.hovered_index = self.index_at(event.pos)
                 
         elif event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1 and self.rect.collidepoint(event.pos):
-                for item in self.items:
-                    if item.is_hovered:
-                        return item.session_data['id']
+            if event.button == 1:
+                index = self.index_at(event.pos)
+                if index is not None:
+                    return self.items_data[index]['id']
         
         return None
 
@@ -204,4 +271,132 @@ class InfoBox:
         for line in self.info_lines:
             info_surface = self.font_info.render(line, True, (200, 200, 200))
             screen.blit(info_surface, (self.rect.x + 20, self.rect.y + y_offset))
-            y_offset += 30
\ No newline at end of file
+            y_offset += 30
+
+
+class Label:
+    """Texto de uma linha centralizado (só é renderizado de novo quando muda)"""
+    def __init__(self, font, color, center, text=""):
+        self.font = font
+        self.color = color
+        self.center = center
+        self.text = None
+        self.set_text(text)
+        
+    def set_text(self, text):
+        """Troca o texto"""
+        if text != self.text:
+            self.text = text
+            self.surface = self.font.render(text, True, self.color)
+            self.rect = self.surface.get_rect(center=self.center)
+            
+    def draw(self, screen):
+        screen.blit(self.surface, self.rect)
+        
+    def visual_state(self):
+        return (self.text, tuple(self.rect))
+        
+    def dirty_rect(self):
+        return self.rect
+
+
+def vertical_gradient(size, top=20, bottom=70):
+    """Fundo degradê vertical dos menus (cinza azulado, escurece para cima)"""
+    width, height = size
+    # Uma coluna de 1 pixel esticada na horizontal (cada linha tem uma cor só)
+    column = pygame.Surface((1, height))
+    for y in range(height):
+        color_value = int(top + (y / height) * (bottom - top))
+        column.set_at((0, y), (color_value, color_value, color_value + 20))
+    return pygame.transform.scale(column, (width, height))
+
+
+class MenuCanvas:
+    """
+    Camada de desenho dos menus
+    Fundo e elementos estáticos são desenhados uma vez por tela/resolução
+    em uma Surface guardada; a cada quadro só os widgets cuja aparência
+    mudou são redesenhados (sobre um recorte da camada estática) e só
+    essas áreas são enviadas ao display. Sem mudanças, nada é desenhado,
+    e wait_events deixa o loop do menu dormindo até o próximo evento.
+    """
+    def __init__(self, background, draw_static=None):
+        """
+        background: função (tamanho) → Surface do fundo (ex: app.get_background)
+        draw_static: função (surface) que desenha o conteúdo fixo sobre o fundo
+        """
+        self.background = background
+        self.draw_static = draw_static
+        self.static = None
+        self.screen = None
+        self.base = None
+        # widget → (aparência, área) do último desenho
+        self.drawn = {}
+        
+    def invalidate(self):
+        """Força redesenho completo (conteúdo estático mudou)"""
+        self.static = None
+        
+    def wait_events(self, timeout=MENU_IDLE_TIMEOUT):
+        """
+        Bloqueia até chegar um evento (ou acabar o timeout, em ms)
+        retorna: eventos pendentes (lista vazia se o tempo acabou)
+        """
+        event = pygame.event.wait(max(1, int(timeout)))
+        if event.type == pygame.NOEVENT:
+            return []
+        
+        events = [event] + pygame.event.get()
+        if any(e.type in REDRAW_EVENTS for e in events):
+            self.invalidate()
+        return events
+        
+    def _build_static(self, base):
+        self.base = base
+        self.static = base.copy()
+        if self.draw_static is not None:
+            self.draw_static(self.static)
+            
+    def render(self, screen, widgets):
+        """
+        Desenha os widgets (na ordem dada) e atualiza o display
+        widgets: objetos com draw(screen), visual_state() e dirty_rect()
+        retorna: True se algo foi enviado ao display
+        """
+        # Fundo novo (ex: toggle_fullscreen descartou o anterior) também redesenha tudo
+        base = self.background(screen.get_size())
+        if self.static is None or base is not self.base or screen is not self.screen:
+            self._build_static(base)
+            self.screen = screen
+            screen.blit(self.static, (0, 0))
+            self.drawn = {}
+            for widget in widgets:
+                widget.draw(screen)
+                self.drawn[widget] = (widget.visual_state(), widget.dirty_rect())
+            pygame.display.flip()
+            return True
+        
+        # Áreas a limpar: widgets que mudaram (onde estavam e onde estão) e os removidos
+        dirty = []
+        for widget in widgets:
+            state = widget.visual_state()
+            previous = self.drawn.get(widget)
+            if previous is None or previous[0] != state:
+                area = widget.dirty_rect()
+                dirty.append(area.union(previous[1]) if previous else area)
+        for widget in [w for w in self.drawn if w not in widgets]:
+            dirty.append(self.drawn.pop(widget)[1])
+            
+        if not dirty:
+            return False
+        
+        for area in dirty:
+            screen.blit(self.static, area, area)
+        # Redesenha tudo que toca uma área limpa (mantém a ordem de sobreposição)
+        for widget in widgets:
+            rect = widget.dirty_rect()
+            if rect.collidelist(dirty) != -1:
+                widget.draw(screen)
+                self.drawn[widget] = (widget.visual_state(), rect)
+        pygame.display.update(dirty)
+        return True
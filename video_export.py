@@ -0,0 +1,126 @@
+"""
+Exportação de vídeo: partida de um modelo renderizada fora da tela
+
+Nada é exibido nem sincronizado com o relógio: cada tick é simulado e
+desenhado na game_surface do Renderer o mais rápido possível, e os quadros
+vão direto para arquivos PNG ou para um GIF animado (requer Pillow).
+"""
+import os
+import time
+import pygame
+from game.config import *
+from game.engine import GameEngine
+from game.renderer import Renderer
+from game.settings import GameConfig
+from ai.neural_network import load_brain
+from ai.population import Population, Agent
+from ai.simulation import step_population
+
+
+def init_offscreen():
+    """Inicializa o pygame sem janela (driver de vídeo dummy)"""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.display.init()
+    pygame.font.init()
+
+
+def render_run(model_data, max_ticks, seed=None, every=1, scale=1.0):
+    """
+    Joga uma partida do modelo e gera os quadros (Surface), sem janela
+    max_ticks: duração máxima da partida
+    seed: semente do percurso (mesma semente = mesmo vídeo)
+    every: desenha um quadro a cada quantos ticks
+    scale: escala dos quadros em relação à tela do jogo
+    """
+    brain = load_brain(model_data)
+    # Mesma física e percurso do treino (gravados no modelo)
+    config = GameConfig.from_dict(model_data.get('config'))
+    population = Population(0, brain.input_size, brain.hidden_size, brain.output_size,
+                            dtype=brain.dtype, feature_set=brain.feature_set, config=config)
+    population.agents.append(Agent(brain, config))
+    agent = population.agents[0]
+    batch = population.build_batch()
+
+    game = GameEngine(seed, config=config)
+    width, height = config.display.screen_width, config.display.screen_height
+    renderer = Renderer(pygame.Surface((width, height)), config)
+    size = (int(width * scale), int(height * scale))
+    generation = model_data.get('generation', '-')
+
+    while agent.dino.alive and game.score < max_ticks:
+        step_population(population, game, batch)
+
+        if game.score % every == 0 or not agent.dino.alive:
+            renderer.draw_game(game, [agent.dino], generation, agent.get_fitness())
+            frame = renderer.game_surface
+            if size != frame.get_size():
+                frame = pygame.transform.smoothscale(frame, size)
+            yield frame
+
+
+def save_png_frames(frames, directory):
+    """
+    Salva os quadros como frame_00001.png, frame_00002.png, ...
+    retorna: número de quadros
+    """
+    os.makedirs(directory, exist_ok=True)
+    count = 0
+    for count, frame in enumerate(frames, 1):
+        pygame.image.save(frame, os.path.join(directory, f"frame_{count:05d}.png"))
+    return count
+
+
+def save_gif(frames, path, frame_duration):
+    """
+    Salva os quadros como GIF animado em loop
+    frame_duration: duração de cada quadro (ms)
+    retorna: número de quadros
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        raise ImportError("Exportar GIF requer Pillow (pip install pillow); "
+                          "use --format png para quadros PNG") from None
+
+    images = []
+    for frame in frames:
+        image = Image.frombytes("RGB", frame.get_size(), pygame.image.tobytes(frame, "RGB"))
+        # Paleta por quadro: o GIF guarda no máximo 256 cores
+        images.append(image.quantize(colors=128))
+
+    if images:
+        images[0].save(path, save_all=True, append_images=images[1:],
+                       duration=frame_duration, loop=0, optimize=False)
+    return len(images)
+
+
+def export_video(model_data, output, fmt="gif", max_ticks=None, seed=None,
+                 every=2, scale=1.0):
+    """
+    Renderiza uma partida do modelo em output (pasta de PNGs ou arquivo .gif)
+    max_ticks: duração máxima (padrão: 30 s de jogo no fps do modelo)
+    retorna: número de quadros
+    """
+    every = max(1, every)
+    # Tempo real da partida: quadros por segundo da configuração do modelo
+    fps = GameConfig.from_dict(model_data.get('config')).display.fps
+    if max_ticks is None:
+        max_ticks = fps * 30
+    frames = render_run(model_data, max_ticks, seed, every, scale)
+
+    start = time.perf_counter()
+    if fmt == "gif":
+        count = save_gif(frames, output, round(1000 * every / fps))
+    else:
+        count = save_png_frames(frames, output)
+    elapsed = time.perf_counter() - start
+
+    ticks = count * every
+    print(f"✓ {count} quadros em {output}")
+    print(f"   {ticks} ticks em {elapsed:.1f}s "
+          f"({ticks / fps / max(elapsed, 1e-9):.1f}x tempo real)")
+    if fmt == "png":
+        print(f"   Vídeo: ffmpeg -framerate {fps // every} "
+              f"-i {os.path.join(output, 'frame_%05d.png')} demo.mp4")
+    return count
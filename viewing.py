@@ -3,32 +3,23 @@ import pygame
 from game.config import *
 from game.engine import GameEngine
 from game.dino import Dino
-from ai.neural_network import NeuralNetwork
+from game.sensors import sense
+from game.settings import DEFAULT_CONFIG, GameConfig
+from ai.neural_network import load_brain
+from ai.population import ACTION_JUMP, ACTION_DUCK
+from ai.policy_export import CompiledPolicy, scalar_features
 from ui.gui_components import Button
 
-def get_game_state(dino, game):
-    """Extrai estado do jogo"""
-    obstacle = game.get_next_obstacle()
-    
-    if obstacle is None:
-        return [1.0, 1.0, 1.0, 0.0, 0.0]
-    
-    distance = (obstacle.x - dino.x) / SCREEN_WIDTH
-    obstacle_height = obstacle.height / 100.0
-    obstacle_width = obstacle.width / 100.0
-    dino_y = dino.y / SCREEN_HEIGHT
-    dino_velocity = (dino.velocity_y + 20) / 40.0
-    
-    return [distance, obstacle_height, obstacle_width, dino_y, dino_velocity]
-
 class ViewingRenderer:
     """Renderizador para modo visualização"""
-    def __init__(self, screen):
+    def __init__(self, screen, config=None):
+        """config: GameConfig (tamanho base da tela e altura do chão)"""
         self.screen = screen
         self.font = pygame.font.Font(None, 36)
+        self.config = DEFAULT_CONFIG if config is None else config
         
-        self.base_width = SCREEN_WIDTH
-        self.base_height = SCREEN_HEIGHT
+        self.base_width = self.config.display.screen_width
+        self.base_height = self.config.display.screen_height
         self.game_surface = pygame.Surface((self.base_width, self.base_height))
         
         self.update_scale()
@@ -58,8 +49,9 @@ class ViewingRenderer:
         self.screen.fill((20, 20, 35))
         self.game_surface.fill(WHITE)
         
-        pygame.draw.line(self.game_surface, BLACK, (0, GROUND_Y + 50), 
-                        (self.base_width, GROUND_Y + 50), 2)
+        ground_y = self.config.physics.ground_y + 50
+        pygame.draw.line(self.game_surface, BLACK, (0, ground_y), 
+                        (self.base_width, ground_y), 2)
         
         for obstacle in game.obstacles:
             obstacle.draw(self.game_surface)
@@ -105,16 +97,18 @@ class ViewingRenderer:
 
 def viewing_mode(app, model_data):
     """Assistir IA jogando com botão de voltar"""
-    brain = NeuralNetwork(
-        model_data['input_size'],
-        model_data['hidden_size'],
-        model_data['output_size']
-    )
-    brain.set_weights(model_data['weights'])
+    brain = load_brain(model_data)
+    
+    # Política compilada anexada (python cli.py compile --attach): sem NumPy por frame
+    policy = None
+    if 'compiled_policy' in model_data:
+        policy = CompiledPolicy.from_dict(model_data['compiled_policy'])
     
-    dino = Dino()
-    game = GameEngine()
-    renderer = ViewingRenderer(app.screen)
+    # Mesma física e percurso do treino (gravados no modelo)
+    config = GameConfig.from_dict(model_data.get('config'))
+    dino = Dino(config)
+    game = GameEngine(config=config)
+    renderer = ViewingRenderer(app.screen, config)
     
     # Botão de voltar
     screen_width, screen_height = app.screen.get_size()
@@ -142,17 +136,25 @@ def viewing_mode(app, model_data):
                 running = False
                 
         if dino.alive:
-            state = get_game_state(dino, game)
-            output = brain.forward(state)
+            # Mesma ordem do treino: o jogo anda, a rede vê o estado e age
+            game.update()
+            
+            # Mesmas entradas com que o modelo foi treinado (gravadas no arquivo)
+            if policy is not None:
+                state = scalar_features(dino, game, brain.feature_set)
+                action = policy.act(state)
+                jump, duck = action == ACTION_JUMP, action == ACTION_DUCK
+            else:
+                state = sense([dino], game, brain.feature_set)[0].tolist()
+                jump, duck = brain.decide(state)
             
-            if output[0] > 0.5:
+            if jump:
                 dino.jump()
-            elif output[1] > 0.5:
+            elif duck:
                 dino.duck()
             else:
                 dino.stand()
                 
-            game.update()
             dino.update()
             
             if game.check_collision(dino):
@@ -164,8 +166,9 @@ def viewing_mode(app, model_data):
                     best_score = game.score
         else:
             pygame.time.wait(1000)
-            dino = Dino()
+            dino = Dino(config)
             game.reset()
+            brain.reset_state()
         
         stats = {
             'score': game.score,
@@ -181,4 +184,4 @@ def viewing_mode(app, model_data):
         back_button.draw(app.screen)
         
         pygame.display.flip()
-        app.clock.tick(FPS)
+        app.clock.tick(config.display.fps)